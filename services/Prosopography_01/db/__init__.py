@@ -1,7 +1,8 @@
 # Database layer for Prosopography Tool
 from .connection import (
-    get_connection, release_connection, close_all_connections,
-    get_db_connection, reset_pool
+    get_connection, get_read_connection, release_connection,
+    close_all_connections, get_db_connection, get_db_read_connection,
+    reset_pool
 )
 from .models import (
     Person, CanonicalOrganization, CareerEvent,
@@ -17,8 +18,9 @@ from .issue_repo import IssueRepository
 
 __all__ = [
     # Connection
-    'get_connection', 'release_connection', 'close_all_connections',
-    'get_db_connection', 'reset_pool',
+    'get_connection', 'get_read_connection', 'release_connection',
+    'close_all_connections', 'get_db_connection', 'get_db_read_connection',
+    'reset_pool',
     # Models
     'Person', 'CanonicalOrganization', 'CareerEvent',
     'SourceEvidence', 'UserCorrection', 'VerificationIssue',
@@ -0,0 +1,264 @@
+"""Async repositories backed by an asyncpg pool.
+
+Optional alternative to the psycopg2 repositories for async servers:
+one event loop thread multiplexes queries on network wait instead of
+blocking an OS thread per in-flight statement. Import this module only
+where an event loop is running; it requires the optional asyncpg
+dependency and is deliberately not re-exported from the db package.
+"""
+
+import asyncio
+import json
+from typing import List, Optional
+
+import asyncpg
+
+from .connection import _DB_CONFIG
+from .models import CareerEvent, UserCorrection
+
+# Pools and their init locks are keyed by event loop: the entry points
+# in this codebase reach async code through asyncio.run() from sync
+# callers, which builds a fresh loop per call, and a pool's connections
+# are only usable from the loop that created them. Entries for closed
+# loops are pruned on the next init.
+_pools = {}
+_pool_locks = {}
+
+
+async def _setup_connection(conn):
+    """Per-connection setup: decode jsonb columns to Python values."""
+    await conn.set_type_codec(
+        'jsonb', encoder=json.dumps, decoder=json.loads, schema='pg_catalog'
+    )
+
+
+async def init_async_pool():
+    """Get or create the asyncpg pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        lock = _pool_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            pool = _pools.get(loop)
+            if pool is None:
+                for stale in [l for l in _pools if l.is_closed()]:
+                    del _pools[stale]
+                    _pool_locks.pop(stale, None)
+                pool = await asyncpg.create_pool(
+                    host=_DB_CONFIG['host'],
+                    port=_DB_CONFIG['port'],
+                    database=_DB_CONFIG['database'],
+                    user=_DB_CONFIG['user'],
+                    password=_DB_CONFIG['password'],
+                    ssl='require' if _DB_CONFIG.get('sslmode') else None,
+                    min_size=2,
+                    max_size=10,
+                    max_inactive_connection_lifetime=600,
+                    init=_setup_connection,
+                )
+                _pools[loop] = pool
+    return pool
+
+
+async def close_async_pool():
+    """Close the asyncpg pool owned by the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.pop(loop, None)
+    _pool_locks.pop(loop, None)
+    if pool is not None:
+        await pool.close()
+
+
+def _record_to_event(record) -> CareerEvent:
+    """Convert an asyncpg record to a CareerEvent object."""
+    return CareerEvent(
+        event_id=record['event_id'],
+        person_id=record['person_id'],
+        event_code=record['event_code'],
+        event_type=record['event_type'],
+        org_id=record['org_id'],
+        time_start=record['time_start'],
+        time_end=record['time_end'],
+        time_text=record['time_text'],
+        roles=record['roles'] or [],
+        locations=record['locations'] or [],
+        confidence=record['confidence'],
+        llm_status=record['llm_status'],
+        validation_status=record['validation_status'],
+        created_at=record['created_at'],
+        updated_at=record['updated_at'],
+        created_source=record['created_source'],
+    )
+
+
+def _record_to_correction(record) -> UserCorrection:
+    """Convert an asyncpg record to a UserCorrection object."""
+    return UserCorrection(
+        correction_id=record['correction_id'],
+        event_id=record['event_id'],
+        field_name=record['field_name'],
+        original_value=record['original_value'],
+        corrected_value=record['corrected_value'],
+        is_valid=record['is_valid'],
+        correction_notes=record['correction_notes'],
+        corrected_by=record['corrected_by'],
+        corrected_at=record['corrected_at'],
+    )
+
+
+class AsyncEventRepository:
+    """Async counterpart of EventRepository for the hot read/write paths."""
+
+    async def get_by_id(self, event_id: int) -> Optional[CareerEvent]:
+        """Get an event by ID."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            record = await conn.fetchrow("""
+                SELECT event_id, person_id, event_code, event_type, org_id,
+                       time_start, time_end, time_text, roles, locations,
+                       confidence, llm_status, validation_status,
+                       created_at, updated_at, created_source
+                FROM prosopography.career_events
+                WHERE event_id = $1
+            """, event_id)
+            return _record_to_event(record) if record else None
+
+    async def get_for_person(self, person_id: int,
+                             status_filter: Optional[str] = None) -> List[CareerEvent]:
+        """Get all events for a person, optionally filtered by validation status."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            records = await conn.fetch("""
+                SELECT event_id, person_id, event_code, event_type, org_id,
+                       time_start, time_end, time_text, roles, locations,
+                       confidence, llm_status, validation_status,
+                       created_at, updated_at, created_source
+                FROM prosopography.career_events
+                WHERE person_id = $1
+                  AND ($2::text IS NULL OR validation_status = $2)
+                ORDER BY time_start NULLS LAST, event_code
+            """, person_id, status_filter)
+            return [_record_to_event(record) for record in records]
+
+    async def create(self, event: CareerEvent) -> int:
+        """Create or refresh a career event. Returns the event_id."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            return await conn.fetchval("""
+                INSERT INTO prosopography.career_events
+                (person_id, event_code, event_type, org_id, time_start, time_end,
+                 time_text, roles, locations, confidence, llm_status,
+                 validation_status, created_source)
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+                ON CONFLICT (person_id, event_code) DO UPDATE
+                SET event_type = EXCLUDED.event_type, org_id = EXCLUDED.org_id,
+                    time_start = EXCLUDED.time_start, time_end = EXCLUDED.time_end,
+                    time_text = EXCLUDED.time_text, roles = EXCLUDED.roles,
+                    locations = EXCLUDED.locations, confidence = EXCLUDED.confidence,
+                    llm_status = EXCLUDED.llm_status,
+                    validation_status = EXCLUDED.validation_status,
+                    updated_at = NOW()
+                RETURNING event_id
+            """, event.person_id, event.event_code, event.event_type,
+                event.org_id, event.time_start, event.time_end, event.time_text,
+                event.roles, event.locations, event.confidence, event.llm_status,
+                event.validation_status, event.created_source)
+
+    async def update_status(self, event_id: int, validation_status: str) -> None:
+        """Update just the validation status of an event."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                UPDATE prosopography.career_events
+                SET validation_status = $1, updated_at = NOW()
+                WHERE event_id = $2
+            """, validation_status, event_id)
+
+
+class AsyncCorrectionRepository:
+    """Async counterpart of CorrectionRepository for the hot read/write paths."""
+
+    async def create_many(self, corrections: List[UserCorrection]) -> List[int]:
+        """Create multiple correction records. Returns list of correction_ids."""
+        if not corrections:
+            return []
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            records = await conn.fetch("""
+                INSERT INTO prosopography.user_corrections
+                (event_id, field_name, original_value, corrected_value,
+                 is_valid, correction_notes, corrected_by)
+                SELECT * FROM unnest($1::int[], $2::text[], $3::text[],
+                                     $4::text[], $5::bool[], $6::text[], $7::text[])
+                RETURNING correction_id
+            """,
+                [c.event_id for c in corrections],
+                [c.field_name for c in corrections],
+                [c.original_value for c in corrections],
+                [c.corrected_value for c in corrections],
+                [c.is_valid for c in corrections],
+                [c.correction_notes for c in corrections],
+                [c.corrected_by for c in corrections])
+            return [record['correction_id'] for record in records]
+
+    async def get_for_event(self, event_id: int) -> List[UserCorrection]:
+        """Get all corrections for a specific event."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            records = await conn.fetch("""
+                SELECT correction_id, event_id, field_name, original_value, corrected_value,
+                       is_valid, correction_notes, corrected_by, corrected_at
+                FROM prosopography.user_corrections
+                WHERE event_id = $1
+                ORDER BY corrected_at DESC
+            """, event_id)
+            return [_record_to_correction(record) for record in records]
+
+    async def get_for_person(self, person_id: int) -> List[UserCorrection]:
+        """Get all corrections for a person's events."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            records = await conn.fetch("""
+                SELECT uc.correction_id, uc.event_id, uc.field_name, uc.original_value,
+                       uc.corrected_value, uc.is_valid, uc.correction_notes,
+                       uc.corrected_by, uc.corrected_at
+                FROM prosopography.user_corrections uc
+                JOIN prosopography.career_events ce ON uc.event_id = ce.event_id
+                WHERE ce.person_id = $1
+                ORDER BY uc.corrected_at DESC
+            """, person_id)
+            return [_record_to_correction(record) for record in records]
+
+    async def count_by_field(self, person_id: int) -> dict:
+        """Get counts of corrections by field name for a person."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            records = await conn.fetch("""
+                SELECT uc.field_name,
+                       COUNT(*) as total,
+                       SUM(CASE WHEN uc.is_valid THEN 0 ELSE 1 END) as invalid_count
+                FROM prosopography.user_corrections uc
+                JOIN prosopography.career_events ce ON uc.event_id = ce.event_id
+                WHERE ce.person_id = $1
+                GROUP BY uc.field_name
+            """, person_id)
+            return {
+                record['field_name']: {
+                    'total': record['total'], 'invalid': record['invalid_count']
+                }
+                for record in records
+            }
+
+
+class AsyncPersonRepository:
+    """Async counterpart of PersonRepository for the hot write paths."""
+
+    async def update_status(self, person_id: int, status: str) -> None:
+        """Update a person's workflow status."""
+        pool = await init_async_pool()
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                UPDATE prosopography.persons
+                SET workflow_status = $1, updated_at = NOW()
+                WHERE person_id = $2
+            """, status, person_id)
@@ -0,0 +1,48 @@
+"""Small in-process TTL cache for hot repository lookups."""
+
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe mapping with per-entry expiry and a bounded size."""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = {}  # key -> (expires_at, value)
+
+    def get(self, key):
+        """Return the cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key, value):
+        """Store a value, evicting expired then oldest entries when full."""
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                now = time.monotonic()
+                self._data = {
+                    k: v for k, v in self._data.items() if v[0] >= now
+                }
+                while len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)))
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key):
+        """Drop a key if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
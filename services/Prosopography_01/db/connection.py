@@ -1,6 +1,9 @@
 """Database connection pool management for Prosopography Tool."""
 
 import os
+import re
+import threading
+import weakref
 import psycopg2
 from psycopg2 import pool
 from urllib.parse import urlparse
@@ -10,6 +13,22 @@ from contextlib import contextmanager
 load_dotenv()
 
 connection_pool = None
+_pool_lock = threading.Lock()
+
+# Set PGBOUNCER=true when DATABASE_URL points at a PgBouncer in
+# transaction-pooling mode: many app-level connections then share a few
+# server backends, so the client pool stays small and session-scoped
+# PREPAREs (which transaction pooling doesn't preserve) are skipped
+PGBOUNCER = os.getenv('PGBOUNCER', '').lower() in ('1', 'true', 'yes')
+
+# PREPARE statements registered by repo modules, run once per physical
+# connection so hot queries skip parse/plan on every call
+_session_prepares = []
+_prepared_conns = weakref.WeakSet()
+
+# Connections whose session state was mutated (GUCs, read-only mode, ...)
+# and need a DISCARD ALL before general reuse
+_dirty_conns = weakref.WeakSet()
 
 
 def parse_database_url(url: str) -> dict:
@@ -24,65 +43,170 @@ def parse_database_url(url: str) -> dict:
     }
 
 
-def init_connection_pool():
-    """Initialize the database connection pool.
+def _build_db_config() -> dict:
+    """Resolve connection settings from the environment once at import.
 
     Supports both:
     - DATABASE_URL (for cloud deployments like Render/Supabase)
     - Individual DB_HOST, DB_PORT, DB_NAME, DB_USER, DB_PASSWORD env vars
     """
+    # Check for DATABASE_URL first (cloud deployment)
+    database_url = os.getenv('DATABASE_URL')
+
+    if database_url:
+        # Render uses 'postgres://' but psycopg2 needs 'postgresql://'
+        # Also add sslmode for cloud databases
+        params = parse_database_url(database_url)
+        return {
+            'minconn': 1,
+            # Smaller pool for cloud (free tier limits); smaller still
+            # behind PgBouncer, which multiplexes server connections
+            'maxconn': 5 if PGBOUNCER else 10,
+            'host': params['host'],
+            'port': params['port'],
+            'database': params['database'],
+            'user': params['user'],
+            'password': params['password'],
+            'sslmode': 'require',  # Required for most cloud databases
+        }
+
+    # Fall back to individual env vars (local development)
+    return {
+        'minconn': 1,
+        'maxconn': 5 if PGBOUNCER else 20,
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': os.getenv('DB_PORT', '5432'),
+        'database': os.getenv('DB_NAME', 'eliteresearch'),
+        'user': os.getenv('DB_USER', 'postgres'),
+        'password': os.getenv('DB_PASSWORD'),
+    }
+
+
+_DB_CONFIG = _build_db_config()
+
+
+def init_connection_pool():
+    """Initialize the database connection pool from the cached config."""
     global connection_pool
     if connection_pool is None:
-        # Check for DATABASE_URL first (cloud deployment)
-        database_url = os.getenv('DATABASE_URL')
-
-        if database_url:
-            # Parse the URL and create connection
-            params = parse_database_url(database_url)
-
-            # Render uses 'postgres://' but psycopg2 needs 'postgresql://'
-            # Also add sslmode for cloud databases
-            connection_pool = psycopg2.pool.SimpleConnectionPool(
-                1, 10,  # Smaller pool for cloud (free tier limits)
-                host=params['host'],
-                port=params['port'],
-                database=params['database'],
-                user=params['user'],
-                password=params['password'],
-                sslmode='require'  # Required for most cloud databases
-            )
-        else:
-            # Fall back to individual env vars (local development)
-            connection_pool = psycopg2.pool.SimpleConnectionPool(
-                1, 20,
-                host=os.getenv('DB_HOST', 'localhost'),
-                port=os.getenv('DB_PORT', '5432'),
-                database=os.getenv('DB_NAME', 'eliteresearch'),
-                user=os.getenv('DB_USER', 'postgres'),
-                password=os.getenv('DB_PASSWORD')
-            )
+        with _pool_lock:
+            # Re-check inside the lock so two threads racing on first call
+            # don't each build a pool
+            if connection_pool is None:
+                connection_pool = psycopg2.pool.ThreadedConnectionPool(**_DB_CONFIG)
     return connection_pool
 
 
+def register_session_prepare(sql: str):
+    """Register a PREPARE statement to run once on each pooled connection."""
+    _session_prepares.append(sql)
+
+
+def prepare_or_inline(name: str, sql: str) -> str:
+    """Register `sql` (with $N placeholders) as a named PREPARE.
+
+    Returns the statement callers should execute: 'EXECUTE name(%s, ...)'
+    normally, or `sql` with placeholders rewritten to %s when PgBouncer
+    transaction pooling is active and session PREPAREs don't survive.
+    """
+    register_session_prepare(f"PREPARE {name} AS {sql}")
+    if PGBOUNCER:
+        return re.sub(r'\$\d+', '%s', sql)
+    nparams = len(set(re.findall(r'\$\d+', sql)))
+    return f"EXECUTE {name}({', '.join(['%s'] * nparams)})"
+
+
+def _prepare_session(conn):
+    """Run registered PREPARE statements on a freshly acquired connection.
+
+    A failed PREPARE is fatal for the session: every repo statement
+    baked as 'EXECUTE name(...)' would fail later with a misleading
+    "prepared statement does not exist". Surface the real error here
+    instead of letting callers debug the downstream noise.
+    """
+    try:
+        with conn.cursor() as cur:
+            for sql in _session_prepares:
+                cur.execute(sql)
+        conn.commit()
+        _prepared_conns.add(conn)
+    except Exception as e:
+        conn.rollback()
+        print(f"Session PREPARE failed: {e}")
+        raise
+
+
 def get_connection():
     """Get a connection from the pool."""
-    p = init_connection_pool()
-    return p.getconn()
+    # Read the module global directly in the steady state; fall back to
+    # lazy init only on first use
+    p = connection_pool or init_connection_pool()
+    conn = p.getconn()
+    if _session_prepares and not PGBOUNCER and conn not in _prepared_conns:
+        try:
+            _prepare_session(conn)
+        except Exception:
+            # Don't leak the slot; the pool replaces the backend on the
+            # next getconn
+            p.putconn(conn, close=True)
+            raise
+    return conn
+
+
+def get_read_connection():
+    """Get a connection configured for autocommit, read-only work.
+
+    Skips the implicit BEGIN/COMMIT pair that psycopg2 wraps around
+    every statement, which pure SELECT paths don't need.
+    """
+    conn = get_connection()
+    conn.set_session(readonly=True, autocommit=True)
+    return conn
+
+
+def mark_session_dirty(conn):
+    """Flag a connection so its session state is reset when released."""
+    _dirty_conns.add(conn)
 
 
 def release_connection(conn):
-    """Return a connection to the pool."""
-    if conn is None:
-        return
+    """Return a connection to the pool.
+
+    Broken connections are handed back with close=True so the pool's
+    slot accounting stays correct and a fresh backend replaces them on
+    the next getconn, rather than leaving a phantom used slot.
+    """
+    p = connection_pool or init_connection_pool()
     try:
-        p = init_connection_pool()
+        if conn.closed:
+            p.putconn(conn, close=True)
+            return
+        if conn in _dirty_conns:
+            # A caller mutated arbitrary session state: wipe it.
+            # DISCARD ALL refuses to run in a read-only session, so lift
+            # that first; autocommit keeps it outside a transaction block
+            conn.set_session(readonly=False, autocommit=True)
+            with conn.cursor() as cur:
+                cur.execute("DISCARD ALL")
+            conn.set_session(readonly=False, autocommit=False)
+            # DISCARD ALL deallocated the session PREPAREs too
+            _prepared_conns.discard(conn)
+            _dirty_conns.discard(conn)
+        elif conn.autocommit or conn.readonly:
+            # Known read-path tweaks are undone in place; no DISCARD
+            # round-trip on this fast path
+            conn.set_session(readonly=False, autocommit=False)
         p.putconn(conn)
     except Exception:
-        # If pool is closed or connection is bad, just close it
+        # Reset or putconn failed: let the pool tear the backend down
+        # and free the slot
         try:
-            conn.close()
+            p.putconn(conn, close=True)
         except Exception:
-            pass
+            try:
+                conn.close()
+            except Exception:
+                pass
 
 
 @contextmanager
@@ -97,6 +221,18 @@ def get_db_connection():
             release_connection(conn)
 
 
+@contextmanager
+def get_db_read_connection():
+    """Context manager for read-only autocommit connections."""
+    conn = None
+    try:
+        conn = get_read_connection()
+        yield conn
+    finally:
+        if conn:
+            release_connection(conn)
+
+
 def close_all_connections():
     """Close all connections in the pool."""
     global connection_pool
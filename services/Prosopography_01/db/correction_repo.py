@@ -2,18 +2,40 @@
 
 from typing import List, Optional
 
-from .connection import get_connection, release_connection
+from psycopg2.extras import NamedTupleCursor, execute_values
+
+from .cache import TTLCache
+from .connection import get_db_connection, get_db_read_connection, prepare_or_inline
 from .models import UserCorrection
 
+# Short-lived cache for repeated single-correction lookups within a session
+_correction_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Prepared once per pooled connection so these hot lookups skip parse/plan
+_CORR_FOR_EVENT = prepare_or_inline("corr_for_event", """
+    SELECT correction_id, event_id, field_name, original_value, corrected_value,
+           is_valid, correction_notes, corrected_by, corrected_at
+    FROM prosopography.user_corrections
+    WHERE event_id = $1
+    ORDER BY corrected_at DESC
+""")
+_CORR_FOR_EVENT_FIELD = prepare_or_inline("corr_for_event_field", """
+    SELECT correction_id, event_id, field_name, original_value, corrected_value,
+           is_valid, correction_notes, corrected_by, corrected_at
+    FROM prosopography.user_corrections
+    WHERE event_id = $1 AND field_name = $2
+    ORDER BY corrected_at DESC
+    LIMIT 1
+""")
+
 
 class CorrectionRepository:
     """Repository for managing UserCorrection records."""
 
     def create(self, correction: UserCorrection) -> int:
         """Create a new correction record. Returns the correction_id."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_connection() as conn:
+            with conn, conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     INSERT INTO prosopography.user_corrections
                     (event_id, field_name, original_value, corrected_value,
@@ -26,42 +48,36 @@ class CorrectionRepository:
                     correction.corrected_by
                 ))
                 correction_id = cur.fetchone()[0]
-                conn.commit()
                 return correction_id
-        finally:
-            release_connection(conn)
 
     def create_many(self, corrections: List[UserCorrection]) -> List[int]:
         """Create multiple correction records. Returns list of correction_ids."""
         if not corrections:
             return []
-        conn = get_connection()
-        try:
-            correction_ids = []
-            with conn.cursor() as cur:
-                for correction in corrections:
-                    cur.execute("""
-                        INSERT INTO prosopography.user_corrections
-                        (event_id, field_name, original_value, corrected_value,
-                         is_valid, correction_notes, corrected_by)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        RETURNING correction_id
-                    """, (
-                        correction.event_id, correction.field_name, correction.original_value,
-                        correction.corrected_value, correction.is_valid, correction.correction_notes,
-                        correction.corrected_by
-                    ))
-                    correction_ids.append(cur.fetchone()[0])
-                conn.commit()
-            return correction_ids
-        finally:
-            release_connection(conn)
+        with get_db_connection() as conn:
+            rows = [
+                (correction.event_id, correction.field_name, correction.original_value,
+                 correction.corrected_value, correction.is_valid, correction.correction_notes,
+                 correction.corrected_by)
+                for correction in corrections
+            ]
+            with conn, conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                result = execute_values(cur, """
+                    INSERT INTO prosopography.user_corrections
+                    (event_id, field_name, original_value, corrected_value,
+                     is_valid, correction_notes, corrected_by)
+                    VALUES %s
+                    RETURNING correction_id
+                """, rows, fetch=True)
+            return [row[0] for row in result]
 
     def get_by_id(self, correction_id: int) -> Optional[UserCorrection]:
         """Get a correction by ID."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        cached = _correction_cache.get(correction_id)
+        if cached is not None:
+            return cached
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     SELECT correction_id, event_id, field_name, original_value, corrected_value,
                            is_valid, correction_notes, corrected_by, corrected_at
@@ -70,53 +86,33 @@ class CorrectionRepository:
                 """, (correction_id,))
                 row = cur.fetchone()
                 if row:
-                    return self._row_to_correction(row)
+                    correction = self._row_to_correction(row)
+                    _correction_cache.set(correction_id, correction)
+                    return correction
                 return None
-        finally:
-            release_connection(conn)
 
     def get_for_event(self, event_id: int) -> List[UserCorrection]:
         """Get all corrections for a specific event."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT correction_id, event_id, field_name, original_value, corrected_value,
-                           is_valid, correction_notes, corrected_by, corrected_at
-                    FROM prosopography.user_corrections
-                    WHERE event_id = %s
-                    ORDER BY corrected_at DESC
-                """, (event_id,))
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute(_CORR_FOR_EVENT, (event_id,))
                 rows = cur.fetchall()
                 return [self._row_to_correction(row) for row in rows]
-        finally:
-            release_connection(conn)
 
     def get_for_event_and_field(self, event_id: int, field_name: str) -> Optional[UserCorrection]:
         """Get the most recent correction for a specific event and field."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT correction_id, event_id, field_name, original_value, corrected_value,
-                           is_valid, correction_notes, corrected_by, corrected_at
-                    FROM prosopography.user_corrections
-                    WHERE event_id = %s AND field_name = %s
-                    ORDER BY corrected_at DESC
-                    LIMIT 1
-                """, (event_id, field_name))
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute(_CORR_FOR_EVENT_FIELD, (event_id, field_name))
                 row = cur.fetchone()
                 if row:
                     return self._row_to_correction(row)
                 return None
-        finally:
-            release_connection(conn)
 
     def get_for_person(self, person_id: int) -> List[UserCorrection]:
         """Get all corrections for a person's events."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     SELECT uc.correction_id, uc.event_id, uc.field_name, uc.original_value,
                            uc.corrected_value, uc.is_valid, uc.correction_notes,
@@ -128,14 +124,11 @@ class CorrectionRepository:
                 """, (person_id,))
                 rows = cur.fetchall()
                 return [self._row_to_correction(row) for row in rows]
-        finally:
-            release_connection(conn)
 
     def get_invalid_corrections(self, person_id: int) -> List[UserCorrection]:
         """Get all corrections where the original value was marked invalid."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     SELECT uc.correction_id, uc.event_id, uc.field_name, uc.original_value,
                            uc.corrected_value, uc.is_valid, uc.correction_notes,
@@ -147,14 +140,11 @@ class CorrectionRepository:
                 """, (person_id,))
                 rows = cur.fetchall()
                 return [self._row_to_correction(row) for row in rows]
-        finally:
-            release_connection(conn)
 
     def count_by_field(self, person_id: int) -> dict:
         """Get counts of corrections by field name for a person."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     SELECT uc.field_name,
                            COUNT(*) as total,
@@ -169,45 +159,50 @@ class CorrectionRepository:
                     row[0]: {'total': row[1], 'invalid': row[2]}
                     for row in rows
                 }
-        finally:
-            release_connection(conn)
 
     def delete(self, correction_id: int) -> None:
         """Delete a correction record."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_connection() as conn:
+            with conn, conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     DELETE FROM prosopography.user_corrections
                     WHERE correction_id = %s
                 """, (correction_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                _correction_cache.pop(correction_id)
 
     def delete_for_event(self, event_id: int) -> None:
         """Delete all corrections for an event."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_connection() as conn:
+            with conn, conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     DELETE FROM prosopography.user_corrections
                     WHERE event_id = %s
                 """, (event_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                # Cached corrections aren't keyed by event, so drop everything
+                _correction_cache.clear()
+
+    def delete_for_events(self, event_ids: List[int]) -> None:
+        """Delete all corrections for multiple events in a single statement."""
+        if not event_ids:
+            return
+        with get_db_connection() as conn:
+            with conn, conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute("""
+                    DELETE FROM prosopography.user_corrections
+                    WHERE event_id = ANY(%s)
+                """, (event_ids,))
+                _correction_cache.clear()
 
     def _row_to_correction(self, row) -> UserCorrection:
         """Convert a database row to a UserCorrection object."""
         return UserCorrection(
-            correction_id=row[0],
-            event_id=row[1],
-            field_name=row[2],
-            original_value=row[3],
-            corrected_value=row[4],
-            is_valid=row[5],
-            correction_notes=row[6],
-            corrected_by=row[7],
-            corrected_at=row[8]
+            correction_id=row.correction_id,
+            event_id=row.event_id,
+            field_name=row.field_name,
+            original_value=row.original_value,
+            corrected_value=row.corrected_value,
+            is_valid=row.is_valid,
+            correction_notes=row.correction_notes,
+            corrected_by=row.corrected_by,
+            corrected_at=row.corrected_at
         )
@@ -1,159 +1,280 @@
 """Repository for CareerEvent CRUD operations."""
 
 from typing import List, Optional
-import json
 
-from .connection import get_connection, release_connection
+from psycopg2.extras import Json, NamedTupleCursor, execute_values
+
+from .cache import TTLCache
+from .connection import get_db_connection, get_db_read_connection, prepare_or_inline
 from .models import CareerEvent
+from .transaction import TransactionMixin
+
+# Short-lived cache for repeated single-event lookups within a session
+_event_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Prepared once per pooled connection so these hot lookups skip
+# parse/plan. Every event read joins the canonical org name into the
+# row: one round-trip on the connection already held, always current -
+# no process-lifetime name cache to invalidate on renames, and no
+# second pooled connection taken while the caller still holds one
+_EV_BY_ID = prepare_or_inline("ev_by_id", """
+    SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
+           ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
+           ce.confidence, ce.llm_status, ce.validation_status,
+           ce.created_at, ce.updated_at, ce.created_source,
+           co.canonical_name AS org_name
+    FROM prosopography.career_events ce
+    LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
+    WHERE ce.event_id = $1
+""")
+_EV_BY_CODE = prepare_or_inline("ev_by_code", """
+    SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
+           ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
+           ce.confidence, ce.llm_status, ce.validation_status,
+           ce.created_at, ce.updated_at, ce.created_source,
+           co.canonical_name AS org_name
+    FROM prosopography.career_events ce
+    LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
+    WHERE ce.person_id = $1 AND ce.event_code = $2
+""")
 
 
-class EventRepository:
+class EventRepository(TransactionMixin):
     """Repository for managing CareerEvent records."""
 
     def create(self, event: CareerEvent) -> int:
-        """Create a new career event. Returns the event_id."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        """Create or refresh a career event. Returns the event_id.
+
+        Upserts on the (person_id, event_code) unique constraint so
+        concurrent callers racing on the same code can't insert
+        duplicates, and callers don't need a get_by_code pre-check.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     INSERT INTO prosopography.career_events
                     (person_id, event_code, event_type, org_id, time_start, time_end,
                      time_text, roles, locations, confidence, llm_status,
                      validation_status, created_source)
                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (person_id, event_code) DO UPDATE
+                    SET event_type = EXCLUDED.event_type, org_id = EXCLUDED.org_id,
+                        time_start = EXCLUDED.time_start, time_end = EXCLUDED.time_end,
+                        time_text = EXCLUDED.time_text, roles = EXCLUDED.roles,
+                        locations = EXCLUDED.locations, confidence = EXCLUDED.confidence,
+                        llm_status = EXCLUDED.llm_status,
+                        validation_status = EXCLUDED.validation_status,
+                        updated_at = NOW()
                     RETURNING event_id
                 """, (
                     event.person_id, event.event_code, event.event_type, event.org_id,
                     event.time_start, event.time_end, event.time_text,
-                    json.dumps(event.roles), json.dumps(event.locations),
+                    Json(event.roles), Json(event.locations),
                     event.confidence, event.llm_status, event.validation_status,
                     event.created_source
                 ))
                 event_id = cur.fetchone()[0]
-                conn.commit()
+                _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
                 return event_id
-        finally:
-            release_connection(conn)
 
-    def get_by_id(self, event_id: int) -> Optional[CareerEvent]:
-        """Get an event by ID."""
-        conn = get_connection()
-        try:
+    def create_many(self, events: List[CareerEvent]) -> List[int]:
+        """Create or refresh many events in one statement.
+
+        Same upsert semantics as create; returns event_ids in input
+        order.
+        """
+        if not events:
+            return []
+        rows = [
+            (event.person_id, event.event_code, event.event_type, event.org_id,
+             event.time_start, event.time_end, event.time_text,
+             Json(event.roles), Json(event.locations),
+             event.confidence, event.llm_status, event.validation_status,
+             event.created_source)
+            for event in events
+        ]
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                result = execute_values(cur, """
+                    INSERT INTO prosopography.career_events
+                    (person_id, event_code, event_type, org_id, time_start, time_end,
+                     time_text, roles, locations, confidence, llm_status,
+                     validation_status, created_source)
+                    VALUES %s
+                    ON CONFLICT (person_id, event_code) DO UPDATE
+                    SET event_type = EXCLUDED.event_type, org_id = EXCLUDED.org_id,
+                        time_start = EXCLUDED.time_start, time_end = EXCLUDED.time_end,
+                        time_text = EXCLUDED.time_text, roles = EXCLUDED.roles,
+                        locations = EXCLUDED.locations, confidence = EXCLUDED.confidence,
+                        llm_status = EXCLUDED.llm_status,
+                        validation_status = EXCLUDED.validation_status,
+                        updated_at = NOW()
+                    RETURNING event_id
+                """, rows, page_size=500, fetch=True)
+                event_ids = [row[0] for row in result]
+                for event_id in event_ids:
+                    _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
+                return event_ids
+
+    def create_with_evidence(self, event: CareerEvent, evidence_list: list) -> tuple:
+        """Create (or refresh) an event and its evidence in one round trip.
+
+        Composes the event upsert and the evidence inserts into a single
+        CTE statement, so the common "create event, then attach evidence"
+        flow costs one query instead of two. Returns (event_id,
+        evidence_ids); evidence columns travel as parallel arrays unnested
+        server-side.
+        """
+        if not evidence_list:
+            return self.create(event), []
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
-                           ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
-                           ce.confidence, ce.llm_status, ce.validation_status,
-                           ce.created_at, ce.updated_at, ce.created_source,
-                           co.canonical_name
-                    FROM prosopography.career_events ce
-                    LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                    WHERE ce.event_id = %s
-                """, (event_id,))
+                    WITH new_evt AS (
+                        INSERT INTO prosopography.career_events
+                        (person_id, event_code, event_type, org_id, time_start, time_end,
+                         time_text, roles, locations, confidence, llm_status,
+                         validation_status, created_source)
+                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                        ON CONFLICT (person_id, event_code) DO UPDATE
+                        SET event_type = EXCLUDED.event_type, org_id = EXCLUDED.org_id,
+                            time_start = EXCLUDED.time_start, time_end = EXCLUDED.time_end,
+                            time_text = EXCLUDED.time_text, roles = EXCLUDED.roles,
+                            locations = EXCLUDED.locations, confidence = EXCLUDED.confidence,
+                            llm_status = EXCLUDED.llm_status,
+                            validation_status = EXCLUDED.validation_status,
+                            updated_at = NOW()
+                        RETURNING event_id
+                    ), new_ev AS (
+                        INSERT INTO prosopography.source_evidence
+                        (event_id, chunk_id, source_url, source_type, verbatim_quote,
+                         quote_context, evidence_type, contribution, extraction_phase, model_used)
+                        SELECT new_evt.event_id, ev.*
+                        FROM new_evt,
+                             unnest(%s::int[], %s::text[], %s::text[], %s::text[], %s::text[],
+                                    %s::text[], %s::text[], %s::text[], %s::text[])
+                             AS ev(chunk_id, source_url, source_type, verbatim_quote,
+                                   quote_context, evidence_type, contribution,
+                                   extraction_phase, model_used)
+                        RETURNING evidence_id
+                    )
+                    SELECT (SELECT event_id FROM new_evt),
+                           ARRAY(SELECT evidence_id FROM new_ev ORDER BY evidence_id)
+                """, (
+                    event.person_id, event.event_code, event.event_type, event.org_id,
+                    event.time_start, event.time_end, event.time_text,
+                    Json(event.roles), Json(event.locations),
+                    event.confidence, event.llm_status, event.validation_status,
+                    event.created_source,
+                    [e.chunk_id for e in evidence_list],
+                    [e.source_url for e in evidence_list],
+                    [e.source_type for e in evidence_list],
+                    [e.verbatim_quote for e in evidence_list],
+                    [e.quote_context for e in evidence_list],
+                    [e.evidence_type for e in evidence_list],
+                    [e.contribution for e in evidence_list],
+                    [e.extraction_phase for e in evidence_list],
+                    [e.model_used for e in evidence_list],
+                ))
+                event_id, evidence_ids = cur.fetchone()
+                _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
+                return event_id, list(evidence_ids)
+
+    def get_by_id(self, event_id: int) -> Optional[CareerEvent]:
+        """Get an event by ID."""
+        cached = _event_cache.get(event_id)
+        if cached is not None:
+            return cached
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute(_EV_BY_ID, (event_id,))
                 row = cur.fetchone()
                 if row:
-                    return self._row_to_event(row)
+                    event = self._row_to_event(row)
+                    _event_cache.set(event_id, event)
+                    return event
                 return None
-        finally:
-            release_connection(conn)
 
     def get_by_code(self, person_id: int, event_code: str) -> Optional[CareerEvent]:
         """Get an event by person_id and event_code."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute(_EV_BY_CODE, (person_id, event_code))
+                row = cur.fetchone()
+                if row:
+                    return self._row_to_event(row)
+                return None
+
+    def iter_for_person(self, person_id: int, status_filter: Optional[str] = None):
+        """Stream a person's events without buffering the full result set.
+
+        Uses a named server-side cursor so rows arrive in batches of
+        itersize instead of one fetchall; the pooled connection is held
+        until the generator is exhausted or closed.
+        """
+        with get_db_connection() as conn:
+            with conn.cursor(name=f"ev_for_person_{person_id}",
+                             cursor_factory=NamedTupleCursor) as cur:
+                cur.itersize = 500
+                # org_name rides along in the join rather than costing
+                # one extra query per distinct org while the streaming
+                # cursor already holds a connection
                 cur.execute("""
                     SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
                            ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
                            ce.confidence, ce.llm_status, ce.validation_status,
                            ce.created_at, ce.updated_at, ce.created_source,
-                           co.canonical_name
+                           co.canonical_name AS org_name
                     FROM prosopography.career_events ce
                     LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                    WHERE ce.person_id = %s AND ce.event_code = %s
-                """, (person_id, event_code))
-                row = cur.fetchone()
-                if row:
-                    return self._row_to_event(row)
-                return None
-        finally:
-            release_connection(conn)
+                    WHERE ce.person_id = %s
+                      AND (%s::text IS NULL OR ce.validation_status = %s)
+                    ORDER BY ce.time_start NULLS LAST, ce.event_code
+                """, (person_id, status_filter, status_filter))
+                for row in cur:
+                    yield self._row_to_event(row)
 
     def get_for_person(self, person_id: int, status_filter: Optional[str] = None) -> List[CareerEvent]:
         """Get all events for a person, optionally filtered by validation status."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                if status_filter:
-                    cur.execute("""
-                        SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
-                               ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
-                               ce.confidence, ce.llm_status, ce.validation_status,
-                               ce.created_at, ce.updated_at, ce.created_source,
-                               co.canonical_name
-                        FROM prosopography.career_events ce
-                        LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                        WHERE ce.person_id = %s AND ce.validation_status = %s
-                        ORDER BY ce.time_start NULLS LAST, ce.event_code
-                    """, (person_id, status_filter))
-                else:
-                    cur.execute("""
-                        SELECT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
-                               ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
-                               ce.confidence, ce.llm_status, ce.validation_status,
-                               ce.created_at, ce.updated_at, ce.created_source,
-                               co.canonical_name
-                        FROM prosopography.career_events ce
-                        LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                        WHERE ce.person_id = %s
-                        ORDER BY ce.time_start NULLS LAST, ce.event_code
-                    """, (person_id,))
-                rows = cur.fetchall()
-                return [self._row_to_event(row) for row in rows]
-        finally:
-            release_connection(conn)
+        return list(self.iter_for_person(person_id, status_filter))
+
+    def iter_with_issues(self, person_id: int, severity: Optional[str] = None):
+        """Stream events that have unresolved issues."""
+        with get_db_connection() as conn:
+            with conn.cursor(name=f"ev_with_issues_{person_id}",
+                             cursor_factory=NamedTupleCursor) as cur:
+                cur.itersize = 500
+                cur.execute("""
+                    SELECT DISTINCT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
+                           ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
+                           ce.confidence, ce.llm_status, ce.validation_status,
+                           ce.created_at, ce.updated_at, ce.created_source,
+                           co.canonical_name AS org_name
+                    FROM prosopography.career_events ce
+                    JOIN prosopography.verification_issues vi ON ce.event_id = vi.event_id
+                    LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
+                    WHERE ce.person_id = %s
+                      AND (%s::text IS NULL OR vi.severity = %s)
+                      AND NOT vi.resolved
+                    ORDER BY ce.time_start NULLS LAST, ce.event_code
+                """, (person_id, severity, severity))
+                for row in cur:
+                    yield self._row_to_event(row)
 
     def get_with_issues(self, person_id: int, severity: Optional[str] = None) -> List[CareerEvent]:
         """Get events that have unresolved issues."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                if severity:
-                    cur.execute("""
-                        SELECT DISTINCT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
-                               ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
-                               ce.confidence, ce.llm_status, ce.validation_status,
-                               ce.created_at, ce.updated_at, ce.created_source,
-                               co.canonical_name
-                        FROM prosopography.career_events ce
-                        LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                        JOIN prosopography.verification_issues vi ON ce.event_id = vi.event_id
-                        WHERE ce.person_id = %s AND vi.severity = %s AND NOT vi.resolved
-                        ORDER BY ce.time_start NULLS LAST, ce.event_code
-                    """, (person_id, severity))
-                else:
-                    cur.execute("""
-                        SELECT DISTINCT ce.event_id, ce.person_id, ce.event_code, ce.event_type, ce.org_id,
-                               ce.time_start, ce.time_end, ce.time_text, ce.roles, ce.locations,
-                               ce.confidence, ce.llm_status, ce.validation_status,
-                               ce.created_at, ce.updated_at, ce.created_source,
-                               co.canonical_name
-                        FROM prosopography.career_events ce
-                        LEFT JOIN prosopography.canonical_organizations co ON ce.org_id = co.org_id
-                        JOIN prosopography.verification_issues vi ON ce.event_id = vi.event_id
-                        WHERE ce.person_id = %s AND NOT vi.resolved
-                        ORDER BY ce.time_start NULLS LAST, ce.event_code
-                    """, (person_id,))
-                rows = cur.fetchall()
-                return [self._row_to_event(row) for row in rows]
-        finally:
-            release_connection(conn)
+        return list(self.iter_with_issues(person_id, severity))
 
     def update(self, event: CareerEvent) -> None:
         """Update an existing career event."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     UPDATE prosopography.career_events
                     SET event_type = %s, org_id = %s, time_start = %s, time_end = %s,
@@ -162,105 +283,153 @@ class EventRepository:
                     WHERE event_id = %s
                 """, (
                     event.event_type, event.org_id, event.time_start, event.time_end,
-                    event.time_text, json.dumps(event.roles), json.dumps(event.locations),
+                    event.time_text, Json(event.roles), Json(event.locations),
                     event.confidence, event.llm_status, event.validation_status,
                     event.event_id
                 ))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                _event_cache.pop(event.event_id)
+                if owned:
+                    conn.commit()
 
     def update_status(self, event_id: int, validation_status: str) -> None:
         """Update just the validation status of an event."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     UPDATE prosopography.career_events
                     SET validation_status = %s, updated_at = NOW()
                     WHERE event_id = %s
                 """, (validation_status, event_id))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
 
     def delete(self, event_id: int) -> None:
         """Delete an event and all related records (cascades)."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     DELETE FROM prosopography.career_events
                     WHERE event_id = %s
                 """, (event_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
+
+    def delete_many(self, event_ids: List[int]) -> None:
+        """Delete multiple events (and cascades) in a single statement."""
+        if not event_ids:
+            return
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute("""
+                    DELETE FROM prosopography.career_events
+                    WHERE event_id = ANY(%s)
+                """, (event_ids,))
+                for event_id in event_ids:
+                    _event_cache.pop(event_id)
+                if owned:
+                    conn.commit()
 
     def get_next_event_code(self, person_id: int, prefix: str = "E") -> str:
         """Generate the next event code for a person."""
-        conn = get_connection()
-        try:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                # MAX over the numeric suffix avoids the lexical-sort trap
+                # where 'E9' > 'E100', and skips sorting all of a person's codes
+                cur.execute(r"""
+                    SELECT COALESCE(MAX(substring(event_code FROM '\d+$')::int), 0)
+                    FROM prosopography.career_events
+                    WHERE person_id = %s AND event_code ~ ('^' || %s || '\d+$')
+                """, (person_id, prefix))
+                num = cur.fetchone()[0]
+                return f"{prefix}{num + 1:03d}"
+
+    def count_total_for_person(self, person_id: int) -> int:
+        """Get the total number of events for a person."""
+        with get_db_read_connection() as conn:
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT event_code FROM prosopography.career_events
-                    WHERE person_id = %s AND event_code LIKE %s
-                    ORDER BY event_code DESC
-                    LIMIT 1
-                """, (person_id, f"{prefix}%"))
-                row = cur.fetchone()
-                if row:
-                    # Extract number and increment
-                    code = row[0]
-                    try:
-                        num = int(code.replace(prefix, "").replace("_NEW_", ""))
-                        return f"{prefix}{num + 1:03d}"
-                    except ValueError:
-                        pass
-                return f"{prefix}001"
-        finally:
-            release_connection(conn)
+                    SELECT COUNT(*)
+                    FROM prosopography.career_events
+                    WHERE person_id = %s
+                """, (person_id,))
+                return cur.fetchone()[0]
 
     def count_for_person(self, person_id: int) -> dict:
         """Get counts of events by validation status for a person."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
                 cur.execute("""
                     SELECT validation_status, COUNT(*)
                     FROM prosopography.career_events
                     WHERE person_id = %s
-                    GROUP BY validation_status
+                    GROUP BY GROUPING SETS ((validation_status), ())
                 """, (person_id,))
                 rows = cur.fetchall()
                 counts = {'total': 0, 'pending': 0, 'validated': 0, 'rejected': 0, 'needs_review': 0}
                 for row in rows:
-                    counts[row[0]] = row[1]
-                    counts['total'] += row[1]
+                    # The () grouping set yields the grand total with a NULL key
+                    if row[0] is None:
+                        counts['total'] = row[1]
+                    else:
+                        counts[row[0]] = row[1]
                 return counts
-        finally:
-            release_connection(conn)
+
+    def count_dashboard(self, person_id: int) -> dict:
+        """Get status counts and correction counts by field in one round-trip.
+
+        Returns {'status': {...}, 'field': {...}} combining what
+        count_for_person and CorrectionRepository.count_by_field would
+        return from two separate queries.
+        """
+        with get_db_read_connection() as conn:
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute("""
+                    SELECT 'status' AS dim, validation_status AS key, COUNT(*) AS n
+                    FROM prosopography.career_events
+                    WHERE person_id = %s
+                    GROUP BY validation_status
+                    UNION ALL
+                    SELECT 'field', uc.field_name, COUNT(*)
+                    FROM prosopography.user_corrections uc
+                    JOIN prosopography.career_events ce ON uc.event_id = ce.event_id
+                    WHERE ce.person_id = %s
+                    GROUP BY uc.field_name
+                """, (person_id, person_id))
+                status_counts = {'total': 0, 'pending': 0, 'validated': 0, 'rejected': 0, 'needs_review': 0}
+                field_counts = {}
+                for row in cur.fetchall():
+                    if row.dim == 'status':
+                        status_counts[row.key] = row.n
+                        status_counts['total'] += row.n
+                    else:
+                        field_counts[row.key] = row.n
+                return {'status': status_counts, 'field': field_counts}
 
     def _row_to_event(self, row) -> CareerEvent:
         """Convert a database row to a CareerEvent object."""
-        roles = row[8] if isinstance(row[8], list) else json.loads(row[8]) if row[8] else []
-        locations = row[9] if isinstance(row[9], list) else json.loads(row[9]) if row[9] else []
+        # roles/locations are jsonb, so psycopg2 already decoded them to lists
+        roles = row.roles or []
+        locations = row.locations or []
+        # Every read query LEFT JOINs the canonical org name into the row
+        org_name = row.org_name
         return CareerEvent(
-            event_id=row[0],
-            person_id=row[1],
-            event_code=row[2],
-            event_type=row[3],
-            org_id=row[4],
-            time_start=row[5],
-            time_end=row[6],
-            time_text=row[7],
+            event_id=row.event_id,
+            person_id=row.person_id,
+            event_code=row.event_code,
+            event_type=row.event_type,
+            org_id=row.org_id,
+            time_start=row.time_start,
+            time_end=row.time_end,
+            time_text=row.time_text,
             roles=roles,
             locations=locations,
-            confidence=row[10],
-            llm_status=row[11],
-            validation_status=row[12],
-            created_at=row[13],
-            updated_at=row[14],
-            created_source=row[15],
-            org_name=row[16] if len(row) > 16 else None
+            confidence=row.confidence,
+            llm_status=row.llm_status,
+            validation_status=row.validation_status,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            created_source=row.created_source,
+            org_name=org_name
         )
@@ -1,164 +1,287 @@
 """Repository for SourceEvidence CRUD operations."""
 
-from typing import List, Optional
+import io
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
 from datetime import datetime
 
-from .connection import get_connection, release_connection
+import psycopg2
+from psycopg2.extras import execute_values
+
+from .cache import TTLCache
+from .connection import prepare_or_inline
 from .models import SourceEvidence
+from .transaction import TransactionMixin
+
+# Canonical column order - must match the SourceEvidence field order,
+# since _row_to_evidence constructs positionally
+_EVIDENCE_FIELDS = (
+    'evidence_id', 'event_id', 'chunk_id', 'source_url', 'source_type',
+    'verbatim_quote', 'quote_context', 'evidence_type', 'contribution',
+    'extraction_phase', 'processing_timestamp', 'model_used'
+)
+_EVIDENCE_COLUMNS = ', '.join(_EVIDENCE_FIELDS)
+_EVIDENCE_COLUMNS_SE = ', '.join(f'se.{c}' for c in _EVIDENCE_FIELDS)
+
+# Hot single-event statements, prepared once per pooled connection so
+# repeated calls skip parse/plan (see connection.prepare_or_inline)
+
+_EV_BY_ID = prepare_or_inline("evid_by_id", f"""
+    SELECT {_EVIDENCE_COLUMNS}
+    FROM prosopography.source_evidence
+    WHERE evidence_id = $1
+""")
+
+_EV_FOR_EVENT = prepare_or_inline("evid_for_event", f"""
+    SELECT {_EVIDENCE_COLUMNS}
+    FROM prosopography.source_evidence
+    WHERE event_id = $1
+    ORDER BY processing_timestamp
+""")
 
+_EV_INSERT = prepare_or_inline("evid_insert", """
+    INSERT INTO prosopography.source_evidence
+    (event_id, chunk_id, source_url, source_type, verbatim_quote,
+     quote_context, evidence_type, contribution, extraction_phase, model_used)
+    VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+    RETURNING evidence_id
+""")
 
-class EvidenceRepository:
+
+class EvidenceRepository(TransactionMixin):
     """Repository for managing SourceEvidence records."""
 
+    def __init__(self, use_cache: bool = True):
+        # Short-lived cache for repeated get_by_id lookups; pass
+        # use_cache=False for strict read-after-write consistency
+        self._cache = TTLCache(maxsize=10_000, ttl=30) if use_cache else None
+
     def create(self, evidence: SourceEvidence) -> int:
         """Create a new source evidence record. Returns the evidence_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO prosopography.source_evidence
-                    (event_id, chunk_id, source_url, source_type, verbatim_quote,
-                     quote_context, evidence_type, contribution, extraction_phase, model_used)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    RETURNING evidence_id
-                """, (
+                cur.execute(_EV_INSERT, (
                     evidence.event_id, evidence.chunk_id, evidence.source_url,
                     evidence.source_type, evidence.verbatim_quote, evidence.quote_context,
                     evidence.evidence_type, evidence.contribution, evidence.extraction_phase,
                     evidence.model_used
                 ))
                 evidence_id = cur.fetchone()[0]
-                conn.commit()
+                if owned:
+                    conn.commit()
                 return evidence_id
-        finally:
-            release_connection(conn)
 
     def create_many(self, evidence_list: List[SourceEvidence]) -> List[int]:
         """Create multiple evidence records. Returns list of evidence_ids."""
         if not evidence_list:
             return []
-        conn = get_connection()
-        try:
-            evidence_ids = []
+        with self._repo_connection() as (conn, owned):
+            rows = [
+                (evidence.event_id, evidence.chunk_id, evidence.source_url,
+                 evidence.source_type, evidence.verbatim_quote, evidence.quote_context,
+                 evidence.evidence_type, evidence.contribution, evidence.extraction_phase,
+                 evidence.model_used)
+                for evidence in evidence_list
+            ]
             with conn.cursor() as cur:
-                for evidence in evidence_list:
-                    cur.execute("""
-                        INSERT INTO prosopography.source_evidence
-                        (event_id, chunk_id, source_url, source_type, verbatim_quote,
-                         quote_context, evidence_type, contribution, extraction_phase, model_used)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                        RETURNING evidence_id
-                    """, (
-                        evidence.event_id, evidence.chunk_id, evidence.source_url,
-                        evidence.source_type, evidence.verbatim_quote, evidence.quote_context,
-                        evidence.evidence_type, evidence.contribution, evidence.extraction_phase,
-                        evidence.model_used
-                    ))
-                    evidence_ids.append(cur.fetchone()[0])
-                conn.commit()
-            return evidence_ids
-        finally:
-            release_connection(conn)
+                result = execute_values(cur, """
+                    INSERT INTO prosopography.source_evidence
+                    (event_id, chunk_id, source_url, source_type, verbatim_quote,
+                     quote_context, evidence_type, contribution, extraction_phase, model_used)
+                    VALUES %s
+                    RETURNING evidence_id
+                """, rows, page_size=500, fetch=True)
+                if owned:
+                    conn.commit()
+            return [row[0] for row in result]
+
+    def copy_many(self, evidence_list: List[SourceEvidence]) -> int:
+        """Bulk-load evidence records via COPY. Returns the number of rows loaded.
+
+        Much faster than create_many for batches of thousands of rows, but
+        does not return the generated evidence_ids — use it for Phase 1 bulk
+        ingestion where IDs are fetched later via get_for_event.
+        """
+        if not evidence_list:
+            return 0
+        buf = io.StringIO()
+        for evidence in evidence_list:
+            buf.write('\t'.join(
+                self._copy_field(value) for value in (
+                    evidence.event_id, evidence.chunk_id, evidence.source_url,
+                    evidence.source_type, evidence.verbatim_quote, evidence.quote_context,
+                    evidence.evidence_type, evidence.contribution, evidence.extraction_phase,
+                    evidence.model_used
+                )
+            ))
+            buf.write('\n')
+        buf.seek(0)
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.copy_expert("""
+                    COPY prosopography.source_evidence
+                    (event_id, chunk_id, source_url, source_type, verbatim_quote,
+                     quote_context, evidence_type, contribution, extraction_phase, model_used)
+                    FROM STDIN WITH (FORMAT text)
+                """, buf)
+                if owned:
+                    conn.commit()
+            return len(evidence_list)
+
+    @staticmethod
+    def _copy_field(value) -> str:
+        """Format a value for COPY text format (\\N for NULL, escaped specials)."""
+        if value is None:
+            return '\\N'
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t') \
+                         .replace('\n', '\\n').replace('\r', '\\r')
 
     def get_by_id(self, evidence_id: int) -> Optional[SourceEvidence]:
         """Get evidence by ID."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            cached = self._cache.get(evidence_id)
+            if cached is not None:
+                return cached
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT evidence_id, event_id, chunk_id, source_url, source_type,
-                           verbatim_quote, quote_context, evidence_type, contribution,
-                           extraction_phase, processing_timestamp, model_used
-                    FROM prosopography.source_evidence
-                    WHERE evidence_id = %s
-                """, (evidence_id,))
+                cur.execute(_EV_BY_ID, (evidence_id,))
                 row = cur.fetchone()
                 if row:
-                    return self._row_to_evidence(row)
+                    evidence = self._row_to_evidence(row)
+                    if self._cache is not None:
+                        self._cache.set(evidence_id, evidence)
+                    return evidence
                 return None
-        finally:
-            release_connection(conn)
+
+    def get_by_ids(self, evidence_ids: List[int]) -> Dict[int, SourceEvidence]:
+        """Get multiple evidence records by ID in one query.
+
+        Batches what would otherwise be one get_by_id round trip per ID
+        into a single statement; missing ids are simply absent from the
+        result dict.
+        """
+        if not evidence_ids:
+            return {}
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {_EVIDENCE_COLUMNS}
+                    FROM prosopography.source_evidence
+                    WHERE evidence_id = ANY(%s)
+                """, (list(evidence_ids),))
+                return {row[0]: self._row_to_evidence(row) for row in cur.fetchall()}
 
     def get_for_event(self, event_id: int) -> List[SourceEvidence]:
         """Get all evidence for a specific event."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT evidence_id, event_id, chunk_id, source_url, source_type,
-                           verbatim_quote, quote_context, evidence_type, contribution,
-                           extraction_phase, processing_timestamp, model_used
-                    FROM prosopography.source_evidence
-                    WHERE event_id = %s
-                    ORDER BY processing_timestamp
-                """, (event_id,))
+                cur.execute(_EV_FOR_EVENT, (event_id,))
                 rows = cur.fetchall()
                 return [self._row_to_evidence(row) for row in rows]
-        finally:
-            release_connection(conn)
+
+    def get_for_events(self, event_ids: List[int]) -> Dict[int, List[SourceEvidence]]:
+        """Get evidence for multiple events in one query, grouped by event_id.
+
+        Use this instead of calling get_for_event in a loop: one round trip
+        replaces one per event.
+        """
+        result: Dict[int, List[SourceEvidence]] = defaultdict(list)
+        if not event_ids:
+            return result
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {_EVIDENCE_COLUMNS}
+                    FROM prosopography.source_evidence
+                    WHERE event_id = ANY(%s)
+                    ORDER BY event_id, processing_timestamp
+                """, (list(event_ids),))
+                for row in cur.fetchall():
+                    result[row[1]].append(self._row_to_evidence(row))
+                return result
 
     def get_for_event_by_type(self, event_id: int, evidence_type: str) -> List[SourceEvidence]:
         """Get evidence for an event filtered by type (original, validation, supplementation)."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT evidence_id, event_id, chunk_id, source_url, source_type,
-                           verbatim_quote, quote_context, evidence_type, contribution,
-                           extraction_phase, processing_timestamp, model_used
+                cur.execute(f"""
+                    SELECT {_EVIDENCE_COLUMNS}
                     FROM prosopography.source_evidence
                     WHERE event_id = %s AND evidence_type = %s
                     ORDER BY processing_timestamp
                 """, (event_id, evidence_type))
                 rows = cur.fetchall()
                 return [self._row_to_evidence(row) for row in rows]
-        finally:
-            release_connection(conn)
 
-    def get_for_person(self, person_id: int) -> List[SourceEvidence]:
-        """Get all evidence for a person's events."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT se.evidence_id, se.event_id, se.chunk_id, se.source_url, se.source_type,
-                           se.verbatim_quote, se.quote_context, se.evidence_type, se.contribution,
-                           se.extraction_phase, se.processing_timestamp, se.model_used
+    def iter_for_person(self, person_id: int) -> Iterator[SourceEvidence]:
+        """Stream all evidence for a person's events.
+
+        Uses a named (server-side) cursor so only itersize rows are buffered
+        at a time, instead of the person's full evidence set.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(name=f"evidence_for_person_{person_id}") as cur:
+                cur.itersize = 1000
+                cur.execute(f"""
+                    SELECT {_EVIDENCE_COLUMNS_SE}
                     FROM prosopography.source_evidence se
                     JOIN prosopography.career_events ce ON se.event_id = ce.event_id
                     WHERE ce.person_id = %s
                     ORDER BY se.processing_timestamp
                 """, (person_id,))
-                rows = cur.fetchall()
-                return [self._row_to_evidence(row) for row in rows]
-        finally:
-            release_connection(conn)
+                for row in cur:
+                    yield self._row_to_evidence(row)
+
+    def get_for_person(self, person_id: int) -> List[SourceEvidence]:
+        """Get all evidence for a person's events."""
+        return list(self.iter_for_person(person_id))
 
     def count_by_source(self, person_id: int) -> List[dict]:
-        """Get counts of evidence by source URL for a person."""
-        conn = get_connection()
-        try:
+        """Get counts of evidence by source URL for a person.
+
+        Postgres shapes the result with json_agg/json_build_object, so the
+        list of dicts arrives as one value instead of being assembled
+        row by row in Python.
+        """
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
-                    SELECT se.source_url, se.source_type, COUNT(*) as count
-                    FROM prosopography.source_evidence se
-                    JOIN prosopography.career_events ce ON se.event_id = ce.event_id
-                    WHERE ce.person_id = %s
-                    GROUP BY se.source_url, se.source_type
-                    ORDER BY count DESC
+                    SELECT json_agg(
+                               json_build_object('source_url', source_url,
+                                                 'source_type', source_type,
+                                                 'count', cnt)
+                               ORDER BY cnt DESC)
+                    FROM (
+                        SELECT se.source_url, se.source_type, COUNT(*) AS cnt
+                        FROM prosopography.source_evidence se
+                        JOIN prosopography.career_events ce ON se.event_id = ce.event_id
+                        WHERE ce.person_id = %s
+                        GROUP BY se.source_url, se.source_type
+                    ) t
                 """, (person_id,))
-                rows = cur.fetchall()
-                return [
-                    {'source_url': row[0], 'source_type': row[1], 'count': row[2]}
-                    for row in rows
-                ]
-        finally:
-            release_connection(conn)
+                return cur.fetchone()[0] or []
+
+    def count_unique_sources_for_events(self, event_ids: List[int]) -> Dict[int, int]:
+        """Count unique sources per event for multiple events in one query.
+
+        Events with no evidence are absent from the result; callers should
+        treat missing keys as zero.
+        """
+        if not event_ids:
+            return {}
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT event_id, COUNT(DISTINCT source_url)
+                    FROM prosopography.source_evidence
+                    WHERE event_id = ANY(%s)
+                    GROUP BY event_id
+                """, (list(event_ids),))
+                return {row[0]: row[1] for row in cur.fetchall()}
 
     def count_unique_sources_for_event(self, event_id: int) -> int:
         """Count unique sources that provide evidence for an event."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT COUNT(DISTINCT source_url)
@@ -166,48 +289,73 @@ class EvidenceRepository:
                     WHERE event_id = %s
                 """, (event_id,))
                 return cur.fetchone()[0]
-        finally:
-            release_connection(conn)
+
+    def count_unique_sources_for_event_approx(self, event_id: int) -> int:
+        """Approximate unique-source count via a HyperLogLog sketch.
+
+        ~1% error, constant memory, and much cheaper than COUNT(DISTINCT)
+        for events with thousands of evidence rows. Falls back to the
+        exact count when the hll extension isn't installed (schema.sql
+        only creates it where available).
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                # Probe inside a savepoint: a full rollback here would
+                # discard every uncommitted statement of an enclosing
+                # transaction() shared across repos, not just the probe
+                cur.execute("SAVEPOINT hll_probe")
+                try:
+                    cur.execute("""
+                        SELECT COALESCE(
+                            hll_cardinality(hll_add_agg(hll_hash_text(source_url))), 0
+                        )::int
+                        FROM prosopography.source_evidence
+                        WHERE event_id = %s
+                    """, (event_id,))
+                    count = cur.fetchone()[0]
+                    cur.execute("RELEASE SAVEPOINT hll_probe")
+                    return count
+                except psycopg2.errors.UndefinedFunction:
+                    cur.execute("ROLLBACK TO SAVEPOINT hll_probe")
+                    return self.count_unique_sources_for_event(event_id)
 
     def delete(self, evidence_id: int) -> None:
         """Delete an evidence record."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            self._cache.pop(evidence_id)
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.source_evidence
                     WHERE evidence_id = %s
                 """, (evidence_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
 
     def delete_for_event(self, event_id: int) -> None:
         """Delete all evidence for an event."""
-        conn = get_connection()
-        try:
+        self.delete_for_events([event_id])
+
+    def delete_for_events(self, event_ids: List[int]) -> None:
+        """Delete all evidence for multiple events in one statement."""
+        if not event_ids:
+            return
+        if self._cache is not None:
+            # Evidence ids for the events aren't known here; drop everything
+            self._cache.clear()
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.source_evidence
-                    WHERE event_id = %s
-                """, (event_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                    WHERE event_id = ANY(%s)
+                """, (list(event_ids),))
+                if owned:
+                    conn.commit()
 
     def _row_to_evidence(self, row) -> SourceEvidence:
-        """Convert a database row to a SourceEvidence object."""
-        return SourceEvidence(
-            evidence_id=row[0],
-            event_id=row[1],
-            chunk_id=row[2],
-            source_url=row[3],
-            source_type=row[4],
-            verbatim_quote=row[5],
-            quote_context=row[6],
-            evidence_type=row[7],
-            contribution=row[8],
-            extraction_phase=row[9],
-            processing_timestamp=row[10],
-            model_used=row[11]
-        )
+        """Convert a database row to a SourceEvidence object.
+
+        Positional construction: the SELECT column order in this module
+        matches the SourceEvidence field order exactly.
+        """
+        return SourceEvidence(*row)
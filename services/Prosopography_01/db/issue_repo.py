@@ -1,273 +1,316 @@
 """Repository for VerificationIssue CRUD operations."""
 
-from typing import List, Optional
+from collections import defaultdict
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from .connection import get_connection, release_connection
+from psycopg2.extras import execute_values
+
+from .cache import TTLCache
+from .connection import prepare_or_inline
 from .models import VerificationIssue
+from .transaction import TransactionMixin
+
+# Canonical column order - must match the VerificationIssue field order,
+# since _row_to_issue constructs positionally
+_ISSUE_FIELDS = (
+    'issue_id', 'event_id', 'issue_type', 'severity', 'description',
+    'resolved', 'resolution_notes', 'resolved_at', 'detected_at'
+)
+_ISSUE_COLUMNS = ', '.join(_ISSUE_FIELDS)
+_ISSUE_COLUMNS_VI = ', '.join(f'vi.{c}' for c in _ISSUE_FIELDS)
+
+# Frozen column order of the open-issues dashboard query; the dict rows
+# in get_all_open are zipped from this, so keep both in sync.
+# severity_rank is included so callers can build the next-page key
+_DASHBOARD_FIELDS = (
+    'person_name', 'event_code', 'issue_type', 'severity',
+    'description', 'detected_at', 'issue_id', 'event_id', 'severity_rank'
+)
+
+# Hot single-event statements, prepared once per pooled connection so
+# repeated calls skip parse/plan (see connection.prepare_or_inline)
+
+_ISS_BY_ID = prepare_or_inline("iss_by_id", f"""
+    SELECT {_ISSUE_COLUMNS}
+    FROM prosopography.verification_issues
+    WHERE issue_id = $1
+""")
+
+_ISS_FOR_EVENT = prepare_or_inline("iss_for_event", f"""
+    SELECT {_ISSUE_COLUMNS}
+    FROM prosopography.verification_issues
+    WHERE event_id = $1
+      AND ($2 OR NOT resolved)
+    ORDER BY severity_rank
+""")
+
+_ISS_INSERT = prepare_or_inline("iss_insert", """
+    INSERT INTO prosopography.verification_issues
+    (event_id, issue_type, severity, description)
+    VALUES ($1, $2, $3, $4)
+    RETURNING issue_id
+""")
 
 
-class IssueRepository:
+class IssueRepository(TransactionMixin):
     """Repository for managing VerificationIssue records."""
 
+    def __init__(self, use_cache: bool = True):
+        # Short-lived cache for repeated get_by_id lookups; pass
+        # use_cache=False for strict read-after-write consistency
+        self._cache = TTLCache(maxsize=10_000, ttl=30) if use_cache else None
+
     def create(self, issue: VerificationIssue) -> int:
         """Create a new verification issue. Returns the issue_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO prosopography.verification_issues
-                    (event_id, issue_type, severity, description)
-                    VALUES (%s, %s, %s, %s)
-                    RETURNING issue_id
-                """, (
+                cur.execute(_ISS_INSERT, (
                     issue.event_id, issue.issue_type, issue.severity, issue.description
                 ))
                 issue_id = cur.fetchone()[0]
-                conn.commit()
+                if owned:
+                    conn.commit()
                 return issue_id
-        finally:
-            release_connection(conn)
 
     def create_many(self, issues: List[VerificationIssue]) -> List[int]:
         """Create multiple issues. Returns list of issue_ids."""
         if not issues:
             return []
-        conn = get_connection()
-        try:
-            issue_ids = []
+        with self._repo_connection() as (conn, owned):
+            rows = [
+                (issue.event_id, issue.issue_type, issue.severity, issue.description)
+                for issue in issues
+            ]
             with conn.cursor() as cur:
-                for issue in issues:
-                    cur.execute("""
-                        INSERT INTO prosopography.verification_issues
-                        (event_id, issue_type, severity, description)
-                        VALUES (%s, %s, %s, %s)
-                        RETURNING issue_id
-                    """, (
-                        issue.event_id, issue.issue_type, issue.severity, issue.description
-                    ))
-                    issue_ids.append(cur.fetchone()[0])
-                conn.commit()
-            return issue_ids
-        finally:
-            release_connection(conn)
+                result = execute_values(cur, """
+                    INSERT INTO prosopography.verification_issues
+                    (event_id, issue_type, severity, description)
+                    VALUES %s
+                    RETURNING issue_id
+                """, rows, page_size=500, fetch=True)
+                if owned:
+                    conn.commit()
+            return [row[0] for row in result]
 
     def get_by_id(self, issue_id: int) -> Optional[VerificationIssue]:
         """Get an issue by ID."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            cached = self._cache.get(issue_id)
+            if cached is not None:
+                return cached
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT issue_id, event_id, issue_type, severity, description,
-                           resolved, resolution_notes, resolved_at, detected_at
-                    FROM prosopography.verification_issues
-                    WHERE issue_id = %s
-                """, (issue_id,))
+                cur.execute(_ISS_BY_ID, (issue_id,))
                 row = cur.fetchone()
                 if row:
-                    return self._row_to_issue(row)
+                    issue = self._row_to_issue(row)
+                    if self._cache is not None:
+                        self._cache.set(issue_id, issue)
+                    return issue
                 return None
-        finally:
-            release_connection(conn)
+
+    def get_by_ids(self, issue_ids: List[int]) -> Dict[int, VerificationIssue]:
+        """Get multiple issues by ID in one query.
+
+        Batches what would otherwise be one get_by_id round trip per ID
+        into a single statement; missing ids are simply absent from the
+        result dict.
+        """
+        if not issue_ids:
+            return {}
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {_ISSUE_COLUMNS}
+                    FROM prosopography.verification_issues
+                    WHERE issue_id = ANY(%s)
+                """, (list(issue_ids),))
+                return {row[0]: self._row_to_issue(row) for row in cur.fetchall()}
 
     def get_for_event(self, event_id: int, include_resolved: bool = True) -> List[VerificationIssue]:
         """Get all issues for a specific event."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                if include_resolved:
-                    cur.execute("""
-                        SELECT issue_id, event_id, issue_type, severity, description,
-                               resolved, resolution_notes, resolved_at, detected_at
-                        FROM prosopography.verification_issues
-                        WHERE event_id = %s
-                        ORDER BY CASE severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
-                    """, (event_id,))
-                else:
-                    cur.execute("""
-                        SELECT issue_id, event_id, issue_type, severity, description,
-                               resolved, resolution_notes, resolved_at, detected_at
-                        FROM prosopography.verification_issues
-                        WHERE event_id = %s AND NOT resolved
-                        ORDER BY CASE severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
-                    """, (event_id,))
+                cur.execute(_ISS_FOR_EVENT, (event_id, include_resolved))
                 rows = cur.fetchall()
                 return [self._row_to_issue(row) for row in rows]
-        finally:
-            release_connection(conn)
+
+    def get_for_events(self, event_ids: List[int],
+                       include_resolved: bool = True) -> Dict[int, List[VerificationIssue]]:
+        """Get issues for multiple events in one query, grouped by event_id.
+
+        Use this instead of calling get_for_event in a loop: one round trip
+        replaces one per event.
+        """
+        result: Dict[int, List[VerificationIssue]] = defaultdict(list)
+        if not event_ids:
+            return result
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute(f"""
+                    SELECT {_ISSUE_COLUMNS}
+                    FROM prosopography.verification_issues
+                    WHERE event_id = ANY(%s)
+                      AND (%s OR NOT resolved)
+                    ORDER BY event_id, severity_rank
+                """, (list(event_ids), include_resolved))
+                for row in cur.fetchall():
+                    result[row[1]].append(self._row_to_issue(row))
+                return result
 
     def get_for_person(self, person_id: int, include_resolved: bool = False) -> List[VerificationIssue]:
         """Get all issues for a person's events."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                if include_resolved:
-                    cur.execute("""
-                        SELECT vi.issue_id, vi.event_id, vi.issue_type, vi.severity, vi.description,
-                               vi.resolved, vi.resolution_notes, vi.resolved_at, vi.detected_at
-                        FROM prosopography.verification_issues vi
-                        JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
-                        WHERE ce.person_id = %s
-                        ORDER BY CASE vi.severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
-                    """, (person_id,))
-                else:
-                    cur.execute("""
-                        SELECT vi.issue_id, vi.event_id, vi.issue_type, vi.severity, vi.description,
-                               vi.resolved, vi.resolution_notes, vi.resolved_at, vi.detected_at
-                        FROM prosopography.verification_issues vi
-                        JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
-                        WHERE ce.person_id = %s AND NOT vi.resolved
-                        ORDER BY CASE vi.severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
-                    """, (person_id,))
+                cur.execute(f"""
+                    SELECT {_ISSUE_COLUMNS_VI}
+                    FROM prosopography.verification_issues vi
+                    JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
+                    WHERE ce.person_id = %s
+                      AND (%s OR NOT vi.resolved)
+                    ORDER BY vi.severity_rank
+                """, (person_id, include_resolved))
                 rows = cur.fetchall()
                 return [self._row_to_issue(row) for row in rows]
-        finally:
-            release_connection(conn)
 
-    def get_all_open(self, severity: Optional[str] = None) -> List[dict]:
-        """Get all open issues across all persons (for dashboard)."""
-        conn = get_connection()
-        try:
+    def get_all_open(self, severity: Optional[str] = None,
+                     limit: Optional[int] = None, offset: int = 0,
+                     after_key: Optional[tuple] = None) -> List[dict]:
+        """Get all open issues across all persons (for dashboard).
+
+        For paging large backlogs prefer keyset pagination: pass the
+        previous page's last row as after_key = (severity_rank,
+        person_name, event_code, issue_id). Unlike OFFSET, which scans and
+        discards all skipped rows, the keyset predicate seeks straight to
+        the next page regardless of backlog size.
+        """
+        keyset_sql = ""
+        params = [severity, severity]
+        if after_key is not None:
+            keyset_sql = """
+                      AND (vi.severity_rank, p.person_name, ce.event_code, vi.issue_id)
+                          > (%s, %s, %s, %s)"""
+            params.extend(after_key)
+        params.extend([limit, offset])
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                if severity:
-                    cur.execute("""
-                        SELECT p.person_name, ce.event_code, vi.issue_type, vi.severity,
-                               vi.description, vi.detected_at, vi.issue_id, ce.event_id
-                        FROM prosopography.verification_issues vi
-                        JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
-                        JOIN prosopography.persons p ON ce.person_id = p.person_id
-                        WHERE NOT vi.resolved AND vi.severity = %s
-                        ORDER BY CASE vi.severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END,
-                                 p.person_name, ce.event_code
-                    """, (severity,))
-                else:
-                    cur.execute("""
-                        SELECT p.person_name, ce.event_code, vi.issue_type, vi.severity,
-                               vi.description, vi.detected_at, vi.issue_id, ce.event_id
-                        FROM prosopography.verification_issues vi
-                        JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
-                        JOIN prosopography.persons p ON ce.person_id = p.person_id
-                        WHERE NOT vi.resolved
-                        ORDER BY CASE vi.severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END,
-                                 p.person_name, ce.event_code
-                    """)
-                rows = cur.fetchall()
-                return [
-                    {
-                        'person_name': row[0],
-                        'event_code': row[1],
-                        'issue_type': row[2],
-                        'severity': row[3],
-                        'description': row[4],
-                        'detected_at': row[5],
-                        'issue_id': row[6],
-                        'event_id': row[7]
-                    }
-                    for row in rows
-                ]
-        finally:
-            release_connection(conn)
+                cur.execute(f"""
+                    SELECT p.person_name, ce.event_code, vi.issue_type, vi.severity,
+                           vi.description, vi.detected_at, vi.issue_id, ce.event_id,
+                           vi.severity_rank
+                    FROM prosopography.verification_issues vi
+                    JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
+                    JOIN prosopography.persons p ON ce.person_id = p.person_id
+                    WHERE NOT vi.resolved
+                      AND (%s::text IS NULL OR vi.severity = %s){keyset_sql}
+                    ORDER BY vi.severity_rank, p.person_name, ce.event_code, vi.issue_id
+                    LIMIT %s OFFSET %s
+                """, params)
+                # Plain tuple cursor + one dict per row here; cheaper than a
+                # dict-building cursor factory doing the same work per column
+                return [dict(zip(_DASHBOARD_FIELDS, row)) for row in cur.fetchall()]
 
     def resolve(self, issue_id: int, resolution_notes: Optional[str] = None) -> None:
         """Mark an issue as resolved."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            self._cache.pop(issue_id)
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE prosopography.verification_issues
                     SET resolved = TRUE, resolution_notes = %s, resolved_at = NOW()
                     WHERE issue_id = %s
                 """, (resolution_notes, issue_id))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
 
     def resolve_for_event(self, event_id: int, resolution_notes: Optional[str] = None) -> None:
         """Mark all issues for an event as resolved."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            # Issue ids for the event aren't known here; drop everything
+            self._cache.clear()
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE prosopography.verification_issues
                     SET resolved = TRUE, resolution_notes = %s, resolved_at = NOW()
                     WHERE event_id = %s AND NOT resolved
                 """, (resolution_notes, event_id))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
+
+    # One COUNT(*) FILTER clause per (severity, resolved) bucket: a single
+    # scan produces a single result row with no Python grouping loop
+    _SEVERITY_COUNTS = """
+        COUNT(*) FILTER (WHERE vi.severity = 'error' AND NOT vi.resolved),
+        COUNT(*) FILTER (WHERE vi.severity = 'error' AND vi.resolved),
+        COUNT(*) FILTER (WHERE vi.severity = 'warning' AND NOT vi.resolved),
+        COUNT(*) FILTER (WHERE vi.severity = 'warning' AND vi.resolved),
+        COUNT(*) FILTER (WHERE vi.severity = 'info' AND NOT vi.resolved),
+        COUNT(*) FILTER (WHERE vi.severity = 'info' AND vi.resolved)
+    """
 
     def count_by_severity(self, person_id: Optional[int] = None) -> dict:
         """Get counts of issues by severity."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 if person_id:
-                    cur.execute("""
-                        SELECT vi.severity, vi.resolved, COUNT(*)
+                    cur.execute(f"""
+                        SELECT {self._SEVERITY_COUNTS}
                         FROM prosopography.verification_issues vi
                         JOIN prosopography.career_events ce ON vi.event_id = ce.event_id
                         WHERE ce.person_id = %s
-                        GROUP BY vi.severity, vi.resolved
                     """, (person_id,))
                 else:
-                    cur.execute("""
-                        SELECT severity, resolved, COUNT(*)
-                        FROM prosopography.verification_issues
-                        GROUP BY severity, resolved
+                    cur.execute(f"""
+                        SELECT {self._SEVERITY_COUNTS}
+                        FROM prosopography.verification_issues vi
                     """)
-                rows = cur.fetchall()
-                counts = {
-                    'error': {'open': 0, 'resolved': 0},
-                    'warning': {'open': 0, 'resolved': 0},
-                    'info': {'open': 0, 'resolved': 0}
+                row = cur.fetchone()
+                return {
+                    'error': {'open': row[0], 'resolved': row[1]},
+                    'warning': {'open': row[2], 'resolved': row[3]},
+                    'info': {'open': row[4], 'resolved': row[5]}
                 }
-                for row in rows:
-                    severity = row[0]
-                    resolved = row[1]
-                    count = row[2]
-                    if severity in counts:
-                        key = 'resolved' if resolved else 'open'
-                        counts[severity][key] = count
-                return counts
-        finally:
-            release_connection(conn)
 
     def delete(self, issue_id: int) -> None:
         """Delete an issue."""
-        conn = get_connection()
-        try:
+        if self._cache is not None:
+            self._cache.pop(issue_id)
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.verification_issues
                     WHERE issue_id = %s
                 """, (issue_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
 
     def delete_for_event(self, event_id: int) -> None:
         """Delete all issues for an event."""
-        conn = get_connection()
-        try:
+        self.delete_for_events([event_id])
+
+    def delete_for_events(self, event_ids: List[int]) -> None:
+        """Delete all issues for multiple events in one statement."""
+        if not event_ids:
+            return
+        if self._cache is not None:
+            # Issue ids for the events aren't known here; drop everything
+            self._cache.clear()
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.verification_issues
-                    WHERE event_id = %s
-                """, (event_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                    WHERE event_id = ANY(%s)
+                """, (list(event_ids),))
+                if owned:
+                    conn.commit()
 
     def _row_to_issue(self, row) -> VerificationIssue:
-        """Convert a database row to a VerificationIssue object."""
-        return VerificationIssue(
-            issue_id=row[0],
-            event_id=row[1],
-            issue_type=row[2],
-            severity=row[3],
-            description=row[4],
-            resolved=row[5],
-            resolution_notes=row[6],
-            resolved_at=row[7],
-            detected_at=row[8]
-        )
+        """Convert a database row to a VerificationIssue object.
+
+        Positional construction: the SELECT column order in this module
+        matches the VerificationIssue field order exactly.
+        """
+        return VerificationIssue(*row)
@@ -0,0 +1,29 @@
+"""Bulk maintenance operations spanning multiple tables."""
+
+from typing import List, Optional
+
+from .connection import get_db_connection
+
+
+def bulk_cleanup(event_ids: List[int],
+                 resolution_notes: Optional[str] = None) -> None:
+    """Resolve open issues and delete evidence for events in one round trip.
+
+    Used when re-extraction replaces a batch of events: rather than one
+    resolve and one delete statement per event, a single CTE statement
+    resolves all open issues and removes all evidence for the whole batch
+    under one transaction snapshot.
+    """
+    if not event_ids:
+        return
+    with get_db_connection() as conn:
+        with conn, conn.cursor() as cur:
+            cur.execute("""
+                WITH resolved_issues AS (
+                    UPDATE prosopography.verification_issues
+                    SET resolved = TRUE, resolution_notes = %s, resolved_at = NOW()
+                    WHERE event_id = ANY(%s) AND NOT resolved
+                )
+                DELETE FROM prosopography.source_evidence
+                WHERE event_id = ANY(%s)
+            """, (resolution_notes, list(event_ids), list(event_ids)))
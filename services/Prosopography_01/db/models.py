@@ -5,17 +5,18 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Person:
     """A person being researched."""
     person_id: Optional[int] = None
     person_name: str = ""
     workflow_status: str = "pending"  # pending, phase1_complete, phase2_reviewed, phase3_in_progress, complete
+    phase1_input_hash: Optional[str] = None  # blake2b-128 of the Phase 1 source text
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CanonicalOrganization:
     """A canonical (deduplicated) organization."""
     org_id: Optional[int] = None
@@ -29,7 +30,7 @@ class CanonicalOrganization:
     created_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CareerEvent:
     """A career event (position or award)."""
     event_id: Optional[int] = None
@@ -61,7 +62,7 @@ class CareerEvent:
     org_name: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SourceEvidence:
     """Evidence from a source supporting a career event."""
     evidence_id: Optional[int] = None
@@ -86,7 +87,7 @@ class SourceEvidence:
     model_used: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCorrection:
     """A user correction to a career event."""
     correction_id: Optional[int] = None
@@ -108,7 +109,7 @@ class UserCorrection:
     corrected_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class VerificationIssue:
     """An issue detected during LLM verification."""
     issue_id: Optional[int] = None
@@ -126,7 +127,7 @@ class VerificationIssue:
     detected_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ProcessingDecision:
     """A decision made during Phase 3 supplementation."""
     decision_id: Optional[int] = None
@@ -154,7 +155,7 @@ class ProcessingDecision:
     processed_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationMetrics:
     """Evaluation metrics for a person's career events."""
     metric_id: Optional[int] = None
@@ -1,19 +1,75 @@
 """Repository for CanonicalOrganization CRUD operations."""
 
+import io
 from typing import List, Optional
-import json
 
-from .connection import get_connection, release_connection
+from psycopg2.extras import NamedTupleCursor, execute_values
+
+from .connection import prepare_or_inline
+from .transaction import TransactionMixin
 from .models import CanonicalOrganization
 
+# orjson is noticeably faster for the per-row metadata (de)serialization
+# on the ingestion hot path; fall back to stdlib json where missing
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        return orjson.dumps(data or {}).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(data) -> str:
+        return json.dumps(data or {})
+
+    _loads = json.loads
+
+# Hot lookups, prepared once per pooled connection so repeated calls
+# skip parse/plan (see connection.prepare_or_inline)
+_ORG_COLUMNS = """org_id, person_id, canonical_id, canonical_name, org_type,
+       country, parent_org_id, metadata, created_at"""
+
+_ORG_BY_ID = prepare_or_inline("org_by_id", f"""
+    SELECT {_ORG_COLUMNS}
+    FROM prosopography.canonical_organizations
+    WHERE org_id = $1
+""")
+
+_ORG_BY_CANONICAL_ID = prepare_or_inline("org_by_canonical_id", f"""
+    SELECT {_ORG_COLUMNS}
+    FROM prosopography.canonical_organizations
+    WHERE person_id = $1 AND canonical_id = $2
+""")
 
-class OrganizationRepository:
+_ORG_FOR_PERSON = prepare_or_inline("org_for_person", f"""
+    SELECT {_ORG_COLUMNS}
+    FROM prosopography.canonical_organizations
+    WHERE person_id = $1
+    ORDER BY canonical_id
+""")
+
+_ORG_BY_NAME_CI = prepare_or_inline("org_by_name_ci", f"""
+    SELECT {_ORG_COLUMNS}
+    FROM prosopography.canonical_organizations
+    WHERE person_id = $1 AND LOWER(canonical_name) = LOWER($2)
+    LIMIT 1
+""")
+
+_ORG_ALIASES = prepare_or_inline("org_aliases", """
+    SELECT alias_name FROM prosopography.organization_aliases
+    WHERE org_id = $1
+    ORDER BY alias_name
+""")
+
+
+class OrganizationRepository(TransactionMixin):
     """Repository for managing CanonicalOrganization records."""
 
     def create(self, org: CanonicalOrganization) -> int:
         """Create a new canonical organization. Returns the org_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     INSERT INTO prosopography.canonical_organizations
@@ -28,123 +84,189 @@ class OrganizationRepository:
                 """, (
                     org.person_id, org.canonical_id, org.canonical_name,
                     org.org_type, org.country, org.parent_org_id,
-                    json.dumps(org.metadata) if org.metadata else '{}'
+                    _dumps(org.metadata)
                 ))
                 org_id = cur.fetchone()[0]
-                conn.commit()
+                if owned:
+                    conn.commit()
                 return org_id
-        finally:
-            release_connection(conn)
 
     def create_many(self, orgs: List[CanonicalOrganization]) -> List[int]:
         """Create multiple organizations. Returns list of org_ids."""
         if not orgs:
             return []
-        conn = get_connection()
-        try:
-            org_ids = []
+        with self._repo_connection() as (conn, owned):
+            rows = [
+                (org.person_id, org.canonical_id, org.canonical_name,
+                 org.org_type, org.country, org.parent_org_id,
+                 _dumps(org.metadata))
+                for org in orgs
+            ]
             with conn.cursor() as cur:
-                for org in orgs:
-                    cur.execute("""
-                        INSERT INTO prosopography.canonical_organizations
-                        (person_id, canonical_id, canonical_name, org_type, country, parent_org_id, metadata)
-                        VALUES (%s, %s, %s, %s, %s, %s, %s)
-                        ON CONFLICT (person_id, canonical_id) DO UPDATE SET
-                            canonical_name = EXCLUDED.canonical_name,
-                            org_type = EXCLUDED.org_type,
-                            country = EXCLUDED.country,
-                            metadata = EXCLUDED.metadata
-                        RETURNING org_id
-                    """, (
-                        org.person_id, org.canonical_id, org.canonical_name,
-                        org.org_type, org.country, org.parent_org_id,
-                        json.dumps(org.metadata) if org.metadata else '{}'
-                    ))
-                    org_ids.append(cur.fetchone()[0])
-                conn.commit()
-            return org_ids
-        finally:
-            release_connection(conn)
+                result = execute_values(cur, """
+                    INSERT INTO prosopography.canonical_organizations
+                    (person_id, canonical_id, canonical_name, org_type, country, parent_org_id, metadata)
+                    VALUES %s
+                    ON CONFLICT (person_id, canonical_id) DO UPDATE SET
+                        canonical_name = EXCLUDED.canonical_name,
+                        org_type = EXCLUDED.org_type,
+                        country = EXCLUDED.country,
+                        metadata = EXCLUDED.metadata
+                    RETURNING org_id
+                """, rows, page_size=500, fetch=True)
+                if owned:
+                    conn.commit()
+            return [row[0] for row in result]
+
+    def bulk_copy(self, orgs: List[CanonicalOrganization]) -> List[int]:
+        """Bulk-ingest organizations via COPY into a staging table.
+
+        Streams rows with COPY FROM STDIN into a temp table, then folds
+        them into canonical_organizations with one upsert, sidestepping
+        per-row statement parsing. Small batches fall through to
+        create_many, where COPY setup cost would dominate.
+        """
+        if len(orgs) < 100:
+            return self.create_many(orgs)
+        buf = io.StringIO()
+        for org in orgs:
+            buf.write('\t'.join(
+                self._copy_field(value) for value in (
+                    org.person_id, org.canonical_id, org.canonical_name,
+                    org.org_type, org.country, org.parent_org_id,
+                    _dumps(org.metadata)
+                )
+            ))
+            buf.write('\n')
+        buf.seek(0)
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute("""
+                    DROP TABLE IF EXISTS tmp_orgs;
+                    CREATE TEMP TABLE tmp_orgs (
+                        person_id INT,
+                        canonical_id TEXT,
+                        canonical_name TEXT,
+                        org_type TEXT,
+                        country TEXT,
+                        parent_org_id INT,
+                        metadata TEXT
+                    ) ON COMMIT DROP
+                """)
+                cur.copy_expert("COPY tmp_orgs FROM STDIN", buf)
+                cur.execute("""
+                    INSERT INTO prosopography.canonical_organizations
+                    (person_id, canonical_id, canonical_name, org_type, country, parent_org_id, metadata)
+                    SELECT person_id, canonical_id, canonical_name, org_type,
+                           country, parent_org_id, metadata::jsonb
+                    FROM tmp_orgs
+                    ON CONFLICT (person_id, canonical_id) DO UPDATE SET
+                        canonical_name = EXCLUDED.canonical_name,
+                        org_type = EXCLUDED.org_type,
+                        country = EXCLUDED.country,
+                        metadata = EXCLUDED.metadata
+                    RETURNING org_id
+                """)
+                org_ids = [row[0] for row in cur.fetchall()]
+                if owned:
+                    conn.commit()
+                return org_ids
+
+    @staticmethod
+    def _copy_field(value) -> str:
+        """Format a value for COPY text format (\\N for NULL, escaped specials)."""
+        if value is None:
+            return '\\N'
+        return str(value).replace('\\', '\\\\').replace('\t', '\\t') \
+                         .replace('\n', '\\n').replace('\r', '\\r')
 
     def get_by_id(self, org_id: int) -> Optional[CanonicalOrganization]:
         """Get an organization by ID."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT org_id, person_id, canonical_id, canonical_name, org_type,
-                           country, parent_org_id, metadata, created_at
-                    FROM prosopography.canonical_organizations
-                    WHERE org_id = %s
-                """, (org_id,))
+                cur.execute(_ORG_BY_ID, (org_id,))
                 row = cur.fetchone()
                 if row:
                     return self._row_to_org(row)
                 return None
-        finally:
-            release_connection(conn)
 
     def get_by_canonical_id(self, person_id: int, canonical_id: str) -> Optional[CanonicalOrganization]:
         """Get an organization by person_id and canonical_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT org_id, person_id, canonical_id, canonical_name, org_type,
-                           country, parent_org_id, metadata, created_at
-                    FROM prosopography.canonical_organizations
-                    WHERE person_id = %s AND canonical_id = %s
-                """, (person_id, canonical_id))
+                cur.execute(_ORG_BY_CANONICAL_ID, (person_id, canonical_id))
+                row = cur.fetchone()
+                if row:
+                    return self._row_to_org(row)
+                return None
+
+    def get_by_canonical_name_ci(self, person_id: int, name: str) -> Optional[CanonicalOrganization]:
+        """Get an organization by case-insensitive canonical name.
+
+        One indexed lookup (idx_orgs_person_name_ci) instead of fetching
+        the person's whole org list and scanning it in Python.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute(_ORG_BY_NAME_CI, (person_id, name))
                 row = cur.fetchone()
                 if row:
                     return self._row_to_org(row)
                 return None
-        finally:
-            release_connection(conn)
 
     def get_for_person(self, person_id: int) -> List[CanonicalOrganization]:
         """Get all organizations for a person."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT org_id, person_id, canonical_id, canonical_name, org_type,
-                           country, parent_org_id, metadata, created_at
-                    FROM prosopography.canonical_organizations
-                    WHERE person_id = %s
-                    ORDER BY canonical_id
-                """, (person_id,))
+                cur.execute(_ORG_FOR_PERSON, (person_id,))
                 rows = cur.fetchall()
                 return [self._row_to_org(row) for row in rows]
-        finally:
-            release_connection(conn)
+
+    def get_for_person_raw(self, person_id: int) -> list:
+        """Get organizations for a person as named-tuple rows.
+
+        For read-only display paths that don't need dataclass instances;
+        skips the per-row CanonicalOrganization construction entirely.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(cursor_factory=NamedTupleCursor) as cur:
+                cur.execute(_ORG_FOR_PERSON, (person_id,))
+                return cur.fetchall()
 
     def get_next_canonical_id(self, person_id: int) -> str:
-        """Generate the next canonical ID for a person."""
-        conn = get_connection()
-        try:
+        """Generate the next canonical ID for a person.
+
+        Backed by a per-person sequence so concurrent writers never hand
+        out the same ID; the old SELECT-max-then-parse approach raced.
+        The sequence is created (and seeded from any pre-existing IDs)
+        on first use for a person.
+        """
+        seq_name = f"prosopography.org_canonical_seq_p{int(person_id)}"
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT canonical_id FROM prosopography.canonical_organizations
-                    WHERE person_id = %s AND canonical_id LIKE 'ORG_%'
-                    ORDER BY canonical_id DESC
-                    LIMIT 1
-                """, (person_id,))
-                row = cur.fetchone()
-                if row:
-                    try:
-                        num = int(row[0].replace("ORG_", ""))
-                        return f"ORG_{num + 1:03d}"
-                    except ValueError:
-                        pass
-                return "ORG_001"
-        finally:
-            release_connection(conn)
+                cur.execute("SELECT to_regclass(%s)", (seq_name,))
+                if cur.fetchone()[0] is None:
+                    cur.execute(f"CREATE SEQUENCE IF NOT EXISTS {seq_name}")
+                    cur.execute(r"""
+                        SELECT COALESCE(MAX(substring(canonical_id FROM 'ORG_(\d+)')::int), 0)
+                        FROM prosopography.canonical_organizations
+                        WHERE person_id = %s AND canonical_id ~ '^ORG_\d+$'
+                    """, (person_id,))
+                    existing_max = cur.fetchone()[0]
+                    if existing_max:
+                        cur.execute("SELECT setval(%s, %s)", (seq_name, existing_max))
+                cur.execute(
+                    "SELECT 'ORG_' || lpad(nextval(%s)::text, 3, '0')",
+                    (seq_name,)
+                )
+                next_id = cur.fetchone()[0]
+                if owned:
+                    conn.commit()
+                return next_id
 
     def add_alias(self, org_id: int, alias_name: str, source_chunk_id: Optional[int] = None) -> int:
         """Add an alias for an organization. Returns alias_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     INSERT INTO prosopography.organization_aliases (org_id, alias_name, source_chunk_id)
@@ -153,29 +275,38 @@ class OrganizationRepository:
                     RETURNING alias_id
                 """, (org_id, alias_name, source_chunk_id))
                 result = cur.fetchone()
-                conn.commit()
+                if owned:
+                    conn.commit()
                 return result[0] if result else 0
-        finally:
-            release_connection(conn)
+
+    def add_aliases(self, aliases: List[tuple]) -> None:
+        """Add many (org_id, alias_name) pairs in one statement."""
+        if not aliases:
+            return
+        rows = [
+            (alias[0], alias[1], alias[2] if len(alias) > 2 else None)
+            for alias in aliases
+        ]
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                execute_values(cur, """
+                    INSERT INTO prosopography.organization_aliases (org_id, alias_name, source_chunk_id)
+                    VALUES %s
+                    ON CONFLICT (org_id, alias_name) DO NOTHING
+                """, rows, page_size=500)
+                if owned:
+                    conn.commit()
 
     def get_aliases(self, org_id: int) -> List[str]:
         """Get all aliases for an organization."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT alias_name FROM prosopography.organization_aliases
-                    WHERE org_id = %s
-                    ORDER BY alias_name
-                """, (org_id,))
+                cur.execute(_ORG_ALIASES, (org_id,))
                 return [row[0] for row in cur.fetchall()]
-        finally:
-            release_connection(conn)
 
     def find_by_alias(self, person_id: int, alias_name: str) -> Optional[CanonicalOrganization]:
         """Find an organization by one of its aliases."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     SELECT co.org_id, co.person_id, co.canonical_id, co.canonical_name, co.org_type,
@@ -188,13 +319,10 @@ class OrganizationRepository:
                 if row:
                     return self._row_to_org(row)
                 return None
-        finally:
-            release_connection(conn)
 
     def update(self, org: CanonicalOrganization) -> None:
         """Update an existing organization."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE prosopography.canonical_organizations
@@ -203,37 +331,29 @@ class OrganizationRepository:
                     WHERE org_id = %s
                 """, (
                     org.canonical_name, org.org_type, org.country,
-                    org.parent_org_id, json.dumps(org.metadata) if org.metadata else '{}',
+                    org.parent_org_id, _dumps(org.metadata),
                     org.org_id
                 ))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
 
     def delete(self, org_id: int) -> None:
         """Delete an organization and its aliases."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.canonical_organizations
                     WHERE org_id = %s
                 """, (org_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
-
-    def _row_to_org(self, row) -> CanonicalOrganization:
-        """Convert a database row to a CanonicalOrganization object."""
-        metadata = row[7] if isinstance(row[7], dict) else json.loads(row[7]) if row[7] else {}
-        return CanonicalOrganization(
-            org_id=row[0],
-            person_id=row[1],
-            canonical_id=row[2],
-            canonical_name=row[3],
-            org_type=row[4],
-            country=row[5],
-            parent_org_id=row[6],
-            metadata=metadata,
-            created_at=row[8]
-        )
+                if owned:
+                    conn.commit()
+
+    @staticmethod
+    def _row_to_org(row) -> CanonicalOrganization:
+        """Convert a database row to a CanonicalOrganization object.
+
+        Built positionally (column order matches the dataclass field
+        order) to skip per-field keyword overhead on many-row reads.
+        """
+        metadata = row[7] if isinstance(row[7], dict) else _loads(row[7]) if row[7] else {}
+        return CanonicalOrganization(*row[:7], metadata, row[8])
@@ -1,20 +1,35 @@
 """Repository for Person CRUD operations."""
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import datetime
-import json
 
-from .connection import get_connection, release_connection
+from .connection import prepare_or_inline
+from .transaction import TransactionMixin
 from .models import Person
 
+# Hot lookups, prepared once per pooled connection so repeated calls
+# skip parse/plan (see connection.prepare_or_inline)
+_PERSON_COLUMNS = "person_id, person_name, workflow_status, phase1_input_hash, created_at, updated_at"
 
-class PersonRepository:
+_PERSON_BY_ID = prepare_or_inline("person_by_id", f"""
+    SELECT {_PERSON_COLUMNS}
+    FROM prosopography.persons
+    WHERE person_id = $1
+""")
+
+_PERSON_BY_NAME = prepare_or_inline("person_by_name", f"""
+    SELECT {_PERSON_COLUMNS}
+    FROM prosopography.persons
+    WHERE person_name = $1
+""")
+
+
+class PersonRepository(TransactionMixin):
     """Repository for managing Person records."""
 
     def create(self, person: Person) -> int:
         """Create a new person record. Returns the person_id."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     INSERT INTO prosopography.persons (person_name, workflow_status)
@@ -23,121 +38,99 @@ class PersonRepository:
                     RETURNING person_id
                 """, (person.person_name, person.workflow_status))
                 person_id = cur.fetchone()[0]
-                conn.commit()
+                if owned:
+                    conn.commit()
                 return person_id
-        finally:
-            release_connection(conn)
 
     def get_by_id(self, person_id: int) -> Optional[Person]:
         """Get a person by ID."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT person_id, person_name, workflow_status, created_at, updated_at
-                    FROM prosopography.persons
-                    WHERE person_id = %s
-                """, (person_id,))
+                cur.execute(_PERSON_BY_ID, (person_id,))
                 row = cur.fetchone()
                 if row:
-                    return Person(
-                        person_id=row[0],
-                        person_name=row[1],
-                        workflow_status=row[2],
-                        created_at=row[3],
-                        updated_at=row[4]
-                    )
+                    return Person(*row)
                 return None
-        finally:
-            release_connection(conn)
 
     def get_by_name(self, person_name: str) -> Optional[Person]:
         """Get a person by name."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT person_id, person_name, workflow_status, created_at, updated_at
-                    FROM prosopography.persons
-                    WHERE person_name = %s
-                """, (person_name,))
+                cur.execute(_PERSON_BY_NAME, (person_name,))
                 row = cur.fetchone()
                 if row:
-                    return Person(
-                        person_id=row[0],
-                        person_name=row[1],
-                        workflow_status=row[2],
-                        created_at=row[3],
-                        updated_at=row[4]
-                    )
+                    return Person(*row)
                 return None
-        finally:
-            release_connection(conn)
 
-    def get_all(self, status_filter: Optional[str] = None) -> List[Person]:
-        """Get all persons, optionally filtered by workflow status."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+    def iter_all(self, status_filter: Optional[str] = None) -> Iterator[Person]:
+        """Stream all persons without materializing the full result set.
+
+        Uses a server-side cursor so memory stays bounded however large
+        the table grows; the connection is held until exhaustion.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(name='persons_stream') as cur:
+                cur.itersize = 1000
                 if status_filter:
-                    cur.execute("""
-                        SELECT person_id, person_name, workflow_status, created_at, updated_at
+                    cur.execute(f"""
+                        SELECT {_PERSON_COLUMNS}
                         FROM prosopography.persons
                         WHERE workflow_status = %s
                         ORDER BY person_name
                     """, (status_filter,))
                 else:
-                    cur.execute("""
-                        SELECT person_id, person_name, workflow_status, created_at, updated_at
+                    cur.execute(f"""
+                        SELECT {_PERSON_COLUMNS}
                         FROM prosopography.persons
                         ORDER BY person_name
                     """)
-                rows = cur.fetchall()
-                return [
-                    Person(
-                        person_id=row[0],
-                        person_name=row[1],
-                        workflow_status=row[2],
-                        created_at=row[3],
-                        updated_at=row[4]
-                    )
-                    for row in rows
-                ]
-        finally:
-            release_connection(conn)
+                for row in cur:
+                    yield Person(*row)
+
+    def get_all(self, status_filter: Optional[str] = None) -> List[Person]:
+        """Get all persons, optionally filtered by workflow status."""
+        return list(self.iter_all(status_filter))
 
     def update_status(self, person_id: int, status: str) -> None:
         """Update a person's workflow status."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     UPDATE prosopography.persons
                     SET workflow_status = %s, updated_at = NOW()
                     WHERE person_id = %s
                 """, (status, person_id))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
+
+    def update_phase1_hash(self, person_id: int, input_hash: Optional[str]) -> None:
+        """Record the hash of the Phase 1 input text for re-run skipping."""
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute("""
+                    UPDATE prosopography.persons
+                    SET phase1_input_hash = %s, updated_at = NOW()
+                    WHERE person_id = %s
+                """, (input_hash, person_id))
+                if owned:
+                    conn.commit()
 
     def delete(self, person_id: int) -> None:
         """Delete a person and all related records (cascades)."""
-        conn = get_connection()
-        try:
+        with self._repo_connection() as (conn, owned):
             with conn.cursor() as cur:
                 cur.execute("""
                     DELETE FROM prosopography.persons
                     WHERE person_id = %s
                 """, (person_id,))
-                conn.commit()
-        finally:
-            release_connection(conn)
+                if owned:
+                    conn.commit()
 
-    def get_summary(self) -> List[dict]:
-        """Get summary view for all persons."""
-        conn = get_connection()
-        try:
-            with conn.cursor() as cur:
+    def iter_summary(self) -> Iterator[dict]:
+        """Stream the summary view row by row via a server-side cursor."""
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor(name='person_summary_stream') as cur:
+                cur.itersize = 1000
                 cur.execute("""
                     SELECT person_id, person_name, workflow_status,
                            event_count, sources_processed, validated_count,
@@ -145,9 +138,8 @@ class PersonRepository:
                     FROM prosopography.person_summary
                     ORDER BY person_name
                 """)
-                rows = cur.fetchall()
-                return [
-                    {
+                for row in cur:
+                    yield {
                         'person_id': row[0],
                         'person_name': row[1],
                         'workflow_status': row[2],
@@ -157,7 +149,35 @@ class PersonRepository:
                         'open_errors': row[6] or 0,
                         'open_warnings': row[7] or 0
                     }
-                    for row in rows
-                ]
-        finally:
-            release_connection(conn)
+
+    def get_summary(self) -> List[dict]:
+        """Get summary view for all persons."""
+        return list(self.iter_summary())
+
+    _SUMMARY_COLUMNS = (
+        'person_id', 'person_name', 'workflow_status', 'event_count',
+        'sources_processed', 'validated_count', 'open_errors', 'open_warnings'
+    )
+
+    def get_summary_columnar(self) -> dict:
+        """Get the summary view as one list per column.
+
+        For aggregate or export consumers a dict of columns avoids
+        building a dict per row; totals become sum(cols['open_errors'])
+        over a flat list (or a numpy array via np.asarray) instead of a
+        dict lookup per person.
+        """
+        with self._repo_connection() as (conn, owned):
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT person_id, person_name, workflow_status,
+                           COALESCE(event_count, 0), COALESCE(sources_processed, 0),
+                           COALESCE(validated_count, 0), COALESCE(open_errors, 0),
+                           COALESCE(open_warnings, 0)
+                    FROM prosopography.person_summary
+                    ORDER BY person_name
+                """)
+                rows = cur.fetchall()
+        if not rows:
+            return {name: [] for name in self._SUMMARY_COLUMNS}
+        return dict(zip(self._SUMMARY_COLUMNS, (list(col) for col in zip(*rows))))
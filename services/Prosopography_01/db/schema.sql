@@ -12,12 +12,20 @@ CREATE TABLE IF NOT EXISTS prosopography.persons (
     person_id SERIAL PRIMARY KEY,
     person_name TEXT NOT NULL UNIQUE,
     workflow_status TEXT NOT NULL DEFAULT 'pending', -- pending, phase1_complete, phase2_reviewed, phase3_in_progress, complete
+    phase1_input_hash TEXT, -- blake2b-128 of the Phase 1 source text, used to skip unchanged re-runs
     created_at TIMESTAMPTZ DEFAULT NOW(),
     updated_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Backfill for databases created before phase1_input_hash existed
+ALTER TABLE prosopography.persons ADD COLUMN IF NOT EXISTS phase1_input_hash TEXT;
+
 CREATE INDEX IF NOT EXISTS idx_persons_status ON prosopography.persons(workflow_status);
 CREATE INDEX IF NOT EXISTS idx_persons_name ON prosopography.persons(person_name);
+-- Covers every column get_all(status_filter) selects, so status-filtered
+-- listings run as index-only scans
+CREATE INDEX IF NOT EXISTS idx_persons_status_covering ON prosopography.persons(workflow_status)
+    INCLUDE (person_id, person_name, phase1_input_hash, created_at, updated_at);
 
 -- ========================================
 -- CANONICAL ORGANIZATIONS
@@ -37,6 +45,8 @@ CREATE TABLE IF NOT EXISTS prosopography.canonical_organizations (
 );
 
 CREATE INDEX IF NOT EXISTS idx_orgs_person ON prosopography.canonical_organizations(person_id);
+-- Case-insensitive name lookup (EventEditor.add_event resolves orgs by name)
+CREATE INDEX IF NOT EXISTS idx_orgs_person_name_ci ON prosopography.canonical_organizations(person_id, LOWER(canonical_name));
 
 -- Name variations that map to canonical orgs
 CREATE TABLE IF NOT EXISTS prosopography.organization_aliases (
@@ -47,6 +57,10 @@ CREATE TABLE IF NOT EXISTS prosopography.organization_aliases (
     UNIQUE(org_id, alias_name)
 );
 
+-- get_aliases reads only alias_name per org: index-only scan
+CREATE INDEX IF NOT EXISTS idx_aliases_org_covering ON prosopography.organization_aliases(org_id)
+    INCLUDE (alias_name);
+
 -- ========================================
 -- CAREER EVENTS
 -- ========================================
@@ -81,6 +95,9 @@ CREATE TABLE IF NOT EXISTS prosopography.career_events (
 );
 
 CREATE INDEX IF NOT EXISTS idx_events_person ON prosopography.career_events(person_id);
+-- Serves the per-person status counts (count_for_person) without heap fetches
+CREATE INDEX IF NOT EXISTS idx_events_person_status_covering ON prosopography.career_events(person_id)
+    INCLUDE (validation_status);
 CREATE INDEX IF NOT EXISTS idx_events_status ON prosopography.career_events(validation_status);
 CREATE INDEX IF NOT EXISTS idx_events_llm_status ON prosopography.career_events(llm_status);
 CREATE INDEX IF NOT EXISTS idx_events_org ON prosopography.career_events(org_id);
@@ -116,6 +133,17 @@ CREATE INDEX IF NOT EXISTS idx_evidence_event ON prosopography.source_evidence(e
 CREATE INDEX IF NOT EXISTS idx_evidence_source ON prosopography.source_evidence(source_url);
 CREATE INDEX IF NOT EXISTS idx_evidence_type ON prosopography.source_evidence(evidence_type);
 CREATE INDEX IF NOT EXISTS idx_evidence_chunk ON prosopography.source_evidence(chunk_id);
+CREATE INDEX IF NOT EXISTS idx_evidence_event_source ON prosopography.source_evidence(event_id, source_url);
+
+-- Optional: HyperLogLog extension for approximate distinct counts on
+-- large evidence sets. Skipped silently where the extension isn't
+-- available (many managed Postgres tiers don't ship it).
+DO $$
+BEGIN
+    CREATE EXTENSION IF NOT EXISTS hll;
+EXCEPTION WHEN OTHERS THEN
+    NULL;
+END $$;
 
 -- ========================================
 -- USER CORRECTIONS
@@ -154,6 +182,10 @@ CREATE TABLE IF NOT EXISTS prosopography.verification_issues (
 
     issue_type TEXT NOT NULL, -- temporal_coherence, completeness, quote_support, duplicate_candidate, classification
     severity TEXT NOT NULL, -- error, warning, info
+    -- Numeric severity for indexable ORDER BY (error < warning < info)
+    severity_rank SMALLINT GENERATED ALWAYS AS (
+        CASE severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
+    ) STORED,
     description TEXT NOT NULL,
 
     -- Resolution tracking
@@ -164,9 +196,20 @@ CREATE TABLE IF NOT EXISTS prosopography.verification_issues (
     detected_at TIMESTAMPTZ DEFAULT NOW()
 );
 
+-- Backfill for databases created before severity_rank existed
+ALTER TABLE prosopography.verification_issues ADD COLUMN IF NOT EXISTS severity_rank SMALLINT GENERATED ALWAYS AS (
+    CASE severity WHEN 'error' THEN 1 WHEN 'warning' THEN 2 ELSE 3 END
+) STORED;
+
 CREATE INDEX IF NOT EXISTS idx_issues_event ON prosopography.verification_issues(event_id);
 CREATE INDEX IF NOT EXISTS idx_issues_resolved ON prosopography.verification_issues(resolved);
 CREATE INDEX IF NOT EXISTS idx_issues_severity ON prosopography.verification_issues(severity);
+CREATE INDEX IF NOT EXISTS idx_issues_severity_resolved ON prosopography.verification_issues(severity, resolved);
+CREATE INDEX IF NOT EXISTS idx_issues_open_rank ON prosopography.verification_issues(severity_rank) WHERE NOT resolved;
+-- Partial indexes: open issues are a small fraction of the table, so
+-- the NOT resolved filters scan only live rows
+CREATE INDEX IF NOT EXISTS idx_issues_open_event ON prosopography.verification_issues(event_id) WHERE NOT resolved;
+CREATE INDEX IF NOT EXISTS idx_issues_open_severity ON prosopography.verification_issues(severity) WHERE NOT resolved;
 
 -- ========================================
 -- DECISION LOG (for Phase 3 incremental processing)
@@ -0,0 +1,79 @@
+"""Deferred-commit transaction support for repositories."""
+
+import threading
+from contextlib import contextmanager
+
+from .connection import get_connection, release_connection
+
+# One binding per thread, shared by every repository instance, so that
+# repositories called inside another repository's transaction() block
+# join the same connection instead of opening their own.
+_txn_local = threading.local()
+
+
+class TransactionMixin:
+    """Adds `with repo.transaction():` deferred-commit support.
+
+    Outside a transaction each write method commits as before. Inside the
+    block, every method on the repository shares one connection and the
+    commit (or rollback on error) happens once at exit, so a unit of work
+    spanning many writes pays a single COMMIT instead of one per call.
+
+    The active connection is bound per thread and shared by all
+    repositories, so a transaction opened on one repository is joined
+    by every repository call on that thread until it exits - a unit of
+    work can span orgs, events, evidence, and issues atomically - while
+    other threads (as under Streamlit) stay isolated.
+    """
+
+    @property
+    def _txn_local(self) -> threading.local:
+        return _txn_local
+
+    @property
+    def _txn_conn(self):
+        return getattr(self._txn_local, 'conn', None)
+
+    @contextmanager
+    def transaction(self, synchronous_commit: bool = True):
+        """Run a block of repository calls as one database transaction.
+
+        Pass synchronous_commit=False on bulk ingest paths to skip the
+        WAL flush wait at COMMIT; a server crash could then lose the
+        last few transactions but never corrupt data.
+        """
+        if self._txn_conn is not None:
+            # Already inside a transaction on this thread: join it
+            yield self
+            return
+        conn = get_connection()
+        self._txn_local.conn = conn
+        try:
+            if not synchronous_commit:
+                with conn.cursor() as cur:
+                    cur.execute("SET LOCAL synchronous_commit = off")
+            yield self
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._txn_local.conn = None
+            release_connection(conn)
+
+    @contextmanager
+    def _repo_connection(self):
+        """Yield (conn, owned) - the transaction connection, or a fresh one.
+
+        owned is True when this call acquired the connection itself and is
+        therefore responsible for committing its own writes.
+        """
+        conn = self._txn_conn
+        if conn is not None:
+            yield conn, False
+        else:
+            conn = get_connection()
+            try:
+                yield conn, True
+            finally:
+                release_connection(conn)
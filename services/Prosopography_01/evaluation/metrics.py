@@ -11,10 +11,17 @@ from db import (
     CorrectionRepository, IssueRepository,
     get_connection, release_connection
 )
+from db.cache import TTLCache
 
 
 class MetricsCalculator:
-    """Service for calculating evaluation metrics."""
+    """Service for calculating evaluation metrics.
+
+    Computed summaries are held in a short TTL cache so a dashboard
+    polling faster than once per few seconds reuses the last result
+    instead of re-running the aggregate queries. Call invalidate()
+    after writes that should be visible immediately.
+    """
 
     def __init__(self):
         """Initialize the metrics calculator."""
@@ -23,6 +30,15 @@ class MetricsCalculator:
         self.evidence_repo = EvidenceRepository()
         self.correction_repo = CorrectionRepository()
         self.issue_repo = IssueRepository()
+        self._cache = TTLCache(maxsize=1024, ttl=5)
+
+    def invalidate(self, person_id: Optional[int] = None) -> None:
+        """Drop cached metrics for one person, or everything when None."""
+        if person_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(("person", person_id))
+            self._cache.pop(("dashboard",))
 
     def calculate_extraction_quality(self, person_id: int) -> Dict[str, Any]:
         """Calculate extraction quality metrics for a person.
@@ -33,7 +49,6 @@ class MetricsCalculator:
         Returns:
             Dictionary with extraction quality metrics
         """
-        events = self.event_repo.get_for_person(person_id)
         counts = self.event_repo.count_for_person(person_id)
 
         total = counts["total"]
@@ -66,10 +81,8 @@ class MetricsCalculator:
         Returns:
             Dictionary with field accuracy metrics
         """
-        events = self.event_repo.get_for_person(person_id)
+        total_events = self.event_repo.count_total_for_person(person_id)
         corrections_by_field = self.correction_repo.count_by_field(person_id)
-
-        total_events = len(events)
         fields = ["organization", "time_start", "time_end", "roles", "locations"]
 
         accuracy = {}
@@ -97,30 +110,32 @@ class MetricsCalculator:
         events = self.event_repo.get_for_person(person_id)
         events = [e for e in events if e.validation_status != "rejected"]
 
-        # Count events validated by multiple sources
-        multi_source_events = 0
-        for event in events:
-            source_count = self.evidence_repo.count_unique_sources_for_event(event.event_id)
-            if source_count >= 2:
-                multi_source_events += 1
+        # Count events validated by multiple sources (one query for all events)
+        source_counts = self.evidence_repo.count_unique_sources_for_events(
+            [e.event_id for e in events]
+        )
+        multi_source_events = sum(
+            1 for e in events if source_counts.get(e.event_id, 0) >= 2
+        )
 
-        # Get sources processed
+        # Get sources processed: per-type counts and the grand total in one
+        # query via GROUPING SETS (the NULL source_type row is the total)
         conn = get_connection()
         try:
             with conn.cursor() as cur:
-                cur.execute("""
-                    SELECT COUNT(*) FROM prosopography.sources_processed
-                    WHERE person_id = %s
-                """, (person_id,))
-                sources_processed = cur.fetchone()[0]
-
                 cur.execute("""
                     SELECT source_type, COUNT(*) as count
                     FROM prosopography.sources_processed
                     WHERE person_id = %s
-                    GROUP BY source_type
+                    GROUP BY GROUPING SETS ((source_type), ())
                 """, (person_id,))
-                by_type = {row[0]: row[1] for row in cur.fetchall()}
+                sources_processed = 0
+                by_type = {}
+                for row in cur.fetchall():
+                    if row[0] is None:
+                        sources_processed = row[1]
+                    else:
+                        by_type[row[0]] = row[1]
         finally:
             release_connection(conn)
 
@@ -167,11 +182,15 @@ class MetricsCalculator:
         Returns:
             Dictionary with all metrics
         """
+        cached = self._cache.get(("person", person_id))
+        if cached is not None:
+            return cached
+
         person = self.person_repo.get_by_id(person_id)
         if not person:
             raise ValueError(f"Person {person_id} not found")
 
-        return {
+        metrics = {
             "person_id": person_id,
             "person_name": person.person_name,
             "workflow_status": person.workflow_status,
@@ -180,35 +199,64 @@ class MetricsCalculator:
             "source_coverage": self.calculate_source_coverage(person_id),
             "issues": self.calculate_issue_metrics(person_id)
         }
+        self._cache.set(("person", person_id), metrics)
+        return metrics
 
     def get_dashboard_summary(self) -> Dict[str, Any]:
         """Get summary metrics for the dashboard.
 
+        Aggregates across all persons in one query instead of two count
+        queries per person.
+
         Returns:
             Dictionary with dashboard summary
         """
-        persons = self.person_repo.get_all()
-
-        status_counts = {}
-        total_events = 0
-        total_validated = 0
-        total_issues = 0
+        cached = self._cache.get(("dashboard",))
+        if cached is not None:
+            return cached
 
-        for person in persons:
-            status = person.workflow_status
-            status_counts[status] = status_counts.get(status, 0) + 1
-
-            events = self.event_repo.count_for_person(person.person_id)
-            total_events += events["total"]
-            total_validated += events.get("validated", 0)
+        # One plan computes everything: per-status person counts plus
+        # event and open-issue aggregates via LATERAL subqueries
+        conn = get_connection()
+        try:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT p.workflow_status,
+                           COUNT(*) AS persons,
+                           COALESCE(SUM(ev.total), 0) AS total_events,
+                           COALESCE(SUM(ev.validated), 0) AS validated,
+                           COALESCE(SUM(iss.open_count), 0) AS open_issues
+                    FROM prosopography.persons p
+                    LEFT JOIN LATERAL (
+                        SELECT COUNT(*) AS total,
+                               COUNT(*) FILTER (WHERE validation_status = 'validated') AS validated
+                        FROM prosopography.career_events ce
+                        WHERE ce.person_id = p.person_id
+                    ) ev ON TRUE
+                    LEFT JOIN LATERAL (
+                        SELECT COUNT(*) AS open_count
+                        FROM prosopography.verification_issues vi
+                        JOIN prosopography.career_events ce2 ON ce2.event_id = vi.event_id
+                        WHERE ce2.person_id = p.person_id AND NOT vi.resolved
+                    ) iss ON TRUE
+                    GROUP BY p.workflow_status
+                """)
+                rows = cur.fetchall()
+        finally:
+            release_connection(conn)
 
-            issues = self.issue_repo.count_by_severity(person.person_id)
-            total_issues += sum(c["open"] for c in issues.values())
+        status_counts = {row[0]: row[1] for row in rows}
+        total_persons = sum(row[1] for row in rows)
+        total_events = sum(row[2] for row in rows)
+        total_validated = sum(row[3] for row in rows)
+        total_issues = sum(row[4] for row in rows)
 
-        return {
-            "total_persons": len(persons),
+        summary = {
+            "total_persons": total_persons,
             "persons_by_status": status_counts,
             "total_events": total_events,
             "total_validated": total_validated,
             "total_open_issues": total_issues
         }
+        self._cache.set(("dashboard",), summary)
+        return summary
@@ -0,0 +1,78 @@
+"""Disk-backed cache for LLM responses."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """SQLite-backed cache of raw LLM response text.
+
+    At low temperature the same (model, system prompt, user prompt)
+    triple yields the same verdict, so iterative pipeline reruns and
+    re-processed persons with unchanged inputs can skip the network
+    call entirely. Keys are SHA-256 over the canonical JSON of the
+    triple; entries expire after a TTL so a model-side change
+    eventually flows through. Safe to share across threads.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, ttl: int = 7 * 24 * 3600):
+        if db_path is None:
+            db_path = Path(__file__).parent / "cache" / "llm_responses.db"
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(model: str, system_prompt: Optional[str], prompt: str) -> str:
+        payload = json.dumps(
+            {"model": model, "system": system_prompt, "user": prompt},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, model: str, system_prompt: Optional[str], prompt: str) -> Optional[str]:
+        """Return the cached response text, or None on miss/expiry."""
+        key = self._key(model, system_prompt, prompt)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if row is not None and row[1] > time.time():
+            self.hits += 1
+            return row[0]
+        self.misses += 1
+        return None
+
+    def set(self, model: str, system_prompt: Optional[str], prompt: str, response: str) -> None:
+        """Store a response; overwrites and re-arms the TTL on repeat."""
+        key = self._key(model, system_prompt, prompt)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, response, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, response, time.time() + self.ttl)
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
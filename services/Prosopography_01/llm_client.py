@@ -1,24 +1,50 @@
 """LLM client for Cohere API."""
 
+import asyncio
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent))
 
-from typing import Dict, Any, Optional
+# Keep sys.path free of duplicates: this module is imported by every
+# phase script, each of which prepends this directory itself
+_here = str(Path(__file__).parent)
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+from typing import Dict, Any, Iterator, List, Optional
 import cohere
 from dotenv import load_dotenv
 
+from llm_cache import LLMCache
 from utils import load_config, parse_json_response
 
-load_dotenv()
+# Single-flight table: concurrent generate_json calls with identical
+# model/system/user inputs (retries, re-queued workers) share one
+# in-flight request instead of each paying for its own completion.
+# Module-level so every client instance in the process coalesces; the
+# key includes the model, so differently-routed clients never collide.
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
 
 
 class LLMClient:
     """Client for interacting with Cohere's LLM API."""
 
-    def __init__(self, config: Optional[Dict[str, Any]] = None):
-        """Initialize the LLM client."""
+    def __init__(self, config: Optional[Dict[str, Any]] = None, model: Optional[str] = None):
+        """Initialize the LLM client.
+
+        Args:
+            config: Optional configuration dict
+            model: Override the configured model, e.g. to route simple
+                steps to a smaller, cheaper model
+        """
+        # Deferred from import time so importing this module doesn't
+        # stat the filesystem for a .env file
+        load_dotenv()
         self.config = config or load_config()
         api_key = os.getenv(self.config.get("api_key_env_var", "COHERE_API_KEY"))
         if not api_key:
@@ -26,13 +52,41 @@ class LLMClient:
 
         # Try to detect Cohere SDK version
         self.client = cohere.Client(api_key)
-        self.model = self.config.get("model", "command-r-plus")
+        # Async client is created lazily per event loop (see _async_client)
+        self._api_key = api_key
+        self._aclient = None
+        self._aclient_loop = None
+        self.model = model or self.config.get("model", "command-r-plus")
         self.temperature = self.config.get("temperature", 0.1)
         self.max_tokens = self.config.get("max_tokens", 8000)
 
+        # Optional response cache: reruns over unchanged inputs skip
+        # the network call. Hit/miss counters live on the cache object.
+        cache_config = self.config.get("llm_cache", {})
+        self.response_cache = (
+            LLMCache(ttl=cache_config.get("ttl_seconds", 7 * 24 * 3600))
+            if cache_config.get("enabled", False) else None
+        )
+
         # Detect API version by checking available methods/signatures
         self._use_v2_api = self._detect_api_version()
 
+    def _async_client(self) -> "cohere.AsyncClient":
+        """Async client bound to the currently running event loop.
+
+        The pipeline drives its async steps through separate
+        asyncio.run() calls, each with a fresh loop. An AsyncClient's
+        keep-alive connections stay bound to the loop that opened them,
+        so one client reused across loops fails later steps with
+        "Event loop is closed". Keep one client per loop, replaced
+        whenever the running loop changes.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = cohere.AsyncClient(self._api_key)
+            self._aclient_loop = loop
+        return self._aclient
+
     def _detect_api_version(self) -> bool:
         """Detect if we should use v2 API (messages) or v1 API (message/preamble)."""
         import inspect
@@ -87,12 +141,186 @@ class LLMClient:
             )
             return response.text
 
-    def generate_json(
+    async def generate_async(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Async variant of generate, for overlapping many requests.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system prompt to set context
+            temperature: Override default temperature
+            max_tokens: Override default max_tokens
+
+        Returns:
+            The generated text response
+        """
+        if self._use_v2_api:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            response = await self._async_client().chat(
+                model=self.model,
+                messages=messages,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens or self.max_tokens
+            )
+            return response.message.content[0].text
+        else:
+            response = await self._async_client().chat(
+                model=self.model,
+                message=prompt,
+                preamble=system_prompt,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens or self.max_tokens
+            )
+            return response.text
+
+    def generate_stream(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """Generate a response, yielding text deltas as they arrive.
+
+        Lets callers consume (display, accumulate) output while the rest
+        of the completion is still being produced, instead of waiting for
+        the full response. Yields text fragments in order.
+        """
+        if self._use_v2_api:
+            messages = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            messages.append({"role": "user", "content": prompt})
+
+            for event in self.client.chat_stream(
+                model=self.model,
+                messages=messages,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens or self.max_tokens
+            ):
+                if event.type == "content-delta":
+                    yield event.delta.message.content.text
+        else:
+            for event in self.client.chat_stream(
+                model=self.model,
+                message=prompt,
+                preamble=system_prompt,
+                temperature=temperature or self.temperature,
+                max_tokens=max_tokens or self.max_tokens
+            ):
+                if event.event_type == "text-generation":
+                    yield event.text
+
+    async def generate_many_async(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[str]:
+        """Generate responses for many prompts with bounded concurrency.
+
+        Up to `concurrency` requests are in flight at once, so total wall
+        time is roughly len(prompts)/concurrency round trips instead of
+        one per prompt. Each prompt retries with jittered exponential
+        backoff; results come back in prompt order. With
+        return_exceptions=True, a prompt that exhausts its retries yields
+        its exception in place instead of failing the whole batch.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(prompt: str) -> str:
+            async with semaphore:
+                last_error = None
+                for attempt in range(max_retries):
+                    try:
+                        return await self.generate_async(
+                            prompt=prompt,
+                            system_prompt=system_prompt,
+                            temperature=temperature,
+                            max_tokens=max_tokens
+                        )
+                    except Exception as e:
+                        last_error = e
+                        if attempt < max_retries - 1:
+                            await asyncio.sleep(self._retry_delay(e, attempt))
+                raise last_error
+
+        return list(await asyncio.gather(
+            *(one(p) for p in prompts), return_exceptions=return_exceptions
+        ))
+
+    def generate_many(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        concurrency: int = 8,
+        max_retries: int = 3,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        return_exceptions: bool = False
+    ) -> List[str]:
+        """Synchronous wrapper around generate_many_async."""
+        return asyncio.run(self.generate_many_async(
+            prompts,
+            system_prompt=system_prompt,
+            concurrency=concurrency,
+            max_retries=max_retries,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            return_exceptions=return_exceptions
+        ))
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        """Exponential backoff with jitter to avoid synchronized retries."""
+        return 2 ** attempt + random.uniform(0, 2 ** attempt * 0.3)
+
+    @classmethod
+    def _retry_delay(cls, error: Exception, attempt: int) -> float:
+        """How long to wait before retrying after an error.
+
+        Rate-limit responses carry a Retry-After header saying exactly
+        when capacity returns; honoring it beats guessing, and keeps a
+        burst of workers from re-synchronizing on the same backoff
+        schedule and re-tripping the limit. Anything without the header
+        (transient server errors, timeouts) falls back to jittered
+        exponential backoff.
+        """
+        headers = (
+            getattr(getattr(error, "response", None), "headers", None)
+            or getattr(error, "headers", None)
+        )
+        if headers:
+            retry_after = headers.get("retry-after") or headers.get("Retry-After")
+            if retry_after:
+                try:
+                    # Small jitter on top so waiting workers don't all
+                    # return at the same instant
+                    return float(retry_after) + random.uniform(0, 1.0)
+                except ValueError:
+                    pass
+        return cls._backoff(attempt)
+
+    def generate_json(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        stream: bool = False
     ) -> Dict[str, Any]:
         """Generate a JSON response from the LLM.
 
@@ -101,17 +329,114 @@ class LLMClient:
             system_prompt: Optional system prompt to set context
             temperature: Override default temperature
             max_tokens: Override default max_tokens
+            stream: Accumulate the response via the streaming API;
+                worthwhile for long completions, overhead for short ones
 
         Returns:
             Parsed JSON response as a dictionary
         """
-        response_text = self.generate(
-            prompt=prompt,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens
+        if self.response_cache is not None:
+            cached = self.response_cache.get(self.model, system_prompt, prompt)
+            if cached is not None:
+                return parse_json_response(cached)
+
+        key = LLMCache._key(self.model, system_prompt, prompt)
+        with _inflight_lock:
+            flight = _inflight.get(key)
+            if flight is None:
+                flight = Future()
+                _inflight[key] = flight
+                leader = True
+            else:
+                leader = False
+
+        if not leader:
+            # The flight resolves to the raw text; each caller parses
+            # its own copy so downstream mutation of one result never
+            # leaks into another caller's
+            return parse_json_response(flight.result())
+
+        try:
+            if stream:
+                response_text = "".join(self.generate_stream(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                ))
+            else:
+                response_text = self.generate(
+                    prompt=prompt,
+                    system_prompt=system_prompt,
+                    temperature=temperature,
+                    max_tokens=max_tokens
+                )
+            result = parse_json_response(response_text)
+            # Cache only after a successful parse so malformed completions
+            # are retried rather than replayed
+            if self.response_cache is not None:
+                self.response_cache.set(self.model, system_prompt, prompt, response_text)
+            flight.set_result(response_text)
+            return result
+        except BaseException as e:
+            # Followers see the same failure; their own retry loops
+            # take it from there
+            flight.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+
+    def generate_json_batch(
+        self,
+        prompts: List[str],
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Answer several independent prompts in one request.
+
+        Concatenates the prompts as numbered items and asks for a JSON
+        array with one object per item, amortizing a single network
+        round trip across the batch. If the model returns the wrong
+        number of items the batch falls back to one call per prompt, so
+        callers always get len(prompts) results in order.
+        """
+        if not prompts:
+            return []
+        if len(prompts) == 1:
+            return [self.generate_json(
+                prompts[0], system_prompt=system_prompt,
+                temperature=temperature, max_tokens=max_tokens
+            )]
+
+        combined = (
+            "Answer each of the following items independently. "
+            "Return a JSON array containing exactly one JSON object per "
+            "item, in the same order, and nothing else.\n\n"
+            + "\n\n".join(
+                f"### Item {i + 1}\n{prompt}"
+                for i, prompt in enumerate(prompts)
+            )
         )
-        return parse_json_response(response_text)
+        try:
+            result = self.generate_json(
+                combined, system_prompt=system_prompt,
+                temperature=temperature, max_tokens=max_tokens
+            )
+            if isinstance(result, list) and len(result) == len(prompts):
+                return result
+        except ValueError:
+            pass
+
+        # Batch answer didn't line up with the items: retry individually
+        return [
+            self.generate_json(
+                prompt, system_prompt=system_prompt,
+                temperature=temperature, max_tokens=max_tokens
+            )
+            for prompt in prompts
+        ]
 
     def generate_with_retry(
         self,
@@ -134,8 +459,7 @@ class LLMClient:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    import time
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    time.sleep(self._retry_delay(e, attempt))
 
         raise last_error
 
@@ -160,7 +484,6 @@ class LLMClient:
             except Exception as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    import time
-                    time.sleep(2 ** attempt)
+                    time.sleep(self._retry_delay(e, attempt))
 
         raise last_error
@@ -1,15 +1,34 @@
 # Phase 1: Initial extraction from Wikipedia
-# Import directly from submodules when needed:
-# from phase1.pipeline import Phase1Pipeline
-# from phase1.extract_entities import extract_entities_from_chunk
-# etc.
-
-__all__ = [
-    'Phase1Pipeline',
-    'extract_entities_from_chunk',
-    'extract_entities_parallel',
-    'discover_canonical_orgs',
-    'build_org_mapping',
-    'assemble_events',
-    'verify_events'
-]
+#
+# Submodules are imported lazily (PEP 562): pulling one symbol from the
+# package no longer drags in the LLM client and DB layer for the rest.
+import importlib
+
+_lazy = {
+    'Phase1Pipeline': '.pipeline',
+    'extract_entities_from_chunk': '.extract_entities',
+    'extract_entities_parallel': '.extract_entities',
+    'discover_canonical_orgs': '.discover_orgs',
+    'extract_and_discover': '.extract_and_discover',
+    'build_org_mapping': '.discover_orgs',
+    'assemble_events': '.assemble_events',
+    'discover_and_assemble': '.discover_and_assemble',
+    'verify_events': '.verify_events',
+    'verify_events_batch': '.verify_events',
+}
+
+__all__ = list(_lazy)
+
+
+def __getattr__(name):
+    try:
+        module = importlib.import_module(_lazy[name], __name__)
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    attr = getattr(module, name)
+    globals()[name] = attr  # cache so __getattr__ runs once per symbol
+    return attr
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy))
@@ -5,10 +5,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
-import json
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, parse_json_response, dumps_compact
+from phase1.compress import compress_quotes
 
 
 def assemble_events(
@@ -33,59 +33,156 @@ def assemble_events(
 
     system_prompt = load_prompt("phase1_assemble_events", config)
 
-    # Prepare input data
+    # Long biographies blow past context limits in a single prompt;
+    # split the roles into bounded batches with shared context instead
+    roles = entities.get("roles", [])
+    threshold = config.get("phase1", {}).get("assemble_role_threshold", 40)
+    if len(roles) > threshold:
+        return _assemble_events_batched(
+            entities, canonical_orgs, llm_client, system_prompt, threshold
+        )
+
+    try:
+        user_prompt, quotes_by_id = _build_user_prompt(entities, canonical_orgs)
+        result = llm_client.generate_json(
+            prompt=user_prompt,
+            system_prompt=system_prompt
+        )
+        return {
+            "events": [
+                _resolve_quote_refs(_validate_event(event, idx), quotes_by_id)
+                for idx, event in enumerate(result.get("events", []))
+            ],
+            "deduplication_log": result.get("deduplication_log", []),
+            "unprocessed_roles": result.get("unprocessed_roles", [])
+        }
+
+    except Exception as e:
+        return {
+            "events": [],
+            "deduplication_log": [],
+            "unprocessed_roles": [],
+            "error": str(e)
+        }
+
+
+def _build_user_prompt(
+    entities: Dict[str, List],
+    canonical_orgs: List[Dict[str, Any]]
+) -> tuple:
+    """Build the assembly user prompt in reference form.
+
+    Organizations already went through canonical resolution and
+    locations live inside the quotes, so instead of re-sending the full
+    entities dict the prompt carries compact role and time-marker
+    references plus one shared quote table - quotes are the bulk of the
+    payload and most are shared between entities. Returns (prompt,
+    quotes_by_id) so the caller can resolve quote IDs in the response
+    back to verbatim text.
+    """
+    quotes_by_id: Dict[str, str] = {}
+    quote_index: Dict[str, str] = {}
+
+    def quote_ids(quotes: List[str]) -> List[str]:
+        ids = []
+        for quote in compress_quotes(quotes)[:2]:
+            qid = quote_index.get(quote)
+            if qid is None:
+                qid = f"Q{len(quote_index) + 1}"
+                quote_index[quote] = qid
+                quotes_by_id[qid] = quote
+            ids.append(qid)
+        return ids
+
     input_data = {
-        "entities": {
-            "time_markers": entities.get("time_markers", []),
-            "organizations": entities.get("organizations", []),
-            "roles": entities.get("roles", []),
-            "locations": entities.get("locations", [])
-        },
+        "role_refs": [
+            {
+                "id": idx,
+                "title": role.get("title", ""),
+                "quote_ids": quote_ids(role.get("quotes", []))
+            }
+            for idx, role in enumerate(entities.get("roles", []))
+        ],
+        "time_markers": [
+            {
+                "id": idx,
+                "text": marker.get("text", ""),
+                "type": marker.get("type", ""),
+                "quote_ids": quote_ids(marker.get("quotes", []))
+            }
+            for idx, marker in enumerate(entities.get("time_markers", []))
+        ],
         "canonical_organizations": canonical_orgs
     }
-
-    user_prompt = f"""Assemble career events from these extracted entities and canonical organizations:
+    prompt = f"""Assemble career events from these extracted entities and canonical organizations:
 
 INPUT DATA:
-{json.dumps(input_data, indent=2)}
+{dumps_compact(input_data)}
+
+QUOTES (quote_ids above refer to this table):
+{dumps_compact(quotes_by_id)}
 
 Create ONE event for EVERY role. Return ONLY valid JSON."""
+    return prompt, quotes_by_id
 
-    try:
-        result = llm_client.generate_json(
-            prompt=user_prompt,
-            system_prompt=system_prompt
-        )
 
-        events = result.get("events", [])
-        dedup_log = result.get("deduplication_log", [])
-        unprocessed = result.get("unprocessed_roles", [])
-
-        # Validate and clean up events
-        validated_events = []
-        for event in events:
-            validated_event = {
-                "event_id": event.get("event_id", f"E{len(validated_events)+1:03d}"),
-                "event_type": event.get("event_type", "career_position"),
-                "canonical_org_id": event.get("canonical_org_id"),
-                "canonical_org_name": event.get("canonical_org_name", ""),
-                "time_period": event.get("time_period", {}),
-                "roles": event.get("roles", []),
-                "locations": event.get("locations", []),
-                "supporting_quotes": event.get("supporting_quotes", []),
-                "source_entity_ids": event.get("source_entity_ids", {}),
-                "confidence": event.get("confidence", "medium"),
-                "merged_from": event.get("merged_from", []),
-                "notes": event.get("notes", "")
-            }
-            validated_events.append(validated_event)
+def _resolve_quote_refs(event: Dict[str, Any], quotes_by_id: Dict[str, str]) -> Dict[str, Any]:
+    """Expand quote-ID references in supporting_quotes to verbatim text.
 
-        return {
-            "events": validated_events,
-            "deduplication_log": dedup_log,
-            "unprocessed_roles": unprocessed
-        }
+    The model may still inline a quote it considers novel; anything not
+    found in the table passes through unchanged.
+    """
+    event["supporting_quotes"] = [
+        quotes_by_id.get(quote, quote) for quote in event.get("supporting_quotes", [])
+    ]
+    return event
+
+
+def _validate_event(event: Dict[str, Any], idx: int) -> Dict[str, Any]:
+    """Fill defaults and normalize one assembled event."""
+    return {
+        "event_id": event.get("event_id", f"E{idx+1:03d}"),
+        "event_type": event.get("event_type", "career_position"),
+        "canonical_org_id": event.get("canonical_org_id"),
+        "canonical_org_name": event.get("canonical_org_name", ""),
+        "time_period": event.get("time_period", {}),
+        "roles": event.get("roles", []),
+        "locations": event.get("locations", []),
+        "supporting_quotes": event.get("supporting_quotes", []),
+        "source_entity_ids": event.get("source_entity_ids", {}),
+        "confidence": event.get("confidence", "medium"),
+        "merged_from": event.get("merged_from", []),
+        "notes": event.get("notes", "")
+    }
 
+
+def _assemble_events_batched(
+    entities: Dict[str, List],
+    canonical_orgs: List[Dict[str, Any]],
+    llm_client: LLMClient,
+    system_prompt: str,
+    batch_size: int
+) -> Dict[str, Any]:
+    """Assemble events in role batches, each with the shared context.
+
+    Every batch prompt carries the full time_markers, organizations,
+    locations, and canonical orgs (the glue the model needs for any
+    role) but only a slice of the roles, bounding prompt size. Batches
+    run concurrently through generate_many; event IDs are renumbered
+    across batches so the merged result looks like one call's output.
+    """
+    roles = entities.get("roles", [])
+    prompts = []
+    quote_pools = []
+    for start in range(0, len(roles), batch_size):
+        batch_entities = dict(entities)
+        batch_entities["roles"] = roles[start:start + batch_size]
+        prompt, quotes_by_id = _build_user_prompt(batch_entities, canonical_orgs)
+        prompts.append(prompt)
+        quote_pools.append(quotes_by_id)
+
+    try:
+        responses = llm_client.generate_many(prompts, system_prompt=system_prompt)
     except Exception as e:
         return {
             "events": [],
@@ -94,6 +191,29 @@ Create ONE event for EVERY role. Return ONLY valid JSON."""
             "error": str(e)
         }
 
+    events = []
+    dedup_log = []
+    unprocessed = []
+    for response, quotes_by_id in zip(responses, quote_pools):
+        try:
+            result = parse_json_response(response)
+        except ValueError:
+            continue
+        for event in result.get("events", []):
+            validated = _resolve_quote_refs(
+                _validate_event(event, len(events)), quotes_by_id
+            )
+            validated["event_id"] = f"E{len(events)+1:03d}"
+            events.append(validated)
+        dedup_log.extend(result.get("deduplication_log", []))
+        unprocessed.extend(result.get("unprocessed_roles", []))
+
+    return {
+        "events": events,
+        "deduplication_log": dedup_log,
+        "unprocessed_roles": unprocessed
+    }
+
 
 def extract_time_info(time_period: Dict[str, Any]) -> tuple:
     """Extract start and end from time period.
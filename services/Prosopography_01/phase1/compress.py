@@ -0,0 +1,53 @@
+"""Prompt payload compression for phase 1 LLM calls."""
+
+import re
+from typing import Any, Dict, List
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def compress_quotes(quotes: List[str], max_chars: int = 300) -> List[str]:
+    """Shrink a list of supporting quotes for prompt embedding.
+
+    Collapses runs of whitespace, drops duplicate quotes
+    (case-insensitive), and truncates anything beyond max_chars at a
+    word boundary. Entity names, IDs, and dates survive untouched
+    because only whitespace and tails are removed.
+    """
+    seen = set()
+    compressed = []
+    for quote in quotes:
+        if not quote:
+            continue
+        text = _WHITESPACE.sub(' ', str(quote)).strip()
+        if len(text) > max_chars:
+            text = text[:max_chars].rsplit(' ', 1)[0] + ' ...'
+        key = text.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        compressed.append(text)
+    return compressed
+
+
+def compress_entities(entities: Dict[str, List], max_chars: int = 300) -> Dict[str, List]:
+    """Return a copy of an entity dict with quote fields compressed.
+
+    Works on the phase 1 entity shape: each entity list item may carry a
+    'quotes' list or a single 'quote' string; everything else is passed
+    through unchanged.
+    """
+    compressed: Dict[str, List] = {}
+    for key, items in entities.items():
+        new_items = []
+        for item in items:
+            if isinstance(item, dict):
+                if 'quotes' in item:
+                    item = dict(item)
+                    item['quotes'] = compress_quotes(item['quotes'], max_chars)
+                elif 'quote' in item and item['quote']:
+                    item = dict(item)
+                    item['quote'] = _WHITESPACE.sub(' ', str(item['quote'])).strip()
+            new_items.append(item)
+        compressed[key] = new_items
+    return compressed
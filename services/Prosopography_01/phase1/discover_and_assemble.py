@@ -0,0 +1,122 @@
+"""Fused Steps 2+3: discover canonical orgs and assemble events in one call."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from typing import Dict, Any, List, Optional
+
+from llm_client import LLMClient
+from utils import load_prompt, load_config, dumps_compact
+from phase1.compress import compress_entities
+
+
+def discover_and_assemble(
+    entities: Dict[str, List],
+    llm_client: LLMClient,
+    config: Optional[Dict[str, Any]] = None,
+    person_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """Run org discovery and event assembly as one LLM call.
+
+    The separate Step 2 and Step 3 calls serialize the same entity
+    payload twice and pay two sequential round trips, with the
+    canonical orgs acting only as a pass-through intermediate. This
+    fused call sends the entities once and asks for both outputs in a
+    single response.
+
+    Args:
+        entities: Dictionary with time_markers, organizations, roles, locations
+        llm_client: LLM client instance
+        config: Optional configuration
+        person_name: Optional person name (helps infer nationality)
+
+    Returns:
+        Dictionary with canonical_organizations, events,
+        deduplication_log, and unprocessed_roles
+    """
+    if config is None:
+        config = load_config()
+
+    empty = {
+        "canonical_organizations": [],
+        "events": [],
+        "deduplication_log": [],
+        "unprocessed_roles": []
+    }
+    if not entities.get("organizations") and not entities.get("roles"):
+        return empty
+
+    system_prompt = (
+        load_prompt("phase1_canonical_orgs", config)
+        + "\n\n=== SECOND TASK (same response) ===\n\n"
+        + load_prompt("phase1_assemble_events", config)
+        + "\n\nPerform BOTH tasks on the same input and return ONE JSON "
+          "object with the keys: canonical_organizations, events, "
+          "deduplication_log, unprocessed_roles. The events MUST "
+          "reference the canonical organizations you produce."
+    )
+
+    input_data = {
+        "entities": compress_entities({
+            "time_markers": entities.get("time_markers", []),
+            "organizations": entities.get("organizations", []),
+            "roles": entities.get("roles", []),
+            "locations": entities.get("locations", [])
+        })
+    }
+
+    user_prompt = f"""Identify canonical organizations from these entities, then assemble career events that reference them.
+
+PERSON: {person_name or "Unknown"}
+
+INPUT DATA:
+{dumps_compact(input_data)}
+
+Create ONE event for EVERY role. Return ONLY valid JSON with keys
+canonical_organizations, events, deduplication_log, unprocessed_roles."""
+
+    try:
+        result = llm_client.generate_json(
+            prompt=user_prompt,
+            system_prompt=system_prompt
+        )
+    except Exception as e:
+        return {**empty, "error": str(e)}
+
+    validated_orgs = []
+    for org in result.get("canonical_organizations", []):
+        validated_org = {
+            "canonical_id": org.get("canonical_id", f"ORG_{len(validated_orgs)+1:03d}"),
+            "canonical_name": org.get("canonical_name", ""),
+            "org_type": org.get("org_type", "other"),
+            "entity_indices": org.get("entity_indices", []),
+            "variations_found": org.get("variations_found", []),
+            "reasoning": org.get("reasoning", "")
+        }
+        if validated_org["canonical_name"]:
+            validated_orgs.append(validated_org)
+
+    validated_events = []
+    for event in result.get("events", []):
+        validated_events.append({
+            "event_id": event.get("event_id", f"E{len(validated_events)+1:03d}"),
+            "event_type": event.get("event_type", "career_position"),
+            "canonical_org_id": event.get("canonical_org_id"),
+            "canonical_org_name": event.get("canonical_org_name", ""),
+            "time_period": event.get("time_period", {}),
+            "roles": event.get("roles", []),
+            "locations": event.get("locations", []),
+            "supporting_quotes": event.get("supporting_quotes", []),
+            "source_entity_ids": event.get("source_entity_ids", {}),
+            "confidence": event.get("confidence", "medium"),
+            "merged_from": event.get("merged_from", []),
+            "notes": event.get("notes", "")
+        })
+
+    return {
+        "canonical_organizations": validated_orgs,
+        "events": validated_events,
+        "deduplication_log": result.get("deduplication_log", []),
+        "unprocessed_roles": result.get("unprocessed_roles", [])
+    }
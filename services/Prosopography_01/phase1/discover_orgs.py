@@ -5,10 +5,41 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
-import json
+import re
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, dumps_compact
+
+_PUNCT = re.compile(r'[^\w\s]')
+
+
+def _normalize(name: str) -> str:
+    """Normalize an org name for exact-duplicate grouping."""
+    words = _PUNCT.sub(' ', name.lower()).split()
+    return ' '.join(w for w in words if w != 'the')
+
+
+def _cluster_exact(organizations: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Group organization entities whose names normalize identically.
+
+    Trivial variants (case, punctuation, a leading "the") are folded
+    locally so the LLM only sees one representative per cluster; each
+    cluster keeps the original entity indices and the union of quotes.
+    """
+    clusters: Dict[str, Dict[str, Any]] = {}
+    ordered: List[Dict[str, Any]] = []
+    for idx, org in enumerate(organizations):
+        key = _normalize(org.get("name", ""))
+        cluster = clusters.get(key)
+        if cluster is None:
+            cluster = {"name": org.get("name", ""), "indices": [], "quotes": []}
+            clusters[key] = cluster
+            ordered.append(cluster)
+        cluster["indices"].append(idx)
+        for quote in org.get("quotes", []):
+            if quote not in cluster["quotes"]:
+                cluster["quotes"].append(quote)
+    return ordered
 
 
 def discover_canonical_orgs(
@@ -39,13 +70,28 @@ def discover_canonical_orgs(
 
     system_prompt = load_prompt("phase1_canonical_orgs", config)
 
-    # Format organizations for the prompt
+    # Pool quotes globally: the same sentence often mentions several
+    # entities, so each distinct quote is sent once and referenced by ID
+    quote_pool: Dict[str, int] = {}
+
+    def quote_ids(quotes: List[str]) -> List[int]:
+        # Limit quotes per entity to avoid token overflow
+        return [
+            quote_pool.setdefault(str(quote), len(quote_pool))
+            for quote in quotes[:2]
+        ]
+
+    # Fold obvious duplicates locally so the LLM arbitrates clusters,
+    # not trivial case/punctuation variants
+    clusters = _cluster_exact(organizations or [])
+
+    # Format organizations (one representative per cluster) for the prompt
     org_list = []
-    for idx, org in enumerate(organizations or []):
+    for cluster_idx, cluster in enumerate(clusters):
         org_entry = {
-            "index": idx,
-            "name": org.get("name", ""),
-            "quotes": org.get("quotes", [])[:2]  # Limit quotes to avoid token overflow
+            "index": cluster_idx,
+            "name": cluster["name"],
+            "quote_ids": quote_ids(cluster["quotes"])
         }
         org_list.append(org_entry)
 
@@ -55,20 +101,25 @@ def discover_canonical_orgs(
         role_entry = {
             "index": idx,
             "title": role.get("title", ""),
-            "quotes": role.get("quotes", [])[:2]
+            "quote_ids": quote_ids(role.get("quotes", []))
         }
         role_list.append(role_entry)
 
+    quotes_by_id = {str(qid): quote for quote, qid in quote_pool.items()}
+
     # Build user prompt with both organizations and roles
     user_prompt = f"""Analyze these entities and identify canonical organizations.
 
 PERSON: {person_name or "Unknown"}
 
 ORGANIZATIONS EXPLICITLY MENTIONED:
-{json.dumps(org_list, indent=2)}
+{dumps_compact(org_list)}
 
 ROLES/POSITIONS (use to INFER employer organizations):
-{json.dumps(role_list, indent=2)}
+{dumps_compact(role_list)}
+
+QUOTES (each entity's quote_ids refer to this table):
+{dumps_compact(quotes_by_id)}
 
 CRITICAL: For diplomatic/government roles, you MUST infer the employing organization:
 - "Diplomat", "Ambassador", "Embassy" roles → Ministry of Foreign Affairs - [Country]
@@ -85,14 +136,21 @@ Return ONLY valid JSON with the canonical organizations mapping."""
 
         canonical_orgs = result.get("canonical_organizations", [])
 
-        # Validate and clean up the result
+        # Validate and clean up the result; entity_indices come back as
+        # cluster positions and expand to the original entity indices
         validated_orgs = []
         for org in canonical_orgs:
+            entity_indices = [
+                orig_idx
+                for cluster_idx in org.get("entity_indices", [])
+                if isinstance(cluster_idx, int) and 0 <= cluster_idx < len(clusters)
+                for orig_idx in clusters[cluster_idx]["indices"]
+            ]
             validated_org = {
                 "canonical_id": org.get("canonical_id", f"ORG_{len(validated_orgs)+1:03d}"),
                 "canonical_name": org.get("canonical_name", ""),
                 "org_type": org.get("org_type", "other"),
-                "entity_indices": org.get("entity_indices", []),
+                "entity_indices": entity_indices,
                 "variations_found": org.get("variations_found", []),
                 "reasoning": org.get("reasoning", "")
             }
@@ -0,0 +1,126 @@
+"""Steps 1+2 overlapped: start org discovery while extraction finishes."""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
+
+from llm_client import LLMClient
+from utils import load_config
+from phase1.extract_entities import _extract_entities_async, _merge_chunk_results
+from phase1.discover_orgs import discover_canonical_orgs
+
+
+def extract_and_discover(
+    chunks: List[str],
+    llm_client: LLMClient,
+    config: Optional[Dict[str, Any]] = None,
+    person_name: str = ""
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Run Step 1 with Step 2 started speculatively on partial results.
+
+    discover_canonical_orgs only consumes the organization and role
+    entities, and most of those arrive from the first half of the
+    chunks. Once half the chunks are extracted, Step 2 starts in a
+    worker thread on the partial entity set while the remaining chunks
+    finish; if the late chunks add no organizations or roles, the
+    speculative result is kept and Step 2's latency hides behind
+    Step 1. Otherwise Step 2 re-runs on the full set, costing one extra
+    LLM call but never a wrong answer.
+
+    Returns (step1_result, step2_result) shaped exactly like
+    extract_entities_parallel and discover_canonical_orgs.
+    """
+    if config is None:
+        config = load_config()
+    phase1_config = config.get("phase1", {})
+    return asyncio.run(_extract_and_discover(
+        chunks,
+        llm_client,
+        config,
+        phase1_config.get("max_workers", 4),
+        phase1_config.get("max_retries", 3),
+        person_name
+    ))
+
+
+async def _extract_and_discover(
+    chunks: List[str],
+    llm_client: LLMClient,
+    config: Dict[str, Any],
+    concurrency: int,
+    max_retries: int,
+    person_name: str
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    completed: List[Dict[str, Any]] = []
+    threshold = max(1, (len(chunks) + 1) // 2)
+    spec_task = None
+    spec_entities = None
+
+    def discover(entities: Dict[str, List]) -> Dict[str, Any]:
+        return discover_canonical_orgs(
+            entities["organizations"],
+            llm_client,
+            config,
+            roles=entities.get("roles", []),
+            person_name=person_name
+        )
+
+    async def on_result(result: Dict[str, Any]) -> None:
+        nonlocal spec_task, spec_entities
+        completed.append(result)
+        if spec_task is None and len(completed) >= threshold:
+            spec_entities = _merge_partial(completed)
+            print(
+                f"Step 2 (speculative): Discovering organizations from "
+                f"{len(completed)}/{len(chunks)} chunks..."
+            )
+            # discover_canonical_orgs is a blocking LLM call; a worker
+            # thread keeps the remaining extraction requests in flight
+            spec_task = asyncio.create_task(
+                asyncio.to_thread(discover, spec_entities)
+            )
+
+    chunk_results = await _extract_entities_async(
+        chunks, llm_client, config, concurrency, max_retries,
+        on_result=on_result
+    )
+    step1_result = _merge_chunk_results(chunks, chunk_results)
+    entities = step1_result["entities"]
+
+    if spec_task is None:
+        print("Step 2: Discovering canonical organizations...")
+        return step1_result, await asyncio.to_thread(discover, entities)
+
+    step2_result = await spec_task
+    # The full entity lists extend the partial ones in chunk order, so
+    # equal lengths mean the late chunks contributed nothing Step 2
+    # consumes and the speculative entity indices are still correct
+    if (len(entities["organizations"]) == len(spec_entities["organizations"])
+            and len(entities["roles"]) == len(spec_entities["roles"])):
+        print("Step 2: Speculative discovery covered all organizations")
+        return step1_result, step2_result
+
+    print("Step 2: Late chunks added organizations or roles; re-running discovery...")
+    return step1_result, await asyncio.to_thread(discover, entities)
+
+
+def _merge_partial(completed: List[Dict[str, Any]]) -> Dict[str, List]:
+    """Merge completed chunk results into one entity dict, in chunk order.
+
+    Completion order is arbitrary under concurrency; sorting by chunk
+    index keeps entity indices consistent with the final merged list.
+    """
+    merged = {
+        "time_markers": [],
+        "organizations": [],
+        "roles": [],
+        "locations": []
+    }
+    for result in sorted(completed, key=lambda r: r["chunk_index"]):
+        entities = result.get("entities", {})
+        for key in merged:
+            merged[key].extend(entities.get(key, []))
+    return merged
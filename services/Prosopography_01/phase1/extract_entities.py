@@ -5,17 +5,17 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import time
+import asyncio
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, parse_json_response
 
 
 def extract_entities_from_chunk(
     chunk_text: str,
     llm_client: LLMClient,
-    config: Optional[Dict[str, Any]] = None
+    config: Optional[Dict[str, Any]] = None,
+    system_prompt: Optional[str] = None
 ) -> Dict[str, Any]:
     """Extract entities from a single text chunk.
 
@@ -23,34 +23,23 @@ def extract_entities_from_chunk(
         chunk_text: The text to extract entities from
         llm_client: LLM client instance
         config: Optional configuration
+        system_prompt: Pre-resolved system prompt, so per-chunk callers
+            skip the config/prompt lookup
 
     Returns:
         Dictionary with time_markers, organizations, roles, locations
     """
-    if config is None:
-        config = load_config()
-
-    system_prompt = load_prompt("phase1_extract_entities", config)
-
-    user_prompt = f"""Extract all career-related entities from this biographical text:
-
-{chunk_text}
-
-Return ONLY valid JSON with the extracted entities."""
+    if system_prompt is None:
+        if config is None:
+            config = load_config()
+        system_prompt = load_prompt("phase1_extract_entities", config)
 
     try:
         result = llm_client.generate_json(
-            prompt=user_prompt,
+            prompt=_build_user_prompt(chunk_text),
             system_prompt=system_prompt
         )
-
-        # Ensure all required keys exist
-        return {
-            "time_markers": result.get("time_markers", []),
-            "organizations": result.get("organizations", []),
-            "roles": result.get("roles", []),
-            "locations": result.get("locations", [])
-        }
+        return _normalize_entities(result)
     except Exception as e:
         # Return empty result on error
         return {
@@ -62,12 +51,32 @@ Return ONLY valid JSON with the extracted entities."""
         }
 
 
+def _build_user_prompt(chunk_text: str) -> str:
+    """Build the extraction user prompt for one chunk."""
+    return f"""Extract all career-related entities from this biographical text:
+
+{chunk_text}
+
+Return ONLY valid JSON with the extracted entities."""
+
+
+def _normalize_entities(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Ensure all required entity keys exist in an LLM result."""
+    return {
+        "time_markers": result.get("time_markers", []),
+        "organizations": result.get("organizations", []),
+        "roles": result.get("roles", []),
+        "locations": result.get("locations", [])
+    }
+
+
 def extract_entities_parallel(
     chunks: List[str],
     llm_client: LLMClient,
     config: Optional[Dict[str, Any]] = None,
     max_workers: int = 4,
-    max_retries: int = 3
+    max_retries: int = 3,
+    small_llm_client: Optional[LLMClient] = None
 ) -> Dict[str, Any]:
     """Extract entities from multiple chunks in parallel.
 
@@ -77,6 +86,9 @@ def extract_entities_parallel(
         config: Optional configuration
         max_workers: Number of parallel workers
         max_retries: Maximum retries per chunk
+        small_llm_client: Optional cheaper client; chunks shorter than
+            config's small_model_threshold are routed to it, since
+            extraction on short text doesn't need the large model
 
     Returns:
         Dictionary with merged entities and chunk results
@@ -88,72 +100,170 @@ def extract_entities_parallel(
     max_workers = phase1_config.get("max_workers", max_workers)
     max_retries = phase1_config.get("max_retries", max_retries)
 
-    chunk_results = []
+    def route(chunk_text: str) -> LLMClient:
+        if (small_llm_client is not None
+                and len(chunk_text) < config.get("small_model_threshold", 2000)):
+            return small_llm_client
+        return llm_client
+
+    if phase1_config.get("use_batch_llm", False):
+        # Batched mode: several chunks per LLM request, one round trip
+        # per group and the system prompt sent once per group
+        batch_size = phase1_config.get("llm_batch_size", 8)
+        chunk_results = _extract_entities_batched(
+            chunks, llm_client, config, batch_size, route
+        )
+    else:
+        # Concurrent mode: overlap the network-bound LLM calls with
+        # asyncio instead of tying up a kernel thread per request
+        chunk_results = asyncio.run(_extract_entities_async(
+            chunks, llm_client, config, max_workers, max_retries,
+            route=route
+        ))
+
+    return _merge_chunk_results(chunks, chunk_results)
+
+
+def _merge_chunk_results(
+    chunks: List[str],
+    chunk_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Merge per-chunk entity results into the pipeline result shape.
+
+    chunk_results is already ordered by chunk index (both extraction
+    modes guarantee it), so the merged entity lists are deterministic
+    across runs.
+    """
     merged_entities = {
         "time_markers": [],
         "organizations": [],
         "roles": [],
         "locations": []
     }
+    for result in chunk_results:
+        entities = result.get("entities", {})
+        for key in merged_entities:
+            merged_entities[key].extend(entities.get(key, []))
 
-    def process_chunk(chunk_idx: int, chunk_text: str) -> Dict[str, Any]:
-        """Process a single chunk with retries."""
-        last_error = None
-        for attempt in range(max_retries):
-            try:
-                result = extract_entities_from_chunk(chunk_text, llm_client, config)
-                if "error" not in result:
+    successful = sum(1 for r in chunk_results if r["success"])
+    return {
+        "entities": merged_entities,
+        "chunk_results": chunk_results,
+        "total_chunks": len(chunks),
+        "successful_chunks": successful,
+        "success_rate": successful / len(chunks) if chunks else 0
+    }
+
+
+async def _extract_entities_async(
+    chunks: List[str],
+    llm_client: LLMClient,
+    config: Dict[str, Any],
+    concurrency: int,
+    max_retries: int,
+    on_result=None,
+    route=None
+) -> List[Dict[str, Any]]:
+    """Extract entities for all chunks concurrently via the async client.
+
+    Up to `concurrency` requests are in flight at once; retries back off
+    with asyncio.sleep so waiting chunks never block one another.
+    Results come back ordered by chunk index. When on_result is given it
+    is awaited with each chunk result as it completes (in completion
+    order), letting callers start downstream work before the slowest
+    chunk returns. route, when given, picks the client for each chunk
+    (model routing by chunk length).
+    """
+    system_prompt = load_prompt("phase1_extract_entities", config)
+    semaphore = asyncio.Semaphore(concurrency)
+    if route is None:
+        route = lambda chunk_text: llm_client
+
+    async def process_chunk(chunk_idx: int, chunk_text: str) -> Dict[str, Any]:
+        async with semaphore:
+            client = route(chunk_text)
+            last_error = None
+            for attempt in range(max_retries):
+                try:
+                    text = await client.generate_async(
+                        prompt=_build_user_prompt(chunk_text),
+                        system_prompt=system_prompt
+                    )
                     return {
                         "chunk_index": chunk_idx,
                         "success": True,
-                        "entities": result
+                        "entities": _normalize_entities(parse_json_response(text))
                     }
-                last_error = result.get("error")
-            except Exception as e:
-                last_error = str(e)
-
-            if attempt < max_retries - 1:
-                time.sleep(2 ** attempt)  # Exponential backoff
+                except Exception as e:
+                    last_error = str(e)
+                    if attempt < max_retries - 1:
+                        await asyncio.sleep(llm_client._retry_delay(e, attempt))
 
-        return {
-            "chunk_index": chunk_idx,
-            "success": False,
-            "error": last_error,
-            "entities": {
-                "time_markers": [],
-                "organizations": [],
-                "roles": [],
-                "locations": []
+            return {
+                "chunk_index": chunk_idx,
+                "success": False,
+                "error": last_error,
+                "entities": {
+                    "time_markers": [],
+                    "organizations": [],
+                    "roles": [],
+                    "locations": []
+                }
             }
-        }
 
-    # Process chunks in parallel
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_idx = {
-            executor.submit(process_chunk, idx, chunk): idx
-            for idx, chunk in enumerate(chunks)
-        }
-
-        for future in as_completed(future_to_idx):
-            result = future.result()
-            chunk_results.append(result)
+    async def tracked(chunk_idx: int, chunk_text: str) -> Dict[str, Any]:
+        result = await process_chunk(chunk_idx, chunk_text)
+        if on_result is not None:
+            await on_result(result)
+        return result
 
-            # Merge entities
-            entities = result.get("entities", {})
-            for key in merged_entities:
-                merged_entities[key].extend(entities.get(key, []))
+    return list(await asyncio.gather(
+        *(tracked(idx, chunk) for idx, chunk in enumerate(chunks))
+    ))
 
-    # Sort by chunk index
-    chunk_results.sort(key=lambda x: x["chunk_index"])
 
-    # Calculate success rate
-    successful = sum(1 for r in chunk_results if r["success"])
-    success_rate = successful / len(chunks) if chunks else 0
+def _extract_entities_batched(
+    chunks: List[str],
+    llm_client: LLMClient,
+    config: Dict[str, Any],
+    batch_size: int,
+    route=None
+) -> List[Dict[str, Any]]:
+    """Extract entities for all chunks in multi-chunk LLM requests.
 
-    return {
-        "entities": merged_entities,
-        "chunk_results": chunk_results,
-        "total_chunks": len(chunks),
-        "successful_chunks": successful,
-        "success_rate": success_rate
-    }
+    Groups chunks into generate_json_batch calls so each group shares
+    one request (the batch helper itself falls back to per-prompt calls
+    when the model returns a malformed array). A group goes to the
+    routed client only when every chunk in it qualifies.
+    """
+    system_prompt = load_prompt("phase1_extract_entities", config)
+    if route is None:
+        route = lambda chunk_text: llm_client
+    chunk_results = []
+    for start in range(0, len(chunks), batch_size):
+        group = chunks[start:start + batch_size]
+        prompts = [_build_user_prompt(chunk) for chunk in group]
+        clients = {id(route(chunk)): route(chunk) for chunk in group}
+        client = next(iter(clients.values())) if len(clients) == 1 else llm_client
+        try:
+            results = client.generate_json_batch(
+                prompts, system_prompt=system_prompt
+            )
+        except Exception as e:
+            error = str(e)
+            results = [{"error": error} for _ in group]
+        for offset, result in enumerate(results):
+            error = result.get("error") if isinstance(result, dict) else None
+            entities = _normalize_entities(result) if not error else {
+                "time_markers": [], "organizations": [],
+                "roles": [], "locations": []
+            }
+            entry = {
+                "chunk_index": start + offset,
+                "success": error is None,
+                "entities": entities
+            }
+            if error is not None:
+                entry["error"] = error
+            chunk_results.append(entry)
+    return chunk_results
@@ -5,6 +5,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
+import hashlib
 import json
 
 from db import (
@@ -14,12 +15,14 @@ from db import (
 )
 from llm_client import LLMClient
 from utils import (
-    load_config, get_review_dir, save_json_checkpoint,
+    load_config, get_review_dir, save_json_checkpoint, load_json_checkpoint,
     chunk_text, extract_source_type, normalize_time_period
 )
 from phase1.extract_entities import extract_entities_parallel
+from phase1.extract_and_discover import extract_and_discover
 from phase1.discover_orgs import discover_canonical_orgs, build_org_mapping
 from phase1.assemble_events import assemble_events
+from phase1.discover_and_assemble import discover_and_assemble
 from phase1.verify_events import verify_events
 
 
@@ -30,6 +33,13 @@ class Phase1Pipeline:
         """Initialize the pipeline."""
         self.config = config or load_config()
         self.llm_client = LLMClient(self.config)
+        # Entity extraction on short chunks doesn't need the large
+        # model; configure model_small to route those to a cheaper one.
+        # Steps 2-4 always use the main client - they do the reasoning.
+        model_small = self.config.get("model_small")
+        self.small_llm_client = (
+            LLMClient(self.config, model=model_small) if model_small else None
+        )
         self.person_repo = PersonRepository()
         self.event_repo = EventRepository()
         self.evidence_repo = EvidenceRepository()
@@ -42,7 +52,8 @@ class Phase1Pipeline:
         wikipedia_text: str,
         source_url: str,
         chunk_ids: Optional[List[int]] = None,
-        save_checkpoints: bool = True
+        save_checkpoints: bool = True,
+        resume_from_checkpoint: bool = True
     ) -> Dict[str, Any]:
         """Run the full Phase 1 pipeline.
 
@@ -52,10 +63,16 @@ class Phase1Pipeline:
             source_url: URL of the Wikipedia article
             chunk_ids: Optional list of chunk IDs from sources.chunks
             save_checkpoints: Whether to save JSON checkpoints
+            resume_from_checkpoint: Reuse step checkpoints from a prior
+                partial run on the same input, skipping their LLM calls
 
         Returns:
             Dictionary with pipeline results
         """
+        input_hash = hashlib.blake2b(
+            wikipedia_text.encode(), digest_size=16
+        ).hexdigest()
+
         # Create or get person
         person = self.person_repo.get_by_name(person_name)
         if person is None:
@@ -67,6 +84,16 @@ class Phase1Pipeline:
         person_id = person.person_id
         review_dir = get_review_dir(person_name)
 
+        # Skip the whole pipeline when this exact text was already
+        # processed to completion - re-runs while iterating on later
+        # phases would otherwise pay the full Phase 1 LLM cost again
+        if (person.phase1_input_hash == input_hash
+                and person.workflow_status == "phase1_complete"):
+            cached = self._load_cached_results(person_id, person_name, source_url, review_dir)
+            if cached is not None:
+                print(f"Phase 1 unchanged for {person_name}; using cached results")
+                return cached
+
         results = {
             "person_id": person_id,
             "person_name": person_name,
@@ -74,10 +101,52 @@ class Phase1Pipeline:
             "steps": {}
         }
 
+        # Checkpoints from an earlier partial run are only trustworthy
+        # if they were produced from this exact source text - a failure
+        # in Step 3 or 4 would otherwise force re-paying for Step 1
+        resume = resume_from_checkpoint and self._checkpoints_match(
+            review_dir, input_hash
+        )
+
+        phase1_config = self.config.get("phase1", {})
+
         # Step 1: Extract entities
-        print(f"Step 1: Extracting entities from {person_name}...")
-        chunks = chunk_text(wikipedia_text)
-        step1_result = extract_entities_parallel(chunks, self.llm_client, self.config)
+        step1_result = None
+        step2_result = None  # may be produced overlapped with Step 1
+        if resume:
+            step1_result = load_json_checkpoint(review_dir / "phase1_entities.json")
+        if step1_result is not None:
+            print(f"Step 1: Reusing extracted entities checkpoint for {person_name}")
+        else:
+            # Downstream checkpoints were derived from a Step 1 result we
+            # no longer have, so they can't be trusted either
+            resume = False
+            print(f"Step 1: Extracting entities from {person_name}...")
+            chunks = chunk_text(wikipedia_text)
+            if (phase1_config.get("overlap_discovery", False)
+                    and not phase1_config.get("fuse_org_events", False)
+                    and not phase1_config.get("use_batch_llm", False)):
+                # Start Step 2 speculatively once half the chunks are
+                # extracted, hiding its latency behind the rest of Step 1
+                step1_result, step2_result = extract_and_discover(
+                    chunks, self.llm_client, self.config,
+                    person_name=person_name
+                )
+            else:
+                step1_result = extract_entities_parallel(
+                    chunks, self.llm_client, self.config,
+                    small_llm_client=self.small_llm_client
+                )
+
+            if save_checkpoints:
+                save_json_checkpoint(step1_result, review_dir / "phase1_entities.json")
+                # Save full source text for evidence context display
+                source_checkpoint = {
+                    "source_url": source_url,
+                    "full_text": wikipedia_text,
+                    "chunks": chunks
+                }
+                save_json_checkpoint(source_checkpoint, review_dir / "phase1_source.json")
 
         results["steps"]["step1"] = {
             "total_chunks": step1_result["total_chunks"],
@@ -88,25 +157,56 @@ class Phase1Pipeline:
             }
         }
 
-        if save_checkpoints:
-            save_json_checkpoint(step1_result, review_dir / "phase1_entities.json")
-            # Save full source text for evidence context display
-            source_checkpoint = {
-                "source_url": source_url,
-                "full_text": wikipedia_text,
-                "chunks": chunks
+        # Steps 2+3: reuse both checkpoints together or redo both, since
+        # the events reference the canonical orgs they were built against
+        step3_result = None
+        if resume:
+            step2_result = load_json_checkpoint(review_dir / "phase1_canonical_orgs.json")
+            step3_result = load_json_checkpoint(review_dir / "phase1_events.json")
+        if step2_result is not None and step3_result is not None:
+            print("Steps 2+3: Reusing organization and event checkpoints")
+        elif self.config.get("phase1", {}).get("fuse_org_events", False):
+            resume = False
+            # Steps 2+3 fused: one LLM call returns both the canonical
+            # orgs and the assembled events, saving a round trip and a
+            # second serialization of the entity payload
+            print("Steps 2+3: Discovering organizations and assembling events...")
+            fused_result = discover_and_assemble(
+                step1_result["entities"],
+                self.llm_client,
+                self.config,
+                person_name=person_name
+            )
+            step2_result = {
+                "canonical_organizations": fused_result["canonical_organizations"]
             }
-            save_json_checkpoint(source_checkpoint, review_dir / "phase1_source.json")
-
-        # Step 2: Discover canonical organizations
-        print("Step 2: Discovering canonical organizations...")
-        step2_result = discover_canonical_orgs(
-            step1_result["entities"]["organizations"],
-            self.llm_client,
-            self.config,
-            roles=step1_result["entities"].get("roles", []),
-            person_name=person_name
-        )
+            step3_result = {
+                "events": fused_result["events"],
+                "deduplication_log": fused_result["deduplication_log"],
+                "unprocessed_roles": fused_result["unprocessed_roles"]
+            }
+        else:
+            resume = False
+            # Step 2: Discover canonical organizations, unless a
+            # checkpoint or the overlapped Step 1 already produced them
+            if step2_result is None:
+                print("Step 2: Discovering canonical organizations...")
+                step2_result = discover_canonical_orgs(
+                    step1_result["entities"]["organizations"],
+                    self.llm_client,
+                    self.config,
+                    roles=step1_result["entities"].get("roles", []),
+                    person_name=person_name
+                )
+
+            # Step 3: Assemble events
+            print("Step 3: Assembling career events...")
+            step3_result = assemble_events(
+                step1_result["entities"],
+                step2_result["canonical_organizations"],
+                self.llm_client,
+                self.config
+            )
 
         results["steps"]["step2"] = {
             "canonical_orgs_count": len(step2_result["canonical_organizations"])
@@ -115,15 +215,6 @@ class Phase1Pipeline:
         if save_checkpoints:
             save_json_checkpoint(step2_result, review_dir / "phase1_canonical_orgs.json")
 
-        # Step 3: Assemble events
-        print("Step 3: Assembling career events...")
-        step3_result = assemble_events(
-            step1_result["entities"],
-            step2_result["canonical_organizations"],
-            self.llm_client,
-            self.config
-        )
-
         results["steps"]["step3"] = {
             "events_count": len(step3_result["events"]),
             "deduplication_actions": len(step3_result["deduplication_log"])
@@ -133,19 +224,25 @@ class Phase1Pipeline:
             save_json_checkpoint(step3_result, review_dir / "phase1_events.json")
 
         # Step 4: Verify events
-        print("Step 4: Verifying events...")
-        step4_result = verify_events(
-            step3_result["events"],
-            step1_result["entities"],
-            step3_result["deduplication_log"],
-            self.llm_client,
-            self.config
-        )
+        step4_result = None
+        if resume:
+            step4_result = load_json_checkpoint(review_dir / "phase1_verification.json")
+        if step4_result is not None:
+            print("Step 4: Reusing verification checkpoint")
+        else:
+            print("Step 4: Verifying events...")
+            step4_result = verify_events(
+                step3_result["events"],
+                step1_result["entities"],
+                step3_result["deduplication_log"],
+                self.llm_client,
+                self.config
+            )
 
-        results["steps"]["step4"] = step4_result["summary"]
+            if save_checkpoints:
+                save_json_checkpoint(step4_result, review_dir / "phase1_verification.json")
 
-        if save_checkpoints:
-            save_json_checkpoint(step4_result, review_dir / "phase1_verification.json")
+        results["steps"]["step4"] = step4_result["summary"]
 
         # Persist to database
         print("Persisting to database...")
@@ -158,14 +255,76 @@ class Phase1Pipeline:
             chunk_ids=chunk_ids or []
         )
 
-        # Update person status
+        # Update person status and record the input hash so an
+        # unchanged re-run can short-circuit
         self.person_repo.update_status(person_id, "phase1_complete")
+        self.person_repo.update_phase1_hash(person_id, input_hash)
 
         results["status"] = "complete"
         print(f"Phase 1 complete for {person_name}")
 
         return results
 
+    @staticmethod
+    def _checkpoints_match(review_dir: Path, input_hash: str) -> bool:
+        """True when saved checkpoints came from this exact source text.
+
+        phase1_source.json carries the full text the checkpoints were
+        derived from; hashing it guards against resuming with stale
+        checkpoints after the article changed.
+        """
+        source = load_json_checkpoint(review_dir / "phase1_source.json")
+        if not source:
+            return False
+        saved_hash = hashlib.blake2b(
+            source.get("full_text", "").encode(), digest_size=16
+        ).hexdigest()
+        return saved_hash == input_hash
+
+    @staticmethod
+    def _load_cached_results(
+        person_id: int,
+        person_name: str,
+        source_url: str,
+        review_dir: Path
+    ) -> Optional[Dict[str, Any]]:
+        """Rebuild a run() result dict from saved checkpoints.
+
+        Returns None when any checkpoint is missing, in which case the
+        caller falls through to a full re-run.
+        """
+        step1 = load_json_checkpoint(review_dir / "phase1_entities.json")
+        step2 = load_json_checkpoint(review_dir / "phase1_canonical_orgs.json")
+        step3 = load_json_checkpoint(review_dir / "phase1_events.json")
+        step4 = load_json_checkpoint(review_dir / "phase1_verification.json")
+        if not all((step1, step2, step3, step4)):
+            return None
+        return {
+            "person_id": person_id,
+            "person_name": person_name,
+            "source_url": source_url,
+            "steps": {
+                "step1": {
+                    "total_chunks": step1.get("total_chunks", 0),
+                    "successful_chunks": step1.get("successful_chunks", 0),
+                    "success_rate": step1.get("success_rate", 0),
+                    "entity_counts": {
+                        k: len(v) for k, v in step1.get("entities", {}).items()
+                    }
+                },
+                "step2": {
+                    "canonical_orgs_count": len(step2.get("canonical_organizations", []))
+                },
+                "step3": {
+                    "events_count": len(step3.get("events", [])),
+                    "deduplication_actions": len(step3.get("deduplication_log", []))
+                },
+                "step4": step4.get("summary", {})
+            },
+            "status": "complete",
+            "cached": True
+        }
+
     def _persist_to_db(
         self,
         person_id: int,
@@ -175,91 +334,101 @@ class Phase1Pipeline:
         source_url: str,
         chunk_ids: List[int]
     ) -> None:
-        """Persist Phase 1 results to database."""
-        source_type = extract_source_type(source_url)
-
-        # Build verification lookup
-        verification_map = {v["event_id"]: v for v in verification}
-
-        # Create canonical organizations
-        org_id_map = {}  # canonical_id -> db org_id
-        for org_data in canonical_orgs:
-            org = CanonicalOrganization(
-                person_id=person_id,
-                canonical_id=org_data["canonical_id"],
-                canonical_name=org_data["canonical_name"],
-                org_type=org_data.get("org_type", "other"),
-                metadata={
-                    "variations_found": org_data.get("variations_found", []),
-                    "reasoning": org_data.get("reasoning", "")
-                }
-            )
-            db_org_id = self.org_repo.create(org)
-            org_id_map[org_data["canonical_id"]] = db_org_id
-
-            # Add aliases
-            for variation in org_data.get("variations_found", []):
-                self.org_repo.add_alias(db_org_id, variation)
-
-        # Create events and evidence
-        for event_data in events:
-            # Get verification status
-            ver = verification_map.get(event_data["event_id"], {})
-            llm_status = ver.get("status", "valid")
-
-            # Extract time info
-            time_period = event_data.get("time_period", {})
-            time_start, time_end = normalize_time_period(time_period.get("text"))
-            if not time_start:
-                time_start = time_period.get("start")
-            if not time_end:
-                time_end = time_period.get("end")
-
-            # Get org_id
-            canonical_org_id = event_data.get("canonical_org_id")
-            db_org_id = org_id_map.get(canonical_org_id) if canonical_org_id else None
-
-            # Create event
-            event = CareerEvent(
-                person_id=person_id,
-                event_code=event_data["event_id"],
-                event_type=event_data.get("event_type", "career_position"),
-                org_id=db_org_id,
-                time_start=time_start,
-                time_end=time_end,
-                time_text=time_period.get("text"),
-                roles=event_data.get("roles", []),
-                locations=event_data.get("locations", []),
-                confidence=event_data.get("confidence", "medium"),
-                llm_status=llm_status,
-                validation_status="pending",
-                created_source="phase1_extraction"
-            )
-            db_event_id = self.event_repo.create(event)
-
-            # Create evidence for supporting quotes
-            for quote in event_data.get("supporting_quotes", []):
-                evidence = SourceEvidence(
-                    event_id=db_event_id,
-                    chunk_id=chunk_ids[0] if chunk_ids else None,
-                    source_url=source_url,
-                    source_type=source_type,
-                    verbatim_quote=quote,
-                    evidence_type="original",
-                    extraction_phase="phase1",
-                    model_used=self.config.get("model")
-                )
-                self.evidence_repo.create(evidence)
-
-            # Create issues from verification
-            for issue in ver.get("issues", []):
-                vi = VerificationIssue(
-                    event_id=db_event_id,
-                    issue_type=issue.get("type", "completeness"),
-                    severity=issue.get("severity", "warning"),
-                    description=issue.get("description", "")
+        """Persist Phase 1 results to database.
+
+        Builds the full object graph in Python first, then writes each
+        table with one bulk statement instead of a round trip per row.
+        The whole write runs inside one transaction shared by all
+        repositories, so a failure partway through leaves no partial
+        person graph behind and commit overhead is paid once.
+        """
+        with self.org_repo.transaction():
+            source_type = extract_source_type(source_url)
+
+            # Build verification lookup
+            verification_map = {v["event_id"]: v for v in verification}
+
+            # Create canonical organizations in one statement
+            orgs = [
+                CanonicalOrganization(
+                    person_id=person_id,
+                    canonical_id=org_data["canonical_id"],
+                    canonical_name=org_data["canonical_name"],
+                    org_type=org_data.get("org_type", "other"),
+                    metadata={
+                        "variations_found": org_data.get("variations_found", []),
+                        "reasoning": org_data.get("reasoning", "")
+                    }
                 )
-                self.issue_repo.create(vi)
+                for org_data in canonical_orgs
+            ]
+            org_ids = self.org_repo.create_many(orgs)
+            org_id_map = {  # canonical_id -> db org_id
+                org_data["canonical_id"]: db_org_id
+                for org_data, db_org_id in zip(canonical_orgs, org_ids)
+            }
+            self.org_repo.add_aliases([
+                (db_org_id, variation)
+                for org_data, db_org_id in zip(canonical_orgs, org_ids)
+                for variation in org_data.get("variations_found", [])
+            ])
+
+            # Create events in one statement
+            db_events = []
+            for event_data in events:
+                ver = verification_map.get(event_data["event_id"], {})
+
+                # Extract time info
+                time_period = event_data.get("time_period", {})
+                time_start, time_end = normalize_time_period(time_period.get("text"))
+                if not time_start:
+                    time_start = time_period.get("start")
+                if not time_end:
+                    time_end = time_period.get("end")
+
+                canonical_org_id = event_data.get("canonical_org_id")
+                db_events.append(CareerEvent(
+                    person_id=person_id,
+                    event_code=event_data["event_id"],
+                    event_type=event_data.get("event_type", "career_position"),
+                    org_id=org_id_map.get(canonical_org_id) if canonical_org_id else None,
+                    time_start=time_start,
+                    time_end=time_end,
+                    time_text=time_period.get("text"),
+                    roles=event_data.get("roles", []),
+                    locations=event_data.get("locations", []),
+                    confidence=event_data.get("confidence", "medium"),
+                    llm_status=ver.get("status", "valid"),
+                    validation_status="pending",
+                    created_source="phase1_extraction"
+                ))
+            event_ids = self.event_repo.create_many(db_events)
+
+            # Evidence and issues across all events, one statement per table
+            evidence_rows = []
+            issue_rows = []
+            for event_data, db_event_id in zip(events, event_ids):
+                for quote in event_data.get("supporting_quotes", []):
+                    evidence_rows.append(SourceEvidence(
+                        event_id=db_event_id,
+                        chunk_id=chunk_ids[0] if chunk_ids else None,
+                        source_url=source_url,
+                        source_type=source_type,
+                        verbatim_quote=quote,
+                        evidence_type="original",
+                        extraction_phase="phase1",
+                        model_used=self.config.get("model")
+                    ))
+                ver = verification_map.get(event_data["event_id"], {})
+                for issue in ver.get("issues", []):
+                    issue_rows.append(VerificationIssue(
+                        event_id=db_event_id,
+                        issue_type=issue.get("type", "completeness"),
+                        severity=issue.get("severity", "warning"),
+                        description=issue.get("description", "")
+                    ))
+            self.evidence_repo.create_many(evidence_rows)
+            self.issue_repo.create_many(issue_rows)
 
     def run_from_chunks(
         self,
@@ -4,11 +4,11 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from collections import Counter
 from typing import Dict, Any, List, Optional
-import json
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, parse_json_response, dumps_compact
 
 
 def verify_events(
@@ -20,6 +20,8 @@ def verify_events(
 ) -> Dict[str, Any]:
     """Verify assembled events for quality and coherence.
 
+    Thin wrapper over verify_events_batch with a single job.
+
     Args:
         events: List of assembled events
         entities: Original extracted entities
@@ -30,127 +32,270 @@ def verify_events(
     Returns:
         Dictionary with verified_events, summary, and deduplication_review
     """
+    return verify_events_batch(
+        [{
+            "events": events,
+            "entities": entities,
+            "deduplication_log": deduplication_log
+        }],
+        llm_client,
+        config
+    )[0]
+
+
+def verify_events_batch(
+    jobs: List[Dict[str, Any]],
+    llm_client: LLMClient,
+    config: Optional[Dict[str, Any]] = None,
+    concurrency: int = 8
+) -> List[Dict[str, Any]]:
+    """Verify many persons' event lists with bounded concurrency.
+
+    Bulk verification is I/O-bound on LLM latency, so running one
+    sequential round trip per person wastes most of the wall clock.
+    Each job is a dict with events, entities, and deduplication_log;
+    their LLM calls fan out through generate_many with up to
+    `concurrency` in flight. A job whose unverified events exceed
+    phase1.verify_window is additionally split into fixed-size windows,
+    one call each, keeping every prompt's token count bounded however
+    long the career - the window calls ride the same fan-out. Results
+    come back in job order, each shaped exactly like verify_events'
+    return value; a failed call degrades only its own window's events
+    to the warning-status fallback.
+    """
     if config is None:
         config = load_config()
+    window = config.get("phase1", {}).get("verify_window", 25)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(jobs)
+    job_ctx = {}  # job index -> pre-pass output and window responses
+    prepared = []  # (job_index, window_events), aligned with prompts
+    prompts = []
 
-    if not events:
-        return {
-            "verified_events": [],
-            "summary": {
-                "total_events": 0,
-                "valid": 0,
-                "warnings": 0,
-                "errors": 0,
-                "career_positions": 0,
-                "awards": 0
-            },
-            "deduplication_review": {
-                "total_merges": 0,
-                "questionable_merges": 0,
-                "missed_merge_candidates": []
+    for idx, job in enumerate(jobs):
+        events = job.get("events", [])
+        deduplication_log = job.get("deduplication_log", [])
+        if not events:
+            results[idx] = _empty_result()
+            continue
+
+        # Rule-based pre-pass: events with an explicit start date, a
+        # mapped canonical org, and supporting quotes are valid by
+        # construction - only the rest need LLM arbitration
+        auto_valid = [
+            _pass_through_verification(e) for e in events if _rule_verified(e)
+        ]
+        llm_events = [e for e in events if not _rule_verified(e)]
+
+        if not llm_events:
+            results[idx] = {
+                "verified_events": auto_valid,
+                "summary": calculate_summary(events, auto_valid),
+                "deduplication_review": _default_dedup_review(deduplication_log)
             }
+            continue
+
+        job_ctx[idx] = {
+            "events": events,
+            "llm_events": llm_events,
+            "auto_valid": auto_valid,
+            "deduplication_log": deduplication_log,
+            "windows": []
         }
+        for start in range(0, len(llm_events), window):
+            window_events = llm_events[start:start + window]
+            prepared.append((idx, window_events))
+            prompts.append(_build_user_prompt(
+                window_events, job.get("entities", {}), deduplication_log
+            ))
+
+    if prompts:
+        system_prompt = load_prompt("phase1_verify_events", config)
+        responses = llm_client.generate_many(
+            prompts,
+            system_prompt=system_prompt,
+            concurrency=concurrency,
+            return_exceptions=True
+        )
+        for (idx, window_events), response in zip(prepared, responses):
+            job_ctx[idx]["windows"].append((window_events, response))
+
+    for idx, ctx in job_ctx.items():
+        results[idx] = _combine_windows(ctx)
+
+    return results
 
-    system_prompt = load_prompt("phase1_verify_events", config)
 
-    # Prepare input data
+def _combine_windows(ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge one job's per-window responses into a verification result.
+
+    The summary is always recomputed locally from the merged list, so
+    windowing never changes the result shape a caller sees.
+    """
+    verified_events: List[Dict[str, Any]] = []
+    dedup_review: Dict[str, Any] = {}
+    errors: List[str] = []
+
+    for window_events, response in ctx["windows"]:
+        if isinstance(response, Exception):
+            errors.append(str(response))
+            verified_events.extend(_failure_records(window_events, response))
+            continue
+        try:
+            result = parse_json_response(response)
+        except Exception as e:
+            errors.append(str(e))
+            verified_events.extend(_failure_records(window_events, e))
+            continue
+        verified_events.extend(result.get("verified_events", []))
+        if not dedup_review:
+            dedup_review = result.get("deduplication_review", {})
+
+    combined = {
+        "verified_events": verified_events,
+        "summary": {},
+        "deduplication_review": dedup_review
+    }
+    out = _postprocess(
+        ctx["events"], ctx["llm_events"], ctx["auto_valid"],
+        ctx["deduplication_log"], combined
+    )
+    if errors:
+        out["error"] = "; ".join(errors)
+    return out
+
+
+def _build_user_prompt(
+    llm_events: List[Dict[str, Any]],
+    entities: Dict[str, List],
+    deduplication_log: List[Dict[str, Any]]
+) -> str:
+    """Build the verification user prompt for one person's events."""
     input_data = {
-        "events": events,
+        "events": llm_events,
         "entities": entities,
         "deduplication_log": deduplication_log
     }
-
-    user_prompt = f"""Verify these assembled career events:
+    return f"""Verify these assembled career events:
 
 INPUT DATA:
-{json.dumps(input_data, indent=2)}
+{dumps_compact(input_data)}
 
 Check each event for temporal coherence, quote support, classification accuracy, and completeness.
 Return ONLY valid JSON."""
 
-    try:
-        result = llm_client.generate_json(
-            prompt=user_prompt,
-            system_prompt=system_prompt
-        )
 
-        verified_events = result.get("verified_events", [])
-        summary = result.get("summary", {})
-        dedup_review = result.get("deduplication_review", {})
-
-        # Ensure all events have verification status
-        event_ids = {e["event_id"] for e in events}
-        verified_ids = {v["event_id"] for v in verified_events}
-
-        # Add missing verifications
-        for event in events:
-            if event["event_id"] not in verified_ids:
-                verified_events.append({
-                    "event_id": event["event_id"],
-                    "status": "warning",
-                    "issues": [{
-                        "type": "completeness",
-                        "severity": "low",
-                        "description": "Not explicitly verified by LLM"
-                    }]
-                })
-
-        # Recalculate summary if needed
-        if not summary:
-            summary = calculate_summary(events, verified_events)
-
-        if not dedup_review:
-            dedup_review = {
-                "total_merges": len([d for d in deduplication_log if d.get("action") == "merged"]),
-                "questionable_merges": 0,
-                "missed_merge_candidates": []
-            }
-
-        return {
-            "verified_events": verified_events,
-            "summary": summary,
-            "deduplication_review": dedup_review
-        }
+def _postprocess(
+    events: List[Dict[str, Any]],
+    llm_events: List[Dict[str, Any]],
+    auto_valid: List[Dict[str, Any]],
+    deduplication_log: List[Dict[str, Any]],
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Merge one LLM verification result with the rule-verified events."""
+    verified_events = result.get("verified_events", [])
+    summary = result.get("summary", {})
+    dedup_review = result.get("deduplication_review", {})
 
-    except Exception as e:
-        # Return basic verification on error
-        verified_events = []
-        for event in events:
+    # Ensure all LLM-checked events have verification status
+    verified_ids = {v["event_id"] for v in verified_events}
+    for event in llm_events:
+        if event["event_id"] not in verified_ids:
             verified_events.append({
                 "event_id": event["event_id"],
                 "status": "warning",
                 "issues": [{
                     "type": "completeness",
                     "severity": "low",
-                    "description": f"Verification failed: {str(e)}"
+                    "description": "Not explicitly verified by LLM"
                 }]
             })
 
-        return {
-            "verified_events": verified_events,
-            "summary": calculate_summary(events, verified_events),
-            "deduplication_review": {
-                "total_merges": len([d for d in deduplication_log if d.get("action") == "merged"]),
-                "questionable_merges": 0,
-                "missed_merge_candidates": []
-            },
-            "error": str(e)
+    # Fold the rule-verified events back in; the summary must cover
+    # the full event list, not just the LLM subset
+    verified_events.extend(auto_valid)
+    if not summary or auto_valid:
+        summary = calculate_summary(events, verified_events)
+
+    return {
+        "verified_events": verified_events,
+        "summary": summary,
+        "deduplication_review": dedup_review or _default_dedup_review(deduplication_log)
+    }
+
+
+def _failure_records(
+    events: List[Dict[str, Any]],
+    error: Exception
+) -> List[Dict[str, Any]]:
+    """Warning-status verification records for events whose LLM call
+    failed; rule-verified events are unaffected."""
+    return [
+        {
+            "event_id": event["event_id"],
+            "status": "warning",
+            "issues": [{
+                "type": "completeness",
+                "severity": "low",
+                "description": f"Verification failed: {str(error)}"
+            }]
         }
+        for event in events
+    ]
+
+
+def _empty_result() -> Dict[str, Any]:
+    """The verification result for a person with no events."""
+    return {
+        "verified_events": [],
+        "summary": {
+            "total_events": 0,
+            "valid": 0,
+            "warnings": 0,
+            "errors": 0,
+            "career_positions": 0,
+            "awards": 0
+        },
+        "deduplication_review": _default_dedup_review([])
+    }
+
+
+def _default_dedup_review(deduplication_log: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Deduplication review derived from the log when the LLM omits one."""
+    return {
+        "total_merges": len([d for d in deduplication_log if d.get("action") == "merged"]),
+        "questionable_merges": 0,
+        "missed_merge_candidates": []
+    }
+
+
+def _rule_verified(event: Dict[str, Any]) -> bool:
+    """True when an event carries deterministic high-confidence signals."""
+    return bool(
+        event.get("time_period", {}).get("start")
+        and event.get("canonical_org_id")
+        and event.get("supporting_quotes")
+    )
+
+
+def _pass_through_verification(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Synthesize a valid verification record for a rule-verified event."""
+    return {
+        "event_id": event["event_id"],
+        "status": "valid",
+        "issues": [],
+        "verified_by": "rule"
+    }
 
 
 def calculate_summary(events: List[Dict], verified_events: List[Dict]) -> Dict[str, int]:
-    """Calculate summary statistics from events and verification results."""
-    status_counts = {"valid": 0, "warning": 0, "error": 0}
-    for v in verified_events:
-        status = v.get("status", "warning")
-        if status in status_counts:
-            status_counts[status] += 1
-
-    type_counts = {"career_position": 0, "award": 0}
-    for e in events:
-        event_type = e.get("event_type", "career_position")
-        if event_type in type_counts:
-            type_counts[event_type] += 1
+    """Calculate summary statistics from events and verification results.
+
+    Counter does the tallying at C speed and returns 0 for absent keys,
+    so no membership guards; called once per person in batch runs.
+    """
+    status_counts = Counter(v.get("status", "warning") for v in verified_events)
+    type_counts = Counter(e.get("event_type", "career_position") for e in events)
 
     return {
         "total_events": len(events),
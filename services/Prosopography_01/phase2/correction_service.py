@@ -5,7 +5,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
-import json
 
 from db import (
     EventRepository, CorrectionRepository, IssueRepository,
@@ -13,6 +12,57 @@ from db import (
     CareerEvent, UserCorrection
 )
 
+# orjson is faster for the per-correction list (de)serialization;
+# fall back to stdlib json where missing
+try:
+    import orjson
+
+    def _dumps(data) -> str:
+        return orjson.dumps(data).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    def _dumps(data) -> str:
+        return json.dumps(data)
+
+    _loads = json.loads
+
+
+def _parse_list(value: str) -> list:
+    """Parse a corrected list value, accepting JSON or comma-separated."""
+    try:
+        return _loads(value)
+    except ValueError:
+        return [item.strip() for item in value.split(",")]
+
+
+# Module-level dispatch tables: resolving a field is one dict hit
+# instead of walking an if/elif chain per corrected field, and adding a
+# correctable field is one entry in each table.
+# Note: organization corrections require separate handling through org_repo
+_FIELD_GETTERS = {
+    "organization": lambda e: e.org_name or str(e.org_id),
+    "time_start": lambda e: e.time_start,
+    "time_end": lambda e: e.time_end,
+    "time_text": lambda e: e.time_text,
+    "roles": lambda e: _dumps(e.roles) if e.roles else "[]",
+    "locations": lambda e: _dumps(e.locations) if e.locations else "[]",
+    "event_type": lambda e: e.event_type,
+    "confidence": lambda e: e.confidence,
+}
+
+_FIELD_SETTERS = {
+    "time_start": lambda e, v: setattr(e, "time_start", v),
+    "time_end": lambda e, v: setattr(e, "time_end", v),
+    "time_text": lambda e, v: setattr(e, "time_text", v),
+    "roles": lambda e, v: setattr(e, "roles", _parse_list(v)),
+    "locations": lambda e, v: setattr(e, "locations", _parse_list(v)),
+    "event_type": lambda e, v: setattr(e, "event_type", v),
+    "confidence": lambda e, v: setattr(e, "confidence", v),
+}
+
 
 class CorrectionService:
     """Service for managing user corrections to career events."""
@@ -86,16 +136,33 @@ class CorrectionService:
         Returns:
             List of correction_ids
         """
-        correction_ids = []
+        # One event fetch, one bulk correction insert, and at most one
+        # event update - apply_correction per field would repeat all
+        # three round-trips for every corrected field
+        event = self.event_repo.get_by_id(event_id)
+        if not event:
+            raise ValueError(f"Event {event_id} not found")
+
+        records = []
+        event_changed = False
         for field_name, correction_info in corrections.items():
-            correction_id = self.apply_correction(
+            is_valid = correction_info.get("is_valid", True)
+            corrected_value = correction_info.get("corrected_value")
+            records.append(UserCorrection(
                 event_id=event_id,
                 field_name=field_name,
-                is_valid=correction_info.get("is_valid", True),
-                corrected_value=correction_info.get("corrected_value"),
-                notes=correction_info.get("notes")
-            )
-            correction_ids.append(correction_id)
+                original_value=self._get_field_value(event, field_name),
+                corrected_value=corrected_value if not is_valid else None,
+                is_valid=is_valid,
+                correction_notes=correction_info.get("notes")
+            ))
+            if not is_valid and corrected_value:
+                self._apply_field_correction(event, field_name, corrected_value)
+                event_changed = True
+
+        correction_ids = self.correction_repo.create_many(records)
+        if event_changed:
+            self.event_repo.update(event)
         return correction_ids
 
     def validate_event(self, event_id: int, notes: Optional[str] = None) -> None:
@@ -174,6 +241,45 @@ class CorrectionService:
             "workflow_status": "phase2_reviewed"
         }
 
+    async def finalize_review_async(self, person_id: int) -> Dict[str, Any]:
+        """Async finalize_review for servers already running an event loop.
+
+        The three reads (events, corrections, per-field counts) are
+        independent, so they run concurrently on separate pooled
+        connections via asyncio.gather - wall clock is the slowest
+        query, not the sum. Requires the optional asyncpg dependency;
+        imported lazily so the sync path never pays for it.
+        """
+        from db.async_repos import (
+            AsyncEventRepository, AsyncCorrectionRepository, AsyncPersonRepository
+        )
+        import asyncio
+
+        event_repo = AsyncEventRepository()
+        correction_repo = AsyncCorrectionRepository()
+
+        events, corrections, correction_counts = await asyncio.gather(
+            event_repo.get_for_person(person_id),
+            correction_repo.get_for_person(person_id),
+            correction_repo.count_by_field(person_id)
+        )
+
+        status_counts = {"pending": 0, "validated": 0, "rejected": 0, "needs_review": 0}
+        for event in events:
+            status = event.validation_status
+            if status in status_counts:
+                status_counts[status] += 1
+
+        await AsyncPersonRepository().update_status(person_id, "phase2_reviewed")
+
+        return {
+            "total_events": len(events),
+            "status_counts": status_counts,
+            "total_corrections": len(corrections),
+            "corrections_by_field": correction_counts,
+            "workflow_status": "phase2_reviewed"
+        }
+
     def get_correction_summary(self, person_id: int) -> Dict[str, Any]:
         """Get a summary of corrections for a person.
 
@@ -196,24 +302,8 @@ class CorrectionService:
 
     def _get_field_value(self, event: CareerEvent, field_name: str) -> Optional[str]:
         """Get the current value of a field from an event."""
-        if field_name == "organization":
-            return event.org_name or str(event.org_id)
-        elif field_name == "time_start":
-            return event.time_start
-        elif field_name == "time_end":
-            return event.time_end
-        elif field_name == "time_text":
-            return event.time_text
-        elif field_name == "roles":
-            return json.dumps(event.roles) if event.roles else "[]"
-        elif field_name == "locations":
-            return json.dumps(event.locations) if event.locations else "[]"
-        elif field_name == "event_type":
-            return event.event_type
-        elif field_name == "confidence":
-            return event.confidence
-        else:
-            return None
+        getter = _FIELD_GETTERS.get(field_name)
+        return getter(event) if getter else None
 
     def _apply_field_correction(
         self,
@@ -222,25 +312,6 @@ class CorrectionService:
         corrected_value: str
     ) -> None:
         """Apply a correction to a specific field on an event."""
-        if field_name == "time_start":
-            event.time_start = corrected_value
-        elif field_name == "time_end":
-            event.time_end = corrected_value
-        elif field_name == "time_text":
-            event.time_text = corrected_value
-        elif field_name == "roles":
-            try:
-                event.roles = json.loads(corrected_value)
-            except json.JSONDecodeError:
-                # Assume comma-separated if not valid JSON
-                event.roles = [r.strip() for r in corrected_value.split(",")]
-        elif field_name == "locations":
-            try:
-                event.locations = json.loads(corrected_value)
-            except json.JSONDecodeError:
-                event.locations = [l.strip() for l in corrected_value.split(",")]
-        elif field_name == "event_type":
-            event.event_type = corrected_value
-        elif field_name == "confidence":
-            event.confidence = corrected_value
-        # Note: organization corrections require separate handling through org_repo
+        setter = _FIELD_SETTERS.get(field_name)
+        if setter:
+            setter(event, corrected_value)
@@ -63,24 +63,7 @@ class EventEditor:
         # Find or create organization
         org_id = None
         if organization_name:
-            # Try to find existing org by name
-            orgs = self.org_repo.get_for_person(person_id)
-            for org in orgs:
-                if org.canonical_name.lower() == organization_name.lower():
-                    org_id = org.org_id
-                    break
-
-            # Create new org if not found
-            if org_id is None:
-                canonical_id = self.org_repo.get_next_canonical_id(person_id)
-                new_org = CanonicalOrganization(
-                    person_id=person_id,
-                    canonical_id=canonical_id,
-                    canonical_name=organization_name,
-                    org_type="other",
-                    metadata={"added_manually": True}
-                )
-                org_id = self.org_repo.create(new_org)
+            org_id = self._find_or_create_org(person_id, organization_name)
 
         # Create the event
         event = CareerEvent(
@@ -114,6 +97,98 @@ class EventEditor:
 
         return event_id
 
+    def _find_or_create_org(self, person_id: int, organization_name: str) -> int:
+        """Resolve an organization name to an org_id, creating if absent.
+
+        The lookup is one indexed case-insensitive query rather than a
+        Python scan over the person's full org list.
+        """
+        org = self.org_repo.get_by_canonical_name_ci(person_id, organization_name)
+        if org:
+            return org.org_id
+
+        canonical_id = self.org_repo.get_next_canonical_id(person_id)
+        new_org = CanonicalOrganization(
+            person_id=person_id,
+            canonical_id=canonical_id,
+            canonical_name=organization_name,
+            org_type="other",
+            metadata={"added_manually": True}
+        )
+        return self.org_repo.create(new_org)
+
+    def add_events_bulk(
+        self,
+        person_id: int,
+        events: List[Dict[str, Any]]
+    ) -> List[int]:
+        """Add many manual events for one person in a few statements.
+
+        Each dict takes the same keys as add_event's keyword arguments.
+        The person's organizations are prefetched into one name-to-id
+        dict so org resolution is O(1) per event, event codes are
+        assigned from a single starting number, and the events and their
+        evidence go in through create_many rather than one INSERT per
+        row.
+
+        Returns:
+            List of new event_ids in input order
+        """
+        if not events:
+            return []
+
+        org_lookup = {
+            org.canonical_name.lower(): org.org_id
+            for org in self.org_repo.get_for_person(person_id)
+        }
+        prefix = "E_MANUAL_"
+        next_num = int(self.event_repo.get_next_event_code(person_id, prefix)[len(prefix):])
+
+        records = []
+        for offset, spec in enumerate(events):
+            org_id = None
+            organization_name = spec.get("organization_name")
+            if organization_name:
+                org_id = org_lookup.get(organization_name.lower())
+                if org_id is None:
+                    org_id = self._find_or_create_org(person_id, organization_name)
+                    org_lookup[organization_name.lower()] = org_id
+
+            records.append(CareerEvent(
+                person_id=person_id,
+                event_code=f"{prefix}{next_num + offset:03d}",
+                event_type=spec.get("event_type", "career_position"),
+                org_id=org_id,
+                time_start=spec.get("time_start"),
+                time_end=spec.get("time_end"),
+                time_text=spec.get("time_text"),
+                roles=spec.get("roles", []),
+                locations=spec.get("locations") or [],
+                confidence="medium",
+                llm_status="valid",
+                validation_status="validated",
+                created_source="phase2_correction"
+            ))
+
+        event_ids = self.event_repo.create_many(records)
+
+        evidence_records = [
+            SourceEvidence(
+                event_id=event_id,
+                source_url=spec.get("source_url") or "manual_entry",
+                source_type="manual",
+                verbatim_quote=spec["supporting_quote"],
+                evidence_type="original",
+                extraction_phase="phase2_manual"
+            )
+            for event_id, spec in zip(event_ids, events)
+            if spec.get("supporting_quote")
+        ]
+        if evidence_records:
+            self.evidence_repo.create_many(evidence_records)
+
+        return event_ids
+
     def delete_event(self, event_id: int, reason: str) -> None:
         """Delete an event (marks as rejected rather than hard delete).
 
@@ -190,12 +265,13 @@ class EventEditor:
 
         self.event_repo.update(primary)
 
-        # Move evidence from secondary to primary
+        # Move evidence from secondary to primary in one insert
         secondary_evidence = self.evidence_repo.get_for_event(secondary_event_id)
         for evidence in secondary_evidence:
             evidence.event_id = primary_event_id
+        if secondary_evidence:
             # Re-create with new event_id (simpler than update)
-            self.evidence_repo.create(evidence)
+            self.evidence_repo.create_many(secondary_evidence)
 
         # Mark secondary as rejected
         self.event_repo.update_status(secondary_event_id, "rejected")
@@ -5,10 +5,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, Optional
-import json
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, dumps_compact
 
 
 def create_event(
@@ -36,7 +35,7 @@ def create_event(
     user_prompt = f"""Create a new career event record from this candidate.
 
 CANDIDATE:
-{json.dumps(candidate, indent=2)}
+{dumps_compact(candidate)}
 
 Use event number: {next_event_number} (format as E_NEW_{next_event_number:03d})
 
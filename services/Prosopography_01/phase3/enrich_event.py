@@ -5,10 +5,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, Optional
-import json
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, dumps_compact
 from db import CareerEvent
 
 
@@ -54,10 +53,10 @@ def enrich_event(
     user_prompt = f"""Enrich this existing event with new information.
 
 EXISTING EVENT:
-{json.dumps(existing_formatted, indent=2)}
+{dumps_compact(existing_formatted)}
 
 NEW DETAILS FROM SOURCE:
-{json.dumps(candidate, indent=2)}
+{dumps_compact(candidate)}
 
 Return the enriched event as JSON."""
 
@@ -5,10 +5,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from typing import Dict, Any, List, Optional
-import json
 
 from llm_client import LLMClient
-from utils import load_prompt, load_config
+from utils import load_prompt, load_config, dumps_compact
 from db import CareerEvent
 
 
@@ -63,10 +62,10 @@ def match_or_new(
     user_prompt = f"""Determine if this CANDIDATE event should be merged with an existing event or created as new.
 
 CANDIDATE:
-{json.dumps(candidate, indent=2)}
+{dumps_compact(candidate)}
 
 EXISTING EVENTS:
-{json.dumps(existing_formatted, indent=2)}
+{dumps_compact(existing_formatted)}
 
 Return your decision as JSON."""
 